@@ -0,0 +1,252 @@
+from typing import Any, Self
+
+import pygame
+
+from settings.display import *
+
+
+class DisplayHandler:
+    """
+        Keeps track of which regions of the window changed and need to be redrawn.
+        Every subsystem (map view, right panel, bottom panel, minimap and menus) owns a region.
+        Regions are marked dirty by input events and by changes in the Editor state,
+            only dirty regions are redrawn and passed to pygame.display.update().
+        When nothing changed and nothing is scrolling the Editor goes idle and blocks
+            on pygame.event.wait instead of drawing frames.
+
+        Args:
+            editor (Any): Current Editor instance.
+
+        Returns:
+            Self.
+    """
+
+    def __init__(self,
+                 editor: Any) -> Self:
+        self.editor = editor
+
+        self.DIRTY_RECTS = DIRTY_RECTS
+        self.IDLE_WAIT_MS = IDLE_WAIT_MS
+
+        self.regions: dict[str, pygame.Rect] = {
+            "map": pygame.Rect(MAP_VIEW_RECT),
+            "right_panel": pygame.Rect(RIGHT_PANEL_RECT),
+            "bottom_panel": pygame.Rect(BOTTOM_PANEL_RECT),
+            "minimap": pygame.Rect(MINIMAP_RECT),
+        }
+
+        # First frame draws everything
+        self.dirty: set[str] = set(self.regions)
+        self.pending: set[str] = set()
+
+        self.map_state: tuple = ()
+        self.ui_state: tuple = ()
+
+        # Event consumed while waiting in idle mode
+        self.idle_events: list[pygame.event.Event] = []
+        # Keys held down keep the Editor busy (scrolling, repeated undo)
+        self.held_keys: set[int] = set()
+
+    def mark_dirty(self,
+                   *names: str) -> None:
+        """
+            Marks the given regions to be redrawn this frame.
+
+            Args:
+                *names (str): Names of the regions.
+        """
+        self.dirty.update(names)
+
+    def mark_all_dirty(self) -> None:
+        """
+            Marks the whole window to be redrawn this frame.
+        """
+        self.dirty.update(self.regions)
+
+    def is_dirty(self,
+                 name: str) -> bool:
+        """
+            Checks if a region has to be redrawn this frame.
+
+            Args:
+                name (str): Name of the region.
+
+            Returns:
+                bool: True if the region is dirty, else False.
+        """
+        return not self.DIRTY_RECTS or name in self.dirty
+
+    def mark_position_dirty(self,
+                            pos: tuple[int, int],
+                            include_map: bool) -> None:
+        """
+            Marks the region(s) containing the given position.
+
+            Args:
+                pos (tuple[int, int]): Window position.
+                include_map (bool): Whether the map view may be marked.
+        """
+        for name, rect in self.regions.items():
+            if name == "map" and not include_map:
+                continue
+            if rect.collidepoint(pos):
+                self.dirty.add(name)
+
+    def get_map_state(self) -> tuple:
+        """
+            Gets all Editor attributes that change the map view and minimap.
+
+            Returns:
+                tuple: Current map state.
+        """
+        editor = self.editor
+        return (editor.scroll_x,
+                editor.scroll_y,
+                editor.scale,
+                editor.grid_size_x,
+                editor.grid_size_y,
+                editor.rows,
+                editor.columns,
+                editor.show_grid,
+                editor.chunk_renderer.revision,
+                tuple(editor.error_handler.error_messages.values()))
+
+    def get_ui_state(self) -> tuple:
+        """
+            Gets all Editor and MenuController attributes that change the panels or
+                put a menu on top of the window.
+
+            Returns:
+                tuple: Current ui state.
+        """
+        editor = self.editor
+        return (editor.is_building,
+                editor.is_displaying_presets,
+                editor.current_preset,
+                editor.current_tile,
+                editor.map_name,
+                editor.temp_map_name,
+                editor.selected_preference_name,
+                editor.selected_preference_value_change,
+                editor.menu_controller.get_state())
+
+    def check_state_changes(self) -> set[str]:
+        """
+            Compares the Editor state with the previous check.
+
+            Returns:
+                set[str]: Names of the regions affected by the changes.
+        """
+        changed: set[str] = set()
+
+        map_state = self.get_map_state()
+        if map_state != self.map_state:
+            changed.update(("map", "minimap"))
+            self.map_state = map_state
+
+        ui_state = self.get_ui_state()
+        if ui_state != self.ui_state:
+            changed.update(self.regions)
+            self.ui_state = ui_state
+
+        return changed
+
+    def begin_frame(self) -> None:
+        """
+            Marks regions dirty based on this frame's events and state changes since
+                the end of the previous frame.
+            Menus drawn on top of the building screen are redrawn as a whole on every event.
+        """
+        self.dirty.update(self.pending)
+        self.pending = set()
+
+        for event in self.editor.events:
+            if event.type == pygame.MOUSEMOTION:
+                # Hover effects only exist in the panels
+                self.mark_position_dirty(pos=event.pos,
+                                         include_map=False)
+                self.mark_position_dirty(pos=(event.pos[0] - event.rel[0],
+                                              event.pos[1] - event.rel[1]),
+                                         include_map=False)
+
+            elif event.type in (pygame.MOUSEBUTTONDOWN, pygame.MOUSEBUTTONUP):
+                self.mark_position_dirty(pos=event.pos,
+                                         include_map=True)
+
+            elif event.type in (pygame.KEYDOWN, pygame.KEYUP, pygame.TEXTINPUT):
+                if event.type == pygame.KEYDOWN:
+                    self.held_keys.add(event.key)
+                elif event.type == pygame.KEYUP:
+                    self.held_keys.discard(event.key)
+
+                if not self.editor.is_building:
+                    self.mark_all_dirty()
+
+            elif event.type == pygame.WINDOWFOCUSLOST:
+                self.held_keys.clear()
+
+            elif event.type in (pygame.VIDEOEXPOSE, pygame.WINDOWEXPOSED,
+                                pygame.WINDOWRESTORED, pygame.WINDOWSIZECHANGED):
+                self.mark_all_dirty()
+
+        self.dirty.update(self.check_state_changes())
+
+        if (self.dirty or self.editor.events) and not self.editor.is_building:
+            self.mark_all_dirty()
+
+    def is_idle(self) -> bool:
+        """
+            Checks if nothing has to be drawn this frame.
+            The Editor is busy while there are events, dirty regions,
+                held keys (scrolling, repeated undo) or held mouse buttons (placing tiles).
+
+            Returns:
+                bool: True if the frame can be skipped, else False.
+        """
+        if not self.DIRTY_RECTS:
+            return False
+
+        return (not self.editor.events
+                and not self.dirty
+                and not self.held_keys
+                and not any(pygame.mouse.get_pressed()))
+
+    def wait_for_event(self) -> None:
+        """
+            Blocks until an event arrives or IDLE_WAIT_MS passed.
+            The received event is handed to the next frame.
+        """
+        event = pygame.event.wait(self.IDLE_WAIT_MS)
+        if event.type != pygame.NOEVENT:
+            self.idle_events.append(event)
+
+    def get_events(self) -> list[pygame.event.Event]:
+        """
+            Gets all events for this frame, including the event that ended idle mode.
+
+            Returns:
+                list[pygame.event.Event]: Events for this frame.
+        """
+        events = self.idle_events + pygame.event.get()
+        self.idle_events = []
+
+        return events
+
+    def end_frame(self) -> None:
+        """
+            Passes the dirty regions to pygame.display.update().
+            State changes made while drawing this frame mark their regions for the next frame
+                since parts of this frame were drawn with the old state.
+        """
+        if not self.DIRTY_RECTS:
+            pygame.display.update()
+            return
+
+        self.pending = self.check_state_changes()
+        if self.pending and not self.editor.is_building:
+            self.pending.update(self.regions)
+
+        if self.dirty:
+            pygame.display.update([self.regions[name] for name in self.dirty])
+
+        self.dirty = set()
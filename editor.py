@@ -1,33 +1,80 @@
-from typing import Self, Tuple
+from typing import Self
+
+from utilities.startup_timer import startup_timer
 
 import numpy as np
 import pygame
 
-pygame.init()
+with startup_timer.phase("pygame init"):
+    pygame.init()
 
 from settings.minimap import *
 from settings.presets import *
 from settings.errors import *
+from settings.display import *
+
+with startup_timer.phase("window"):
+    screen = pygame.display.set_mode((SCREEN_WIDTH + RIGHT_MARGIN,
+                                      SCREEN_HEIGHT + BOTTOM_MARGIN))
+    pygame.display.message_box()
 
-screen = pygame.display.set_mode((SCREEN_WIDTH + RIGHT_MARGIN,
-                                  SCREEN_HEIGHT + BOTTOM_MARGIN))
-pygame.display.message_box()
+from loading_screen import preload_images
+with startup_timer.phase("asset decode"):
+    preload_images(screen=screen)
 
 from menu_manager.menu_controller import MenuController
 from event_handler import EventHandler
 from error_handler import ErrorHandler
+from display_handler import DisplayHandler
+from input_dispatcher import InputDispatcher
+from save_handler import SaveHandler
+from map_document import MapDocument
+from map_renderer.background_renderer import BackgroundRenderer
+from map_renderer.chunk_renderer import ChunkRenderer
+from map_renderer.grid_renderer import GridRenderer
+from map_renderer.sprite_atlas import SpriteAtlas
+from panel_renderer import PanelRenderer
 
 from settings.buttons import *
 
 import utilities.buttons as buttons
-import utilities.fonts as fonts
 import utilities.general as general
 import utilities.helpers as helpers
 import utilities.sprites as sprites
-import utilities.render_text as render_text
+from utilities.asset_manager import assets
+from utilities.preset_registry import registry
+
+
+def document_attribute(name: str) -> property:
+    """
+        Forwards an Editor attribute to the same attribute of its MapDocument.
+
+        Args:
+            name (str): Name of the attribute.
+
+        Returns:
+            property: Getter and setter of the attribute.
+    """
+    return property(lambda editor: getattr(editor.document, name),
+                    lambda editor, value: setattr(editor.document, name, value))
 
 
 class Editor:
+    """
+        View of a MapDocument, draws the map and the menus and turns input into changes of the map.
+        The map attributes below are those of the MapDocument.
+    """
+
+    map_name = document_attribute("map_name")
+    temp_map_name = document_attribute("temp_map_name")
+    rows = document_attribute("rows")
+    columns = document_attribute("columns")
+    grid_size_x = document_attribute("grid_size_x")
+    grid_size_y = document_attribute("grid_size_y")
+    world_data = document_attribute("world_data")
+    history = document_attribute("history")
+    journal = document_attribute("journal")
+
     def __init__(self) -> Self:
         self.clock: pygame.time.Clock = pygame.time.Clock()
         self.screen: pygame.display = screen
@@ -35,27 +82,22 @@ class Editor:
         self.keys: pygame.key = pygame.key.get_pressed()
         self.mouse_pos = pygame.mouse.get_pos()
 
-        self.map_name: str = "New map"
-        self.temp_map_name: str = self.map_name
+        # Canvas of the maps started from the File Menu, chosen in the restart popup
+        self.is_new_map_infinite: bool = INFINITE_CANVAS
+        self.document = MapDocument(rows=500,
+                                    columns=500,
+                                    infinite=self.is_new_map_infinite)
+        self.document.on_tile_changed = self.invalidate_tile
+        self.document.on_map_changed = self.invalidate_map
         # self.sky = sprites.sky_img
-        self.backgrounds = helpers.get_scaled_backgrounds(background=sprites.background_img)
 
-        self.columns = 500
         self.max_visible_cols = np.ceil(SCREEN_WIDTH / GRID_SIZE_X)
         self.start_col = 0
         self.stop_col = self.columns
-        self.rows = 500
         self.max_visible_rows = np.ceil(SCREEN_HEIGHT / GRID_SIZE_Y)
         self.start_row = 0
         self.stop_row = self.rows
 
-        self.grid_size_x = GRID_SIZE_X
-        self.grid_size_y = GRID_SIZE_Y
-        self.world_data: np.ndarray = general.get_fresh_world_data(
-            columns=self.columns,
-            rows=self.rows
-        )
-
         # Scrolling
         self.may_scroll_to: dict[str, bool] = {
             "left": True,
@@ -76,6 +118,14 @@ class Editor:
         # Events
         self.event_handler = EventHandler(editor=self)
 
+        # Rendering
+        with startup_timer.phase("map renderers"):
+            self.background_renderer = BackgroundRenderer(editor=self,
+                                                          image=sprites.background_img)
+            self.chunk_renderer = ChunkRenderer(editor=self)
+            self.grid_renderer = GridRenderer(editor=self)
+        self.panel_renderer = PanelRenderer(editor=self)
+
         # Menus
         self.menu_controller = MenuController(editor=self)
 
@@ -97,14 +147,16 @@ class Editor:
         self.selected_preference_value_change = self.rows
 
         # Presets
-        self.preset_names: list[str] = self.menu_controller.presets_renderer.preset_names
-        self.shortened_preset_names: list[
-            str] = self.menu_controller.presets_renderer.shortened_preset_names
+        self.preset_names: list[str] = registry.get_preset_names()
+        self.shortened_preset_names: list[str] = general.limit_string_length(
+            string_list=registry.get_preset_names(),
+            max_length=PRESETS_MAX_NAME_LENGTH
+        )
         self.current_preset: str = self.preset_names[0]
 
         # Tiles
-        self.level_objects: dict[int, pygame.Surface] = sprites.get_all_level_objects()
-        self.level_objects_backup: dict[int, pygame.Surface] = sprites.get_all_level_objects()
+        with startup_timer.phase("level objects"):
+            self.level_objects: dict[int, pygame.Surface] = sprites.get_all_level_objects()
         self.tile_list: list[pygame.Surface] = sprites.get_preset_sprites(
             preset_name=self.current_preset
         )
@@ -120,8 +172,6 @@ class Editor:
         )
         self.current_tile: int = 0
         self.current_object: int = self.tile_indexes[0]
-        self.tile_undo_tracker: list[Tuple[tuple, int]] = []
-        self.tile_redo_tracker: list[Tuple[tuple, int]] = []
 
         # States
         self.is_running = True
@@ -135,19 +185,56 @@ class Editor:
         self.center_col = self.columns // 2
         self.center_row = self.rows // 2
 
+        # Zoom
+        self.sprite_atlas = SpriteAtlas(editor=self)
+        self.level_atlas = self.sprite_atlas.get_atlas(scale=self.scale)
+
         # Errors
         self.error_handler = ErrorHandler(editor=self)
 
+        # Display
+        self.display_handler = DisplayHandler(editor=self)
+
+        # Input
+        self.input_dispatcher = InputDispatcher(editor=self)
+
+        # Saving
+        self.save_handler = SaveHandler(editor=self)
+
         self.test = 100
 
     def __str__(self) -> str:
         return f"Editing: {self.map_name}"
 
+    @property
+    def is_infinite(self) -> bool:
+        """
+            Infinite canvas maps have no rows or columns limit.
+
+            Returns:
+                bool: True if the current map is an infinite canvas, else False.
+        """
+        return self.document.is_infinite
+
+    def invalidate_tile(self,
+                        x: int,
+                        y: int) -> None:
+        self.chunk_renderer.invalidate_tile(x=x, y=y)
+
+    def invalidate_map(self) -> None:
+        self.chunk_renderer.invalidate_all()
+
     def set_scroll_restrictions(self) -> None:
         """
             Stops user from scrolling off the grid completely by disallowing to scroll
                 when MIN_VISIBLE_ROWS/COLS is reached.
+            Infinite canvas maps can be scrolled in every direction.
         """
+        if self.is_infinite:
+            for direction in self.may_scroll_to:
+                self.may_scroll_to[direction] = True
+            return
+
         # Out of bounds upwards after zooming
         if self.stop_row < MIN_VISIBLE_COLS:
             self.scroll_y -= (abs(self.stop_row) + 3) * self.grid_size_y
@@ -216,7 +303,13 @@ class Editor:
             Sets first and last column checking scroll_x, grid_size_x,
                 max_visible_cols and scale.
             Is called by zoom in- and out functions.
+            Infinite canvas maps are not limited by the number of columns.
         """
+        if self.is_infinite:
+            self.start_col = int(np.floor(-self.scroll_x / self.grid_size_x))
+            self.stop_col = int(np.ceil(self.max_visible_cols - self.scroll_x / self.grid_size_x))
+            return
+
         self.start_col = int(-self.scroll_x / self.grid_size_x) if self.scroll_x < 0 else 0
         self.stop_col = min(int(np.ceil(
             self.max_visible_cols - (self.scroll_x * self.scale) / (
@@ -227,7 +320,13 @@ class Editor:
             Sets first and last row by checking scroll_y, grid_size_y,
                 max_visible_rows and scale.
             Is called by run and zoom in- and out functions.
+            Infinite canvas maps are not limited by the number of rows.
         """
+        if self.is_infinite:
+            self.start_row = int(np.floor(-self.scroll_y / self.grid_size_y))
+            self.stop_row = int(np.ceil(self.max_visible_rows - self.scroll_y / self.grid_size_y))
+            return
+
         self.start_row = int(-self.scroll_y / self.grid_size_y) if self.scroll_y < 0 else 0
         self.stop_row = min(int(np.ceil(
             self.max_visible_rows - (self.scroll_y * self.scale) / (
@@ -256,20 +355,13 @@ class Editor:
         self.scroll_x += (new_mid_col - old_mid_col) * (self.grid_size_x * self.scale)
         self.scroll_y += (new_mid_row - old_mid_row) * (self.grid_size_y * self.scale)
 
-    def scale_level_objects(self) -> None:
+    def set_level_atlas(self) -> None:
         """
-            Scales all level objects by the Editor's scale.
+            Swaps the sprite atlas holding all level objects to the one of the Editor's scale.
+            Atlases are cached, only a scale that was not used before is built.
             Is called by zoom in- and out functions.
         """
-        for (index, tile) in self.level_objects.items():
-            self.level_objects[index] = pygame.transform.scale(self.level_objects_backup[index],
-                                                               (int(self.scale *
-                                                                    self.level_objects_backup[
-                                                                        index].get_width()),
-                                                                int(self.scale *
-                                                                    self.level_objects_backup[
-                                                                        index].get_height())
-                                                                ))
+        self.level_atlas = self.sprite_atlas.get_atlas(scale=self.scale)
 
     def zoom_in(self) -> None:
         """
@@ -290,7 +382,7 @@ class Editor:
             self.set_new_scroll_values(old_mid_col=old_mid_col,
                                        old_mid_row=old_mid_row)
 
-            self.scale_level_objects()
+            self.set_level_atlas()
 
     def zoom_out(self) -> None:
         """
@@ -310,40 +402,33 @@ class Editor:
             self.set_new_scroll_values(old_mid_col=old_mid_col,
                                        old_mid_row=old_mid_row)
 
-            self.scale_level_objects()
+            self.set_level_atlas()
 
     def wipe_map(self):
         """
             Sets all world_data array items to -1.
+            Can be undone.
         """
-        self.world_data: np.ndarray = general.get_fresh_world_data(
-            columns=self.columns,
-            rows=self.rows
-        )
+        self.document.wipe()
 
     def reload_editor(self) -> None:
         """
-            Sets all Editor attributes to their default state to mimic a restart.
+            Sets all Editor attributes to their default state to mimic a restart,
+            keeping the canvas chosen in the restart popup.
         """
-        self.map_name: str = "New map"
-        self.temp_map_name: str = self.map_name
+        # A new map is not saved, its changes are not journaled
+        self.document.close()
+        self.document = MapDocument(infinite=self.is_new_map_infinite)
+        self.document.on_tile_changed = self.invalidate_tile
+        self.document.on_map_changed = self.invalidate_map
 
-        self.columns = COLUMNS
         self.max_visible_cols = np.ceil(SCREEN_WIDTH / GRID_SIZE_X)
         self.start_col = 0
         self.stop_col = self.columns
-        self.rows = ROWS
         self.max_visible_rows = np.ceil(SCREEN_HEIGHT / GRID_SIZE_Y)
         self.start_row = 0
         self.stop_row = self.rows
 
-        self.grid_size_x = GRID_SIZE_X
-        self.grid_size_y = GRID_SIZE_Y
-        self.world_data: np.ndarray = general.get_fresh_world_data(
-            columns=self.columns,
-            rows=self.rows
-        )
-
         # Scrolling
         self.may_scroll_to: dict[str, bool] = {
             "left": True,
@@ -361,6 +446,12 @@ class Editor:
         self.base_scroll_speed = BASE_SCROLL_SPEED
         self.max_scroll_speed = MAX_SCROLL_SPEED
 
+        # Rendering
+        self.background_renderer = BackgroundRenderer(editor=self,
+                                                      image=sprites.background_img)
+        self.chunk_renderer = ChunkRenderer(editor=self)
+        self.grid_renderer = GridRenderer(editor=self)
+
         # Menus
         self.menu_controller = MenuController(editor=self)  # to allow adding new presets
 
@@ -370,9 +461,11 @@ class Editor:
         self.selected_preference_value_change = self.rows
 
         # Presets
-        self.preset_names: list[str] = self.menu_controller.presets_renderer.preset_names
-        self.shortened_preset_names: list[
-            str] = self.menu_controller.presets_renderer.shortened_preset_names
+        self.preset_names: list[str] = registry.get_preset_names()
+        self.shortened_preset_names: list[str] = general.limit_string_length(
+            string_list=registry.get_preset_names(),
+            max_length=PRESETS_MAX_NAME_LENGTH
+        )
         self.current_preset: str = self.preset_names[0]
 
         # Tiles
@@ -392,8 +485,6 @@ class Editor:
         )
         self.current_tile: int = 0
         self.current_object: int = self.tile_indexes[0]
-        self.tile_undo_tracker: list[Tuple[tuple, int]] = []
-        self.tile_redo_tracker: list[Tuple[tuple, int]] = []
 
         # States
         self.is_running = True
@@ -407,202 +498,97 @@ class Editor:
         self.center_col = self.columns // 2
         self.center_row = self.rows // 2
 
+        # Zoom
+        self.sprite_atlas = SpriteAtlas(editor=self)
+        self.level_atlas = self.sprite_atlas.get_atlas(scale=self.scale)
+
+        # Display
+        self.display_handler.mark_all_dirty()
+
+        # Saving
+        self.save_handler.reset()
+
     def draw_background(self,
                         scroll_x: int,
                         scroll_y: int) -> None:
         """
             Blits the background image to the screen.
+            The image is tiled across the part of the map that is in view.
 
             Args:
                 scroll_x (int): X coordinate of background.topleft.
                 scroll_y (int): Y coordinate of background.topleft.
         """
-        self.screen.blit(self.backgrounds[str(self.scale)],
-                         (scroll_x * self.scale, scroll_y * self.scale))
+        self.background_renderer.draw(scroll_x=scroll_x,
+                                      scroll_y=scroll_y)
 
     def draw_grid(self) -> None:
         """
             Draws horizontal and vertical lines on screen according to
                 grid size settings.
+            Only the visible columns and rows are covered by the pre-rendered grid overlay.
         """
-        # Horizontal lines
-        for x in range(self.rows + 1):
-            pygame.draw.line(surface=self.screen,
-                             color=GRID_LINE_COLOR,
-                             start_pos=(
-                                 0,
-                                 int((x * self.grid_size_y + self.scroll_y) * self.scale)),
-                             end_pos=(
-                                 SCREEN_WIDTH,
-                                 int((x * self.grid_size_y + self.scroll_y) * self.scale)))
-
-        # Vertical lines
-        for y in range(self.columns + 1):
-            pygame.draw.line(surface=self.screen,
-                             color=GRID_LINE_COLOR,
-                             start_pos=(
-                                 int((y * self.grid_size_x + self.scroll_x) * self.scale), 0),
-                             end_pos=(int((y * self.grid_size_x + self.scroll_x) * self.scale),
-                                      SCREEN_HEIGHT))
+        self.grid_renderer.draw()
 
     def draw_map(self) -> None:
         """
             Draws all level objects to the screen.
-            Checks current viewport and only blits objects that are contained within.
+            Checks current viewport and only blits the pre-composited chunks
+                that are contained within.
         """
-        # Get cols and rows in view
-        subset = self.world_data[self.start_row:self.stop_row + 1, self.start_col:self.stop_col + 1]
-
-        blit_list = []
-        for (y, x), tile in np.ndenumerate(subset):
-            if tile > -1:
-                x_pos = ((x + self.start_col) * self.grid_size_x + self.scroll_x) * self.scale
-                y_pos = ((y + self.start_row) * self.grid_size_y + self.scroll_y) * self.scale
-
-                blit_list.append((self.level_objects[tile], (x_pos, y_pos)))
-
-        self.screen.blits(blit_list)
+        self.chunk_renderer.draw()
 
     def draw_right_panel(self) -> None:
         """
             Blits right panel to the screen according to
                 panel settings.
+            The panel with its tiles, tile labels and the highlight of the selected tile
+                is composed by the PanelRenderer when one of them changes.
         """
-        pygame.draw.rect(surface=self.screen,
-                         color=RIGHT_PANEL_COLOR,
-                         rect=(SCREEN_WIDTH,
-                               0,
-                               RIGHT_MARGIN,
-                               SCREEN_HEIGHT),
-                         width=0)
+        self.panel_renderer.draw_right_panel()
 
-    def draw_and_select_tile(self) -> None:
+    def select_tile(self) -> None:
         """
-            Draws all tiles on side panel and stores currently selected tile.
+            Stores the tile the user clicked on in the side panel.
             Limits the number of tiles to MAX_NR_TILES.
             ErrorHandler will display a message if not all tiles can be shown.
         """
         for button_count, button in enumerate(self.tile_buttons[:MAX_NR_TILES]):
-            if button.draw():
+            if button.update():
                 self.current_tile = button_count
                 self.current_object = button.tile_index
 
-    def draw_tile_labels(self) -> None:
-        """
-            Draws label above the tile on the side panel.
-        """
-        for tile, label in zip(self.tile_buttons[:MAX_NR_TILES], self.tile_names[:MAX_NR_TILES]):
-            render_text.position(screen=self.screen,
-                                 text=str(label),
-                                 font=fonts.label_font,
-                                 color=TILE_LABEL_COLOR,
-                                 x_pos=tile.rect.topleft[0],
-                                 y_pos=tile.rect.topleft[1] - TILE_LABEL_Y_OFFSET)
-
-    def highlight_selected_tile(self) -> None:
-        """
-            Draws highlight effect on the selected tile.
-        """
-        pygame.draw.rect(
-            surface=self.screen,
-            color=TILE_HIGHLIGHT_COLOR,
-            rect=(self.tile_buttons[self.current_tile].rect.topleft[0] + TILE_HIGHLIGHT_LEFT_OFFSET,
-                  self.tile_buttons[self.current_tile].rect.topleft[1] + TILE_HIGHLIGHT_LEFT_OFFSET,
-                  TILE_SIZE_X + TILE_HIGHLIGHT_RIGHT_OFFSET,
-                  TILE_SIZE_Y + TILE_HIGHLIGHT_RIGHT_OFFSET),
-            width=TILE_HIGHLIGHT_WIDTH)
-
-    def update_undo_tracker(self,
-                            coords: Tuple[int, int],
-                            tile_index: int) -> None:
-        """
-            Appends the tile index of the previously placed tile to the undo tracker.
-            If number of stored tiles exceeds MAX_TILE_TRACKING,
-                the first item in the array is removed.
-
-            Args:
-                coords (Tuple[int, int]: Grid coordinates of the tile.
-                tile_index (int): The tile index of the 'old' tile.
-
-            Returns:
-                None
-        """
-        if len(self.tile_undo_tracker) > MAX_TILE_TRACKING:
-            self.tile_undo_tracker.pop(0)
-
-        self.tile_undo_tracker.append((coords, tile_index))
-
-    def update_redo_tracker(self,
-                            coords: int,
-                            tile_index: int) -> None:
-        """
-            Appends the tile index of the previously 'un-done' tile to the redo tracker.
-            If number of stored tiles exceeds MAX_TILE_TRACKING,
-                the first item in the array is removed.
-
-            Args:
-                coords (Tuple[int, int]: Grid coordinates of tile.
-                tile_index (int): The tile index of the 'un-done' tile.
-
-            Returns:
-                None
-        """
-        if len(self.tile_redo_tracker) > MAX_TILE_TRACKING:
-            self.tile_redo_tracker.pop(0)
-
-        self.tile_redo_tracker.append((coords, tile_index))
-
-    def undo_tile_placement(self) -> None:
+    def undo(self) -> None:
         """
-            Undo the last tile adding or removal.
-            Takes the currently last placed tile's grid location and tile index and
-                saves it in the redo_tracker.
-            Then takes the last item in the undo_tracker and adds the tile index to the corresponding
-                grid location.
+            Undoes the last tile stroke or bulk change (wipe, crop, resize, load).
 
             Returns:
                 None
         """
-        try:
-            last_action = self.tile_undo_tracker.pop()
-            (x, y), index = last_action
-            self.update_redo_tracker(coords=(x, y),
-                                     tile_index=self.world_data[y, x])
-            self.world_data[y, x] = index
-        except IndexError:
-            return
+        self.document.undo()
 
-    def redo_tile_placement(self) -> None:
+    def redo(self) -> None:
         """
-            Redo the last undo_tile_placement.
-            Takes the currently last 'un-done' tile's grid location and tile index and
-                saves it in the undo_tracker.
-            Then takes the last item in the redo_tracker and adds the tile index to the corresponding
-                grid location.
+            Redoes the last undone tile stroke or bulk change.
 
             Returns:
                 None
         """
-        try:
-            last_action = self.tile_redo_tracker.pop()
-            (x, y), index = last_action
-            self.update_undo_tracker(
-                coords=(x, y),
-                tile_index=self.world_data[y, x]
-            )
-            self.world_data[y, x] = index
-
-        except IndexError:
-            return
+        self.document.redo()
 
     def place_and_remove_tiles(self) -> None:
         """
             Places self.current_tile on the grid at current mouse position or
                 removes tile in current grid location.
+            All tiles changed from mouse down to mouse up are stored as a single undo step.
         """
+        if not pygame.mouse.get_pressed()[0] and not pygame.mouse.get_pressed()[2]:
+            self.document.end_stroke()
+
         mouse_pos = self.mouse_pos
-        x = int((mouse_pos[0] - (self.scroll_x * self.scale)) / (self.grid_size_x * self.scale))
-        y = int((mouse_pos[1] - (self.scroll_y * self.scale)) / (self.grid_size_y * self.scale))
+        # Floor keeps cells left of and above the origin negative
+        x = int(np.floor((mouse_pos[0] - (self.scroll_x * self.scale)) / (self.grid_size_x * self.scale)))
+        y = int(np.floor((mouse_pos[1] - (self.scroll_y * self.scale)) / (self.grid_size_y * self.scale)))
         # Check if within map canvas
         if mouse_pos[0] < SCREEN_WIDTH and mouse_pos[1] < SCREEN_HEIGHT:
             if pygame.mouse.get_pressed()[0] == 1:
@@ -611,11 +597,9 @@ class Editor:
                 if helpers.can_place_tile(editor=self,
                                           grid_x=x,
                                           grid_y=y):
-                    old_tile_index = self.world_data[y, x]
-                    self.update_undo_tracker(coords=(x, y),
-                                             tile_index=old_tile_index)
-                    self.world_data[y, x] = self.current_object
-                    self.tile_redo_tracker = []
+                    self.document.place_tile(row=y,
+                                             col=x,
+                                             value=self.current_object)
                     print(f"x={x}  y={y}")
                     print(self.scroll_x)
 
@@ -624,24 +608,15 @@ class Editor:
                 if helpers.can_remove_tile(editor=self,
                                            grid_x=x,
                                            grid_y=y):
-                    old_tile_index = self.world_data[y, x]
-                    self.world_data[y, x] = -1
-                    self.update_undo_tracker(coords=(x, y),
-                                             tile_index=old_tile_index)
-                    self.tile_redo_tracker = []
+                    self.document.remove_tile(row=y,
+                                              col=x)
 
     def draw_bottom_panel(self) -> None:
         """
             Blits bottom panel to the screen according to
                 panel settings.
         """
-        pygame.draw.rect(surface=self.screen,
-                         color=BOTTOM_PANEL_COLOR,
-                         rect=(0,
-                               SCREEN_HEIGHT,
-                               SCREEN_WIDTH,
-                               BOTTOM_MARGIN),
-                         width=0)
+        self.panel_renderer.draw_bottom_panel()
 
     def draw_minimap(self) -> None:
         """
@@ -665,6 +640,7 @@ class Editor:
         scale_factor, minimap_view_width, minimap_view_height = helpers.get_minimap_dimensions(
             editor=self
         )
+        extent_left, extent_top, _, _ = helpers.get_minimap_extent(editor=self)
 
         map_outline = pygame.draw.rect(surface=minimap_surface,
                                        color=MAP_OUTLINE_COLOR,
@@ -681,8 +657,8 @@ class Editor:
         view_area = pygame.draw.rect(surface=minimap_surface,
                                      color=MAP_VIEW_OUTLINE_COLOR,
                                      rect=(
-                                         map_outline.topleft[0] - self.scroll_x * scale_factor,
-                                         map_outline.topleft[1] - self.scroll_y * scale_factor,
+                                         map_outline.topleft[0] - (self.scroll_x + extent_left) * scale_factor,
+                                         map_outline.topleft[1] - (self.scroll_y + extent_top) * scale_factor,
                                          (SCREEN_WIDTH * scale_factor) / self.scale,
                                          (SCREEN_HEIGHT * scale_factor) / self.scale
                                      ),
@@ -703,31 +679,66 @@ class Editor:
             SCREEN_HEIGHT
         ))
 
+    def report_startup(self,
+                       first_frame_start: tuple[float, float]) -> None:
+        """
+            Ends the startup timing after the first frame,
+                prints the duration of each phase if STARTUP_REPORT.
+
+            Args:
+                first_frame_start (tuple[float, float]): startup_timer.mark() when the first frame started.
+        """
+        startup_timer.record(name="first frame",
+                             start=first_frame_start)
+        startup_timer.finish()
+        if STARTUP_REPORT:
+            print(startup_timer.get_report())
+            print(assets)
+
     def run(self):
+        first_frame_start = startup_timer.mark()
         while self.is_running:
             # General
-            self.events = pygame.event.get()
+            self.events = self.display_handler.get_events()
             self.keys = pygame.key.get_pressed()
             self.mouse_pos = pygame.mouse.get_pos()
+
+            # Saving
+            self.save_handler.update()
+            save_status = self.save_handler.get_status()
             pygame.display.set_caption(
-                f"Editing: {self.map_name} ({self.columns}x{self.rows}) @ {int(self.clock.get_fps())} fps")
+                f"Editing: {self.map_name} ({self.columns}x{self.rows}) @ {int(self.clock.get_fps())} fps"
+                f"{f' - {save_status}' if save_status else ''}")
 
-            # Background
-            self.screen.fill((89, 160, 205))
-            self.draw_background(scroll_x=self.scroll_x,
-                                 scroll_y=self.scroll_y)
+            # Dirty regions
+            self.display_handler.begin_frame()
+            if self.display_handler.is_idle():
+                self.display_handler.wait_for_event()
+                self.clock.tick(180)
+                continue
 
-            # Grid
-            if self.show_grid:
-                self.draw_grid()
+            # Widgets
+            self.input_dispatcher.begin_frame()
 
             # World
             self.set_col_start_stop()
             self.set_row_start_stop()
-            self.draw_map()
+
+            if self.display_handler.is_dirty("map"):
+                # Background
+                self.screen.fill((89, 160, 205), MAP_VIEW_RECT)
+                self.draw_background(scroll_x=self.scroll_x,
+                                     scroll_y=self.scroll_y)
+
+                # Grid
+                if self.show_grid:
+                    self.draw_grid()
+
+                self.draw_map()
 
             # Panels
-            self.draw_minimap()
+            if self.display_handler.is_dirty("minimap"):
+                self.draw_minimap()
             self.draw_right_panel()
             self.draw_bottom_panel()
 
@@ -752,9 +763,9 @@ class Editor:
             if self.is_building:
                 # Quick Menu
                 if self.undo_button.draw():
-                    self.undo_tile_placement()
+                    self.undo()
                 if self.redo_button.draw():
-                    self.redo_tile_placement()
+                    self.redo()
                 if self.grid_button.draw():
                     self.show_grid = not self.show_grid
 
@@ -769,18 +780,21 @@ class Editor:
                 self.is_displaying_presets = self.menu_controller.is_displaying_presets
                 if not self.is_displaying_presets:
                     # Tile selection
-                    self.draw_and_select_tile()
-                    self.draw_tile_labels()
-                    self.highlight_selected_tile()
+                    self.select_tile()
                     self.place_and_remove_tiles()
 
             # Errors
             self.error_handler.set_out_of_bounds_error()
             self.error_handler.set_preset_error()
             self.error_handler.set_tile_error()
-            self.error_handler.display_error_messages()
+            self.error_handler.set_tile_index_error()
+            if self.display_handler.is_dirty("map"):
+                self.error_handler.display_error_messages()
 
-            pygame.display.update()
+            self.display_handler.end_frame()
+            if startup_timer.total_ms is None:
+                self.report_startup(first_frame_start=first_frame_start)
             self.clock.tick(180)
 
+        self.save_handler.stop()
         pygame.quit()
@@ -1,9 +1,9 @@
 from typing import Any, Self
 
-import numpy as np
-
 import utilities.render_text as text
 import utilities.fonts as fonts
+import utilities.map_analysis as map_analysis
+from utilities.preset_registry import registry
 from settings.errors import *
 
 from settings.presets import *
@@ -22,6 +22,10 @@ class ErrorHandler:
 
         self.error_messages: dict[str, str] = {}
 
+        # world_data and (revision, rows, columns) of the last out of bounds check
+        self.checked_world_data: Any = None
+        self.checked_bounds_state: tuple = ()
+
         self.OUT_OF_BOUNDS_ERROR = f"Map cannot be saved." \
                                    f" Tiles found outside of grid." \
                                    f" Change map size or remove tiles."
@@ -34,6 +38,9 @@ class ErrorHandler:
         self.MAX_TILES_ERROR = f"Not all tiles are loaded." \
                                f" Editor can only hold {MAX_NR_TILES} tiles but found "
 
+        self.TILE_INDEX_ERROR = "Tile indexes used by different images, the last file is used:"
+        self.TILE_DUPLICATE_ERROR = "Tile indexes used by more than one file in a preset:"
+
     def set_preset_error(self) -> None:
         """
             Sets preset error message if more presets are loaded than can be drawn.
@@ -62,32 +69,79 @@ class ErrorHandler:
         else:
             self.error_messages["tile"] = None
 
+    def set_tile_index_error(self) -> None:
+        """
+            Sets tile_index error message if tile files in the presets share an index but
+                not their image.
+            Sets tile_duplicate error message if a preset holds identical files with the same index,
+                identical files in different presets are shared and not reported.
+            If no error, messages are set to None.
+
+            Returns:
+            None.
+        """
+        if registry.conflicts:
+            self.error_messages["tile_index"] = f"{self.TILE_INDEX_ERROR} {', '.join(map(str, registry.conflicts))}"
+
+        else:
+            self.error_messages["tile_index"] = None
+
+        if registry.duplicates:
+            duplicates = (f"{tile_index} ({len(names)} files in {' and '.join(sorted({name.split('/')[0] for name in names}))})"
+                          for tile_index, names in registry.duplicates.items())
+            self.error_messages["tile_duplicate"] = f"{self.TILE_DUPLICATE_ERROR} {', '.join(duplicates)}"
+
+        else:
+            self.error_messages["tile_duplicate"] = None
+
+    def is_bounds_state_changed(self) -> bool:
+        """
+            Checks if world_data, rows or columns changed since the last out of bounds check.
+            world_data is compared by identity since bulk changes (wipe, crop, load) replace it,
+                tile changes increase its revision.
+
+            Returns:
+                bool: True if the check has to be repeated, else False.
+        """
+        world_data = self.editor.world_data
+        bounds_state = (world_data.revision, self.editor.rows, self.editor.columns)
+        if world_data is self.checked_world_data and bounds_state == self.checked_bounds_state:
+            return False
+
+        self.checked_world_data = world_data
+        self.checked_bounds_state = bounds_state
+
+        return True
+
     def set_out_of_bounds_error(self) -> None:
         """
             Sets out_of_bounds error message if tiles are places outside the current grid.
             If no error, message is set to None.
+            Is called every frame but only checks world_data after it, rows or columns changed,
+                until then the previous message is kept.
 
             Returns:
             None.
         """
-        row_errors = 0
-        col_errors = 0
-        world_data: np.ndarray = self.editor.world_data
-        # check rows
-        if world_data.shape[0] > self.editor.rows:
-            # more world data rows than grid rows
-            for row in world_data[self.editor.rows:]:
-                for tile in row:
-                    if tile != -1:
-                        row_errors += 1
-        if world_data.shape[1] > self.editor.columns:
-            col_iterator = range(self.editor.columns, world_data.shape[0])
-            for row in world_data:
-                for i in col_iterator:
-                    if row[i] != -1:
-                        col_errors += 1
-
-        if row_errors > 0 or col_errors > 0:
+        if not self.is_bounds_state_changed():
+            return
+
+        # Infinite canvas maps have no bounds
+        if self.editor.is_infinite:
+            self.error_messages["grid"] = None
+            return
+
+        # Tiles can only be outside the grid when world_data is larger than it,
+        #   this also keeps memory-mapped maps from being read as a whole
+        rows, columns = self.editor.world_data.shape
+        if rows <= self.editor.rows and columns <= self.editor.columns:
+            self.error_messages["grid"] = None
+            return
+
+        extent = map_analysis.get_map_extent(world_data=self.editor.world_data)
+
+        if not extent.is_within(rows=self.editor.rows,
+                                columns=self.editor.columns):
             self.error_messages["grid"] = self.OUT_OF_BOUNDS_ERROR
 
         else:
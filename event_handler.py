@@ -22,17 +22,17 @@ class EventHandler:
         for event in self.editor.events:
             if event.type == pygame.KEYDOWN:
                 if event.key == pygame.K_z:
-                    self.editor.undo_tile_placement()
+                    self.editor.undo()
 
                 if event.key == pygame.K_x:
-                    self.editor.redo_tile_placement()
+                    self.editor.redo()
 
         keys = self.editor.keys
 
         if keys[pygame.K_z] and keys[pygame.K_LSHIFT]:
-            self.editor.undo_tile_placement()
+            self.editor.undo()
         if keys[pygame.K_x] and keys[pygame.K_LSHIFT]:
-            self.editor.redo_tile_placement()
+            self.editor.redo()
 
     def scrolling_events(self) -> None:
         """
@@ -0,0 +1,178 @@
+from typing import Any, Hashable, Self
+
+import pygame
+
+from settings.display import *
+
+
+class InputDispatcher:
+    """
+        Resolves which widget is under the mouse and routes mouse buttons to it.
+        Widgets (buttons, tiles and menu entries) register their rect every frame they are shown.
+        The rects are kept in a spatial index of INPUT_GRID_CELL_SIZE buckets, rebuilt only when the
+            registered widgets change, so finding the widget under the mouse does not depend on the
+            number of widgets on screen.
+        The hovered widget is resolved once per mouse event, widgets then only compare themselves
+            with the result.
+        Widgets registered later are drawn later and are on top.
+
+        Args:
+            editor (Any): Current Editor instance.
+
+        Returns:
+            Self.
+    """
+
+    def __init__(self,
+                 editor: Any) -> Self:
+        self.editor = editor
+
+        self.INPUT_GRID_CELL_SIZE = INPUT_GRID_CELL_SIZE
+
+        # (widget, rect) in drawing order, of the previous frame and of the current frame
+        self.widgets: list[tuple[Hashable, pygame.Rect]] = []
+        self.next_widgets: list[tuple[Hashable, pygame.Rect]] = []
+        # (column, row) of a bucket -> (order, widget, rect) of the widgets overlapping it
+        self.buckets: dict[tuple[int, int], list[tuple[int, Hashable, pygame.Rect]]] = {}
+
+        # Widget under the mouse, widget the left mouse button went down on and
+        #   widgets pressed and clicked (pressed and released) this frame
+        self.hovered: Hashable | None = None
+        self.held: Hashable | None = None
+        self.pressed: Hashable | None = None
+        self.clicked: Hashable | None = None
+
+    def register(self,
+                 widget: Hashable,
+                 rect: pygame.Rect | tuple) -> None:
+        """
+            Adds a widget shown this frame, from the next frame on it can be hovered and clicked.
+
+            Args:
+                widget (Hashable): Button or other object identifying the widget.
+                rect (pygame.Rect | tuple): Position and size of the widget in the window.
+        """
+        self.next_widgets.append((widget, pygame.Rect(rect)))
+
+    def register_entries(self,
+                         group: str,
+                         rects: list[pygame.Rect]) -> None:
+        """
+            Adds the entries of a menu list shown this frame, entry i is the widget (group, i).
+
+            Args:
+                group (str): Name of the list.
+                rects (list[pygame.Rect]): Rect per entry.
+        """
+        for i, rect in enumerate(rects):
+            self.register(widget=(group, i),
+                          rect=rect)
+
+    def build_index(self) -> None:
+        """
+            Puts every widget in the buckets its rect overlaps.
+        """
+        cell_size = self.INPUT_GRID_CELL_SIZE
+        self.buckets = {}
+        for order, (widget, rect) in enumerate(self.widgets):
+            if rect.width <= 0 or rect.height <= 0:
+                continue
+
+            for column in range(rect.left // cell_size, (rect.right - 1) // cell_size + 1):
+                for row in range(rect.top // cell_size, (rect.bottom - 1) // cell_size + 1):
+                    self.buckets.setdefault((column, row), []).append((order, widget, rect))
+
+    def hit_test(self,
+                 pos: tuple[int, int]) -> Hashable | None:
+        """
+            Gets the topmost widget at a position.
+
+            Args:
+                pos (tuple[int, int]): Window position.
+
+            Returns:
+                Hashable | None: Widget or None if there is no widget at pos.
+        """
+        bucket = self.buckets.get((pos[0] // self.INPUT_GRID_CELL_SIZE, pos[1] // self.INPUT_GRID_CELL_SIZE), ())
+        for _, widget, rect in reversed(bucket):
+            if rect.collidepoint(pos):
+                return widget
+
+        return None
+
+    def begin_frame(self) -> None:
+        """
+            Rebuilds the index if other widgets were shown last frame and
+                routes this frame's mouse events to the widget under the mouse.
+        """
+        if self.next_widgets != self.widgets:
+            self.widgets = self.next_widgets
+            self.build_index()
+            self.hovered = self.hit_test(pos=self.editor.mouse_pos)
+        self.next_widgets = []
+
+        self.pressed = None
+        self.clicked = None
+        for event in self.editor.events:
+            if event.type == pygame.MOUSEMOTION:
+                self.hovered = self.hit_test(pos=event.pos)
+
+            elif event.type == pygame.MOUSEBUTTONDOWN and event.button == pygame.BUTTON_LEFT:
+                self.hovered = self.hit_test(pos=event.pos)
+                self.held = self.hovered
+                self.pressed = self.hovered
+
+            elif event.type == pygame.MOUSEBUTTONUP and event.button == pygame.BUTTON_LEFT:
+                self.hovered = self.hit_test(pos=event.pos)
+                if self.held is not None and self.held == self.hovered:
+                    self.clicked = self.held
+                self.held = None
+
+            elif event.type == pygame.WINDOWLEAVE:
+                self.hovered = None
+
+        # Releases outside of the window do not always arrive as an event
+        if not pygame.mouse.get_pressed()[0]:
+            self.held = None
+
+    def is_hovered(self,
+                   widget: Hashable) -> bool:
+        return self.hovered is not None and self.hovered == widget
+
+    def is_held(self,
+                widget: Hashable) -> bool:
+        # The left mouse button went down on the widget and is still down on it
+        return self.held is not None and self.held == widget and self.hovered == widget
+
+    def is_pressed(self,
+                   widget: Hashable) -> bool:
+        # The left mouse button went down on the widget this frame
+        return self.pressed is not None and self.pressed == widget
+
+    def is_clicked(self,
+                   widget: Hashable) -> bool:
+        # The left mouse button went down and up on the widget, the click ended this frame
+        return self.clicked is not None and self.clicked == widget
+
+    @staticmethod
+    def get_entry(widget: Hashable | None,
+                  group: str) -> int | None:
+        if isinstance(widget, tuple) and widget[0] == group:
+            return widget[1]
+
+        return None
+
+    def get_hovered_entry(self,
+                          group: str) -> int | None:
+        return self.get_entry(widget=self.hovered,
+                              group=group)
+
+    def get_held_entry(self,
+                       group: str) -> int | None:
+        return self.get_entry(widget=self.held if self.held == self.hovered else None,
+                              group=group)
+
+    def get_clicked_entry(self,
+                          group: str) -> int | None:
+        return self.get_entry(widget=self.clicked,
+                              group=group)
@@ -0,0 +1,94 @@
+"""
+Startup stage that decodes all images on a thread pool while the window shows a progress bar,
+    so the window appears right away instead of freezing until every tile is loaded.
+"""
+
+import os
+
+import pygame
+
+from settings.display import *
+from settings.paths import IMAGES_DIR
+
+from utilities import sprites, tile_atlas
+from utilities.asset_manager import assets
+from utilities.preset_registry import registry
+
+
+def get_image_paths() -> list[str]:
+    """
+        Gets the paths of the user interface images and of the preset atlases,
+            the tiles of presets without an up to date atlas are loaded one by one.
+        With DEFERRED_INIT only the backgrounds are preloaded, button images are loaded
+            when their button is created.
+
+        Returns:
+            list[str]: Paths of the images.
+    """
+    if DEFERRED_INIT:
+        paths = [os.path.join(IMAGES_DIR, file_name) for file_name, _ in sprites.UI_IMAGES.values()]
+    else:
+        paths = [os.path.join(IMAGES_DIR, file_name) for file_name in sorted(os.listdir(IMAGES_DIR))
+                 if file_name.endswith(".png")]
+    for preset_name in registry.get_preset_names():
+        paths.extend(tile_atlas.get_image_paths(preset=registry.get_preset(preset_name=preset_name)))
+
+    return paths
+
+
+def draw_progress(screen: pygame.Surface,
+                  font: pygame.font.Font,
+                  done: int,
+                  total: int) -> None:
+    """
+        Draws the loading text and a progress bar in the center of the window.
+        Events are pumped so the window keeps responding.
+
+        Args:
+            screen (pygame.Surface): Editor window.
+            font (pygame.font.Font): Font of the loading text.
+            done (int): Number of loaded images.
+            total (int): Number of images to load.
+    """
+    pygame.event.pump()
+    # Redrawing ~50 times is smooth enough and keeps the display updates cheap
+    if done != total and done % max(1, total // 50) != 0:
+        return
+
+    center_x, center_y = screen.get_rect().center
+    screen.fill(LOADING_BACKGROUND_COLOR)
+
+    text = font.render(f"{LOADING_TEXT} {done}/{total}", True, LOADING_BAR_COLOR)
+    screen.blit(text, (center_x - text.get_width() // 2, center_y + LOADING_TEXT_Y_OFFSET))
+
+    bar_rect = pygame.Rect(center_x - LOADING_BAR_WIDTH // 2,
+                           center_y - LOADING_BAR_HEIGHT // 2,
+                           LOADING_BAR_WIDTH,
+                           LOADING_BAR_HEIGHT)
+    pygame.draw.rect(surface=screen,
+                     color=LOADING_BAR_COLOR,
+                     rect=(bar_rect.x, bar_rect.y, bar_rect.width * done // total, bar_rect.height))
+    pygame.draw.rect(surface=screen,
+                     color=LOADING_BAR_COLOR,
+                     rect=bar_rect,
+                     width=LOADING_BAR_OUTLINE_WIDTH)
+
+    pygame.display.flip()
+
+
+def preload_images(screen: pygame.Surface) -> None:
+    """
+        Decodes all images with ASSET_PRELOAD_WORKERS threads while showing the progress.
+        Afterwards every image load is a cache hit in the AssetManager.
+
+        Args:
+            screen (pygame.Surface): Editor window.
+    """
+    font = pygame.font.SysFont(name=None,
+                               size=32)
+    assets.preload(paths=get_image_paths(),
+                   workers=ASSET_PRELOAD_WORKERS,
+                   on_progress=lambda done, total: draw_progress(screen=screen,
+                                                                 font=font,
+                                                                 done=done,
+                                                                 total=total))
@@ -0,0 +1,290 @@
+"""
+Headless core of the Editor: a map and everything that changes it.
+
+A MapDocument owns world_data, the map dimensions and grid sizes, the undo history and the
+    journal, and loads and saves map files.
+It does not depend on pygame, so maps can be loaded, edited, cropped, resized and saved from
+    plain Python (batch processing, benchmarks):
+
+    document = MapDocument()
+    document.load(path="maps/level")
+    document.place_tile(row=3, col=4, value=12)
+    document.end_stroke()
+    document.crop()
+    document.save(path="maps/level_cropped")
+
+The Editor is a view over its MapDocument, it draws the map and turns input into changes.
+Views follow the changes through on_tile_changed and on_map_changed.
+"""
+
+import os
+from typing import Any, Callable, Self
+
+from settings.setup import COLUMNS, ROWS, GRID_SIZE_X, GRID_SIZE_Y, INFINITE_CANVAS, EMPTY_TILE, \
+    GRID_PREFERENCES_DICT
+
+from utilities import map_analysis, map_format, map_journal, world_data as world_data_backend
+from utilities.history import History
+from utilities.map_journal import MapJournal
+
+
+class MapDocument:
+    """
+        A map with its undo history and journal.
+        Every change can be undone, bulk changes replace world_data (see history.MapSnapshot).
+
+        Args:
+            rows (int): Number of rows of the new map.
+            columns (int): Number of columns of the new map.
+            infinite (bool): Whether the new map is an infinite canvas.
+
+        Returns:
+            Self.
+    """
+
+    def __init__(self,
+                 rows: int = ROWS,
+                 columns: int = COLUMNS,
+                 infinite: bool = INFINITE_CANVAS) -> Self:
+        self.map_name: str = "New map"
+        self.temp_map_name: str = self.map_name
+
+        self.rows = rows
+        self.columns = columns
+        self.grid_size_x = GRID_SIZE_X
+        self.grid_size_y = GRID_SIZE_Y
+        self.world_data: Any = self.get_fresh_world_data(infinite=infinite)
+
+        # A new map is not saved, its changes are not journaled until it is
+        self.journal = MapJournal()
+        self.history = History(journal=self.journal)
+        # Whether the last load recovered edits that were not saved before a crash
+        self.has_recovered_edits = False
+
+        # Called with x and y after a tile changed, and after world_data was replaced
+        self.on_tile_changed: Callable[..., None] | None = None
+        self.on_map_changed: Callable[[], None] | None = None
+
+    def __str__(self) -> str:
+        return f"MapDocument: {self.map_name} ({self.columns}x{self.rows})"
+
+    @property
+    def is_infinite(self) -> bool:
+        return self.world_data.backend == "infinite"
+
+    def get_fresh_world_data(self,
+                             infinite: bool) -> Any:
+        """
+            Gets an empty world_data of the size of the map.
+
+            Args:
+                infinite (bool): Whether the map has no size.
+
+            Returns:
+                Any: DenseWorldData, SparseWorldData or InfiniteWorldData where each item is -1.
+        """
+        if infinite:
+            return world_data_backend.get_world_data(rows=self.rows,
+                                                     columns=self.columns,
+                                                     backend="infinite")
+
+        return world_data_backend.get_world_data(rows=self.rows,
+                                                 columns=self.columns)
+
+    def invalidate_tile(self,
+                        x: int,
+                        y: int) -> None:
+        if self.on_tile_changed is not None:
+            self.on_tile_changed(x=x, y=y)
+
+    def invalidate_all(self) -> None:
+        if self.on_map_changed is not None:
+            self.on_map_changed()
+
+    def get_snapshot_attributes(self) -> dict:
+        return self.history.get_snapshot_attributes(document=self)
+
+    def record_change(self,
+                      before: dict) -> None:
+        """
+            Stores a bulk change in the history and the journal.
+
+            Args:
+                before (dict): Result of get_snapshot_attributes from before the change.
+        """
+        self.invalidate_all()
+        self.history.record_snapshot(document=self,
+                                     before=before)
+
+    def place_tile(self,
+                   row: int,
+                   col: int,
+                   value: int) -> bool:
+        """
+            Sets a tile, the change is added to the current stroke.
+
+            Args:
+                row (int): Row of the tile.
+                col (int): Column of the tile.
+                value (int): New tile index.
+
+            Returns:
+                bool: True if the tile changed, else False.
+        """
+        old_value = self.world_data[row, col]
+        if old_value == value:
+            return False
+
+        self.world_data[row, col] = value
+        self.invalidate_tile(x=col, y=row)
+        self.history.record_tile(row=row,
+                                 col=col,
+                                 old_value=old_value,
+                                 new_value=value)
+
+        return True
+
+    def remove_tile(self,
+                    row: int,
+                    col: int) -> bool:
+        return self.place_tile(row=row,
+                               col=col,
+                               value=EMPTY_TILE)
+
+    def end_stroke(self) -> None:
+        """
+            Stores the tiles changed since the last call as a single undo step.
+        """
+        self.history.end_stroke()
+
+    def undo(self) -> None:
+        self.history.undo(document=self)
+
+    def redo(self) -> None:
+        self.history.redo(document=self)
+
+    def wipe(self) -> None:
+        """
+            Removes all tiles.
+        """
+        before = self.get_snapshot_attributes()
+        self.world_data = self.get_fresh_world_data(infinite=self.is_infinite)
+        self.record_change(before=before)
+
+    def crop(self) -> None:
+        """
+            Removes all rows and columns after the last tile, keeping the minimum map size.
+            Infinite canvas maps have no size, only their empty blocks are released.
+        """
+        before = self.get_snapshot_attributes()
+        if self.is_infinite:
+            self.world_data = self.world_data.cropped()
+        else:
+            extent = map_analysis.get_map_extent(world_data=self.world_data)
+            self.world_data = self.world_data.resized(
+                rows=max(extent.row_stop, GRID_PREFERENCES_DICT["rows"]["min"]),
+                columns=max(extent.col_stop, GRID_PREFERENCES_DICT["columns"]["min"])
+            )
+            self.rows, self.columns = self.world_data.shape
+        self.record_change(before=before)
+
+    def resize(self,
+               rows: int | None = None,
+               columns: int | None = None) -> None:
+        """
+            Changes the number of rows and or columns.
+            Added rows and columns are empty, removed ones are dropped.
+
+            Args:
+                rows (int | None): New number of rows or None to keep them.
+                columns (int | None): New number of columns or None to keep them.
+        """
+        before = self.get_snapshot_attributes()
+        current_rows, current_columns = self.world_data.shape
+        self.world_data = self.world_data.resized(rows=current_rows if rows is None else rows,
+                                                  columns=current_columns if columns is None else columns)
+        if rows is not None:
+            self.rows = rows
+        if columns is not None:
+            self.columns = columns
+        self.record_change(before=before)
+
+    def set_grid_size(self,
+                      grid_size_x: int | None = None,
+                      grid_size_y: int | None = None) -> None:
+        """
+            Changes the size of a cell.
+
+            Args:
+                grid_size_x (int | None): New width of a cell or None to keep it.
+                grid_size_y (int | None): New height of a cell or None to keep it.
+        """
+        before = self.get_snapshot_attributes()
+        if grid_size_x is not None:
+            self.grid_size_x = grid_size_x
+        if grid_size_y is not None:
+            self.grid_size_y = grid_size_y
+        self.record_change(before=before)
+
+    def load(self,
+             path: str) -> None:
+        """
+            Loads a map file and replays its journals, the map is named after the file.
+            Edits that were not saved before a crash are replayed as well, see has_recovered_edits.
+            Maps saved before the binary map format are converted.
+            Can be undone.
+
+            Args:
+                path (str): Path of the map file.
+        """
+        rows, columns, grid_size_x, grid_size_y, world_data = map_format.load_map(path=path)
+        # Unsaved edits of the current map are discarded, also when it is loaded again
+        self.journal.close()
+        has_recovered_edits = map_journal.has_unsaved_edits(map_path=path)
+        rows, columns, grid_size_x, grid_size_y, world_data = map_journal.replay(map_path=path,
+                                                                                 rows=rows,
+                                                                                 columns=columns,
+                                                                                 grid_size_x=grid_size_x,
+                                                                                 grid_size_y=grid_size_y,
+                                                                                 world_data=world_data)
+
+        before = self.get_snapshot_attributes()
+        self.map_name = os.path.basename(path)
+        self.temp_map_name = self.map_name
+        self.rows = rows
+        self.columns = columns
+        self.grid_size_x = grid_size_x
+        self.grid_size_y = grid_size_y
+        self.world_data = world_data
+        self.has_recovered_edits = has_recovered_edits
+        self.record_change(before=before)
+
+    def save(self,
+             path: str) -> None:
+        """
+            Writes the map to a file and waits until it is written.
+            The journals of the file are folded into it and removed.
+            The Editor saves on a background thread instead, see SaveHandler.
+
+            Args:
+                path (str): Path of the map file.
+        """
+        if self.journal.map_path == path:
+            journal_paths = self.journal.start(map_name=self.map_name,
+                                               map_path=path)
+        else:
+            journal_paths = map_journal.get_journal_paths(map_path=path)
+
+        map_format.save_map(path=path,
+                            world_data=self.world_data,
+                            rows=self.rows,
+                            columns=self.columns,
+                            grid_size_x=self.grid_size_x,
+                            grid_size_y=self.grid_size_y)
+        map_journal.remove_journals(paths=journal_paths)
+
+    def close(self) -> None:
+        """
+            Closes the journal of the map, its unsaved edits are discarded.
+        """
+        self.journal.close()
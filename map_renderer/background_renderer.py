@@ -0,0 +1,121 @@
+from collections import OrderedDict
+from typing import Any, Self
+
+import pygame
+
+from settings.map_renderer import *
+
+
+class BackgroundRenderer:
+    """
+        Responsible for drawing the background to the screen.
+        The background image is repeated as a tile across the part of the map that is in view,
+            so memory use does not depend on the map size.
+        Scaled tiles are cached for the last BACKGROUND_CACHE_SIZE zoom levels.
+
+        Args:
+            editor (Any): Current Editor instance.
+            image (pygame.Surface): Background image to repeat.
+
+        Returns:
+            Self.
+    """
+
+    def __init__(self,
+                 editor: Any,
+                 image: pygame.Surface) -> Self:
+        self.editor = editor
+
+        self.BACKGROUND_TILE_SIZE = BACKGROUND_TILE_SIZE
+        self.BACKGROUND_CACHE_SIZE = BACKGROUND_CACHE_SIZE
+
+        self.image = image
+        self.tiles: OrderedDict[float, pygame.Surface] = OrderedDict()
+
+    def get_tile(self,
+                 scale: float) -> pygame.Surface:
+        """
+            Gets the background tile for the given scale, scaling it if needed.
+
+            Args:
+                scale (float): Scale of the tile.
+
+            Returns:
+                pygame.Surface: Background tile.
+        """
+        scale = round(scale, 1)
+        if scale in self.tiles:
+            self.tiles.move_to_end(scale)
+            return self.tiles[scale]
+
+        size = max(1, int(self.BACKGROUND_TILE_SIZE * scale))
+        tile = pygame.transform.smoothscale(self.image, (size, size))
+        self.tiles[scale] = tile
+
+        while len(self.tiles) > self.BACKGROUND_CACHE_SIZE:
+            self.tiles.popitem(last=False)
+
+        return tile
+
+    def get_view_rect(self,
+                      scroll_x: int,
+                      scroll_y: int) -> pygame.Rect:
+        """
+            Gets the part of the map view covered by the map.
+
+            Args:
+                scroll_x (int): X coordinate of the map's top left corner.
+                scroll_y (int): Y coordinate of the map's top left corner.
+
+            Returns:
+                pygame.Rect: Area of the screen to draw the background in.
+        """
+        editor = self.editor
+        # Infinite canvas maps cover the whole view
+        if editor.is_infinite:
+            return pygame.Rect(0, 0, SCREEN_WIDTH, SCREEN_HEIGHT)
+
+        left = int(scroll_x * editor.scale)
+        top = int(scroll_y * editor.scale)
+        right = int((editor.columns * editor.grid_size_x + scroll_x) * editor.scale)
+        bottom = int((editor.rows * editor.grid_size_y + scroll_y) * editor.scale)
+
+        view_rect = pygame.Rect(left, top, right - left, bottom - top)
+
+        return view_rect.clip((0, 0, SCREEN_WIDTH, SCREEN_HEIGHT))
+
+    def draw(self,
+             scroll_x: int,
+             scroll_y: int) -> None:
+        """
+            Blits the background tile to the screen as many times as needed to cover
+                the visible part of the map.
+
+            Args:
+                scroll_x (int): X coordinate of the map's top left corner.
+                scroll_y (int): Y coordinate of the map's top left corner.
+        """
+        editor = self.editor
+        view_rect = self.get_view_rect(scroll_x=scroll_x,
+                                       scroll_y=scroll_y)
+        if view_rect.width == 0 or view_rect.height == 0:
+            return
+
+        tile = self.get_tile(scale=editor.scale)
+        tile_width, tile_height = tile.get_size()
+
+        # Tiles are anchored to the map's top left corner
+        origin_x = int(scroll_x * editor.scale)
+        origin_y = int(scroll_y * editor.scale)
+        first_x = origin_x + (view_rect.left - origin_x) // tile_width * tile_width
+        first_y = origin_y + (view_rect.top - origin_y) // tile_height * tile_height
+
+        blit_list = []
+        for y in range(first_y, view_rect.bottom, tile_height):
+            for x in range(first_x, view_rect.right, tile_width):
+                blit_list.append((tile, (x, y)))
+
+        previous_clip = editor.screen.get_clip()
+        editor.screen.set_clip(view_rect)
+        editor.screen.blits(blit_list, doreturn=False)
+        editor.screen.set_clip(previous_clip)
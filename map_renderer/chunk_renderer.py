@@ -0,0 +1,213 @@
+from collections import OrderedDict
+from typing import Any, Self, Tuple
+
+import numpy as np
+import pygame
+
+from settings.map_renderer import *
+
+
+class ChunkRenderer:
+    """
+        Responsible for drawing world_data to the screen.
+        Pre-composites blocks of CHUNK_SIZE x CHUNK_SIZE cells into cached surfaces,
+            one set per zoom level and grid size, and blits the visible chunks
+            instead of every single tile.
+        Cached chunks are only rebuilt after they have been invalidated.
+
+        Args:
+            editor (Any): Current Editor instance.
+
+        Returns:
+            Self.
+    """
+
+    def __init__(self,
+                 editor: Any) -> Self:
+        self.editor = editor
+
+        self.CHUNK_SIZE = CHUNK_SIZE
+        self.CHUNK_CACHE_MAX_BYTES = CHUNK_CACHE_MAX_BYTES
+
+        # (layout, chunk_row, chunk_col) -> pre-composited chunk or None if empty
+        self.chunks: OrderedDict[tuple, pygame.Surface | None] = OrderedDict()
+        self.layouts: set[Tuple[float, int, int]] = set()
+        self.cache_bytes = 0
+
+        # Increases every time the map layer changes
+        self.revision = 0
+
+    def get_layout(self) -> Tuple[float, int, int]:
+        """
+            Gets the key that identifies the current zoom level and grid size.
+
+            Returns:
+                Tuple[float, int, int]: scale, grid_size_x and grid_size_y.
+        """
+        return self.editor.scale, self.editor.grid_size_x, self.editor.grid_size_y
+
+    def invalidate_tile(self,
+                        x: int,
+                        y: int) -> None:
+        """
+            Removes the cached chunk containing the given grid location for every layout.
+
+            Args:
+                x (int): Column of the changed tile.
+                y (int): Row of the changed tile.
+        """
+        chunk_row = y // self.CHUNK_SIZE
+        chunk_col = x // self.CHUNK_SIZE
+        for layout in self.layouts:
+            self.remove_chunk(key=(layout, chunk_row, chunk_col))
+
+        self.revision += 1
+
+    def invalidate_all(self) -> None:
+        """
+            Removes all cached chunks.
+            Is called after bulk changes to world_data (wipe, crop, load).
+        """
+        self.chunks.clear()
+        self.layouts.clear()
+        self.cache_bytes = 0
+
+        self.revision += 1
+
+    def remove_chunk(self,
+                     key: tuple) -> None:
+        """
+            Removes a single chunk from the cache and releases its memory budget.
+
+            Args:
+                key (tuple): Layout, chunk row and chunk column.
+        """
+        chunk = self.chunks.pop(key, None)
+        if chunk is not None:
+            self.cache_bytes -= chunk.get_width() * chunk.get_height() * chunk.get_bytesize()
+
+    def build_chunk(self,
+                    layout: Tuple[float, int, int],
+                    chunk_row: int,
+                    chunk_col: int) -> pygame.Surface | None:
+        """
+            Composites all tiles of a chunk onto a single transparent surface.
+
+            Args:
+                layout (Tuple[float, int, int]): scale, grid_size_x and grid_size_y.
+                chunk_row (int): Row of the chunk.
+                chunk_col (int): Column of the chunk.
+
+            Returns:
+                pygame.Surface | None: Chunk surface, None if the chunk holds no tiles.
+        """
+        scale, grid_size_x, grid_size_y = layout
+        row = chunk_row * self.CHUNK_SIZE
+        col = chunk_col * self.CHUNK_SIZE
+        subset = self.editor.world_data.region(row_start=row,
+                                              row_stop=row + self.CHUNK_SIZE,
+                                              col_start=col,
+                                              col_stop=col + self.CHUNK_SIZE)
+
+        ys, xs = np.nonzero(subset > -1)
+        if len(ys) == 0:
+            return None
+
+        cell_width = grid_size_x * scale
+        cell_height = grid_size_y * scale
+        atlas = self.editor.level_atlas
+
+        blit_list = []
+        overflow_x = 0
+        overflow_y = 0
+        # Offsets are taken from the map origin so tiles line up across chunk borders
+        origin_x = int(col * cell_width)
+        origin_y = int(row * cell_height)
+        for y, x in zip(ys.tolist(), xs.tolist()):
+            area = atlas.rects[subset[y, x]]
+            blit_list.append((atlas.surface,
+                              (int((col + x) * cell_width) - origin_x,
+                               int((row + y) * cell_height) - origin_y),
+                              area))
+            overflow_x = max(overflow_x, area.width - cell_width)
+            overflow_y = max(overflow_y, area.height - cell_height)
+
+        # Tiles larger than a cell are allowed to overlap into the next chunk
+        chunk = pygame.Surface((int(np.ceil(self.CHUNK_SIZE * cell_width + overflow_x)),
+                                int(np.ceil(self.CHUNK_SIZE * cell_height + overflow_y))),
+                               pygame.SRCALPHA)
+        chunk.blits(blit_list, doreturn=False)
+
+        return chunk
+
+    def get_chunk(self,
+                  layout: Tuple[float, int, int],
+                  chunk_row: int,
+                  chunk_col: int) -> pygame.Surface | None:
+        """
+            Gets a chunk from the cache, building it if needed.
+            Least recently used chunks are dropped when CHUNK_CACHE_MAX_BYTES is exceeded.
+
+            Args:
+                layout (Tuple[float, int, int]): scale, grid_size_x and grid_size_y.
+                chunk_row (int): Row of the chunk.
+                chunk_col (int): Column of the chunk.
+
+            Returns:
+                pygame.Surface | None: Chunk surface, None if the chunk holds no tiles.
+        """
+        key = (layout, chunk_row, chunk_col)
+        if key in self.chunks:
+            self.chunks.move_to_end(key)
+            return self.chunks[key]
+
+        chunk = self.build_chunk(layout=layout,
+                                 chunk_row=chunk_row,
+                                 chunk_col=chunk_col)
+        self.chunks[key] = chunk
+        self.layouts.add(layout)
+
+        if chunk is not None:
+            self.cache_bytes += chunk.get_width() * chunk.get_height() * chunk.get_bytesize()
+            while self.cache_bytes > self.CHUNK_CACHE_MAX_BYTES and len(self.chunks) > 1:
+                oldest_key = next(iter(self.chunks))
+                self.remove_chunk(key=oldest_key)
+
+        return chunk
+
+    def draw(self) -> None:
+        """
+            Blits all chunks within the current viewport to the screen.
+            On infinite canvas maps only chunks overlapping populated blocks are built,
+                so empty areas scrolled over do not fill the cache.
+        """
+        editor = self.editor
+        layout = self.get_layout()
+        scale, grid_size_x, grid_size_y = layout
+
+        if editor.is_infinite:
+            last_row = editor.stop_row
+            last_col = editor.stop_col
+        else:
+            last_row = min(editor.stop_row, editor.world_data.shape[0] - 1)
+            last_col = min(editor.stop_col, editor.world_data.shape[1] - 1)
+
+        blit_list = []
+        for chunk_row in range(editor.start_row // self.CHUNK_SIZE, last_row // self.CHUNK_SIZE + 1):
+            for chunk_col in range(editor.start_col // self.CHUNK_SIZE, last_col // self.CHUNK_SIZE + 1):
+                if editor.is_infinite and not editor.world_data.has_tiles(
+                        row_start=chunk_row * self.CHUNK_SIZE,
+                        row_stop=(chunk_row + 1) * self.CHUNK_SIZE,
+                        col_start=chunk_col * self.CHUNK_SIZE,
+                        col_stop=(chunk_col + 1) * self.CHUNK_SIZE):
+                    continue
+
+                chunk = self.get_chunk(layout=layout,
+                                       chunk_row=chunk_row,
+                                       chunk_col=chunk_col)
+                if chunk is not None:
+                    x_pos = int(chunk_col * self.CHUNK_SIZE * grid_size_x * scale) + editor.scroll_x * scale
+                    y_pos = int(chunk_row * self.CHUNK_SIZE * grid_size_y * scale) + editor.scroll_y * scale
+                    blit_list.append((chunk, (x_pos, y_pos)))
+
+        editor.screen.blits(blit_list, doreturn=False)
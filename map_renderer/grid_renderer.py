@@ -0,0 +1,150 @@
+from typing import Any, Self, Tuple
+
+import numpy as np
+import pygame
+
+from settings.map_renderer import *
+
+
+class GridRenderer:
+    """
+        Responsible for drawing the grid lines to the screen.
+        The lines are rendered once per (grid_size_x, grid_size_y, scale) onto an overlay
+            one repeating pattern larger than the map view.
+        Each frame the overlay is blitted shifted by the scroll offset modulo the pattern size and
+            clipped to the visible columns and rows of the map.
+        Cells are not always a whole number of pixels (e.g. 32 * 0.4), the pattern is therefore
+            the smallest number of cells that spans a whole number of pixels.
+
+        Args:
+            editor (Any): Current Editor instance.
+
+        Returns:
+            Self.
+    """
+
+    def __init__(self,
+                 editor: Any) -> Self:
+        self.editor = editor
+
+        self.GRID_LINE_COLOR = GRID_LINE_COLOR
+        self.GRID_COLOR_KEY = GRID_COLOR_KEY
+
+        self.layout: Tuple[int, int, float] | None = None
+        self.overlay: pygame.Surface | None = None
+        self.pattern_width = 0
+        self.pattern_height = 0
+
+    @staticmethod
+    def get_pattern_size(cell_size: float) -> int:
+        """
+            Gets the size in pixels of the smallest number of cells that spans a whole number of pixels.
+
+            Args:
+                cell_size (float): Size of a cell on screen.
+
+            Returns:
+                int: Size of the repeating pattern in pixels.
+        """
+        for nr_cells in range(1, 11):
+            if abs(nr_cells * cell_size - round(nr_cells * cell_size)) < 1e-6:
+                return round(nr_cells * cell_size)
+
+        return int(np.ceil(cell_size))
+
+    def build_overlay(self,
+                      cell_width: float,
+                      cell_height: float) -> pygame.Surface:
+        """
+            Draws grid lines on a transparent surface covering the map view plus one pattern.
+
+            Args:
+                cell_width (float): Width of a cell on screen.
+                cell_height (float): Height of a cell on screen.
+
+            Returns:
+                pygame.Surface: Grid overlay.
+        """
+        width = SCREEN_WIDTH + self.pattern_width + 1
+        height = SCREEN_HEIGHT + self.pattern_height + 1
+
+        overlay = pygame.Surface((width, height))
+        overlay.fill(self.GRID_COLOR_KEY)
+
+        # Horizontal lines
+        for y in range(int(height / cell_height) + 1):
+            pygame.draw.line(surface=overlay,
+                             color=self.GRID_LINE_COLOR,
+                             start_pos=(0, int(y * cell_height)),
+                             end_pos=(width, int(y * cell_height)))
+
+        # Vertical lines
+        for x in range(int(width / cell_width) + 1):
+            pygame.draw.line(surface=overlay,
+                             color=self.GRID_LINE_COLOR,
+                             start_pos=(int(x * cell_width), 0),
+                             end_pos=(int(x * cell_width), height))
+
+        overlay.set_colorkey(self.GRID_COLOR_KEY, pygame.RLEACCEL)
+
+        return overlay
+
+    def get_overlay(self) -> pygame.Surface:
+        """
+            Gets the overlay for the current grid size and scale, building it if needed.
+
+            Returns:
+                pygame.Surface: Grid overlay.
+        """
+        editor = self.editor
+        layout = (editor.grid_size_x, editor.grid_size_y, editor.scale)
+        if layout != self.layout:
+            cell_width = editor.grid_size_x * editor.scale
+            cell_height = editor.grid_size_y * editor.scale
+            self.pattern_width = self.get_pattern_size(cell_size=cell_width)
+            self.pattern_height = self.get_pattern_size(cell_size=cell_height)
+            self.overlay = self.build_overlay(cell_width=cell_width,
+                                              cell_height=cell_height)
+            self.layout = layout
+
+        return self.overlay
+
+    def get_clip_rect(self) -> pygame.Rect:
+        """
+            Gets the part of the map view covered by the visible columns and rows,
+                including the closing line of the last column and row.
+
+            Returns:
+                pygame.Rect: Area of the screen to draw grid lines in.
+        """
+        editor = self.editor
+        left = int((editor.start_col * editor.grid_size_x + editor.scroll_x) * editor.scale)
+        top = int((editor.start_row * editor.grid_size_y + editor.scroll_y) * editor.scale)
+        right = int((editor.stop_col * editor.grid_size_x + editor.scroll_x) * editor.scale) + 1
+        bottom = int((editor.stop_row * editor.grid_size_y + editor.scroll_y) * editor.scale) + 1
+
+        clip_rect = pygame.Rect(left, top, right - left, bottom - top)
+
+        return clip_rect.clip((0, 0, SCREEN_WIDTH, SCREEN_HEIGHT))
+
+    def draw(self) -> None:
+        """
+            Blits the grid overlay to the screen.
+        """
+        editor = self.editor
+        clip_rect = self.get_clip_rect()
+        if clip_rect.width == 0 or clip_rect.height == 0:
+            return
+
+        overlay = self.get_overlay()
+
+        # Screen position of the overlay's first line, up to one pattern before the screen's edge
+        origin_x = int(np.floor(editor.scroll_x * editor.scale)) % self.pattern_width - self.pattern_width
+        origin_y = int(np.floor(editor.scroll_y * editor.scale)) % self.pattern_height - self.pattern_height
+
+        editor.screen.blit(overlay,
+                           clip_rect.topleft,
+                           area=(clip_rect.x - origin_x,
+                                 clip_rect.y - origin_y,
+                                 clip_rect.width,
+                                 clip_rect.height))
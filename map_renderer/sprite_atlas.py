@@ -0,0 +1,147 @@
+from collections import OrderedDict
+from typing import Any, Self
+
+import pygame
+
+from settings.map_renderer import *
+
+
+class Atlas:
+    """
+        All level objects packed onto a single surface at one zoom level.
+
+        Args:
+            surface (pygame.Surface): Surface holding all scaled tiles.
+            rects (dict[int, pygame.Rect]): Area of each tile index on the surface.
+
+        Returns:
+            Self.
+    """
+
+    def __init__(self,
+                 surface: pygame.Surface,
+                 rects: dict[int, pygame.Rect]) -> Self:
+        self.surface = surface
+        self.rects = rects
+
+    def get_size(self) -> int:
+        """
+            Gets the memory used by the atlas surface in bytes.
+
+            Returns:
+                int: Number of bytes.
+        """
+        return self.surface.get_width() * self.surface.get_height() * self.surface.get_bytesize()
+
+
+class SpriteAtlas:
+    """
+        Responsible for scaling the level objects for every zoom level.
+        All level objects are packed into one Atlas per scale, built the first time the
+            scale is used and kept in a least recently used cache bounded by ATLAS_CACHE_MAX_BYTES.
+        Zooming to a cached scale only swaps the Atlas.
+
+        Args:
+            editor (Any): Current Editor instance.
+
+        Returns:
+            Self.
+    """
+
+    def __init__(self,
+                 editor: Any) -> Self:
+        self.editor = editor
+
+        self.SPRITE_ATLAS_MAX_WIDTH = SPRITE_ATLAS_MAX_WIDTH
+        self.ATLAS_CACHE_MAX_BYTES = ATLAS_CACHE_MAX_BYTES
+
+        self.atlases: OrderedDict[float, Atlas] = OrderedDict()
+        self.cache_bytes = 0
+
+    def invalidate(self) -> None:
+        """
+            Removes all atlases.
+            Is called when the level objects change.
+        """
+        self.atlases.clear()
+        self.cache_bytes = 0
+
+    def build_atlas(self,
+                    scale: float) -> Atlas:
+        """
+            Scales all level objects and packs them in shelves (rows of tiles) onto a single surface.
+            Tile indexes sharing an image share its area.
+
+            Args:
+                scale (float): Scale of the tiles.
+
+            Returns:
+                Atlas: Packed tiles and their areas.
+        """
+        # First tile index per image
+        image_indexes: dict[int, int] = {}
+        for index, image in self.editor.level_objects.items():
+            image_indexes.setdefault(id(image), index)
+
+        scaled_tiles: dict[int, pygame.Surface] = {}
+        for index in image_indexes.values():
+            image = self.editor.level_objects[index]
+            scaled_tiles[index] = pygame.transform.scale(image,
+                                                         (int(scale * image.get_width()),
+                                                          int(scale * image.get_height())))
+
+        # Tallest tiles first keeps the shelves tight
+        order = sorted(scaled_tiles, key=lambda i: scaled_tiles[i].get_height(), reverse=True)
+
+        rects: dict[int, pygame.Rect] = {}
+        x = 0
+        y = 0
+        shelf_height = 0
+        width = 1
+        for index in order:
+            tile_width, tile_height = scaled_tiles[index].get_size()
+            if x + tile_width > self.SPRITE_ATLAS_MAX_WIDTH and x > 0:
+                x = 0
+                y += shelf_height
+                shelf_height = 0
+
+            rects[index] = pygame.Rect(x, y, tile_width, tile_height)
+            x += tile_width
+            width = max(width, x)
+            shelf_height = max(shelf_height, tile_height)
+
+        surface = pygame.Surface((width, max(1, y + shelf_height)), pygame.SRCALPHA)
+        surface.blits([(scaled_tiles[index], rect) for index, rect in rects.items()], doreturn=False)
+
+        for index, image in self.editor.level_objects.items():
+            rects[index] = rects[image_indexes[id(image)]]
+
+        return Atlas(surface=surface,
+                     rects=rects)
+
+    def get_atlas(self,
+                  scale: float) -> Atlas:
+        """
+            Gets the Atlas for the given scale, building it if needed.
+            Least recently used atlases are dropped when ATLAS_CACHE_MAX_BYTES is exceeded.
+
+            Args:
+                scale (float): Scale of the tiles.
+
+            Returns:
+                Atlas: Packed tiles and their areas.
+        """
+        scale = round(scale, 1)
+        if scale in self.atlases:
+            self.atlases.move_to_end(scale)
+            return self.atlases[scale]
+
+        atlas = self.build_atlas(scale=scale)
+        self.atlases[scale] = atlas
+        self.cache_bytes += atlas.get_size()
+
+        while self.cache_bytes > self.ATLAS_CACHE_MAX_BYTES and len(self.atlases) > 1:
+            _, oldest_atlas = self.atlases.popitem(last=False)
+            self.cache_bytes -= oldest_atlas.get_size()
+
+        return atlas
@@ -5,12 +5,8 @@ These functions interact with the program directly.
 """
 from typing import Any, Tuple
 
-import numpy as np
-
 from menu_manager.edit_menu import utils
 
-from utilities import helpers
-
 
 def prepare_preferences_menu(editor: Any,
                              edit_menu_renderer: Any) -> None:
@@ -44,57 +40,39 @@ def apply_preference_change(menu_renderer: Any,
                             pref_name: str,
                             pref_value_change: int) -> None:
     """
-        Takes the user selected (and edited) preference and its value and apply it
-            to the Editor.
+        Shows the user selected (and edited) preference and its value as applied
+            after the map was changed by update_map_preference.
 
         Args:
             menu_renderer (Any): Current EditMenuRenderer instance.
-            pref_name (str): Name of the preference to change.
+            pref_name (str): Name of the changed preference.
             pref_value_change (int): New value of the preference.
     """
     menu_renderer.editor.selected_preference_value = pref_value_change
 
-    # Update settings (row, col, grid_size ect)
-    attributes_dict = {
-        pref_name: int(pref_value_change)
-    }
-
-    helpers.update_class_dict(cls=menu_renderer.editor,
-                              attributes=attributes_dict)
     # menu_renderer.editor.background = helpers.update_background(editor=menu_renderer.editor)
     menu_renderer.preferences_dict = utils.get_preferences_dict(editor=menu_renderer.editor)
 
 
-def update_world_data_size(editor: Any,
-                           name: str,
-                           value: int) -> None:
+def update_map_preference(editor: Any,
+                          name: str,
+                          value: int) -> None:
     """
-        Updates either the row or column of world_data.
-        Takes the name and the new value and applies the change.
+        Updates the rows, columns or grid size of the map.
+        Takes the name and the new value and applies the change, it can be undone.
 
         Args:
             editor (Any): Current Editor instance.
-            name (str): Name of the axis ('rows' or 'columns').
+            name (str): Name of the preference ('rows', 'columns', 'grid_size_x' or 'grid_size_y').
             value (int): New value to be set.
 
     """
-    if name == "rows":
-        if value > editor.rows:
-            # add rows
-            rows = np.full((value - editor.rows, editor.world_data.shape[1]), -1)
-            editor.world_data = np.vstack((editor.world_data, rows))
-        elif value < editor.rows:
-            # remove rows
-            editor.world_data = editor.world_data[:value, :]
-
-    elif name == "columns":
-        if value > editor.columns:
-            # add columns
-            cols = np.full((editor.world_data.shape[0], value - editor.columns), -1)
-            editor.world_data = np.hstack((editor.world_data, cols))
-        elif value < editor.columns:
-            # remove columns
-            editor.world_data = editor.world_data[:, :value - editor.columns]
+    if name in ("rows", "columns"):
+        # added rows and columns are empty, removed ones are dropped
+        editor.document.resize(**{name: value})
+
+    else:
+        editor.document.set_grid_size(**{name: value})
 
 
 def manage_preferences_change(menu_renderer: Any) -> None | str:
@@ -114,11 +92,18 @@ def manage_preferences_change(menu_renderer: Any) -> None | str:
     pref_value = int(menu_renderer.editor.selected_preference_value)
     pref_value_change = int(menu_renderer.editor.selected_preference_value_change)
 
+    if menu_renderer.editor.is_infinite and pref_name in ("rows", "columns"):
+        # Infinite canvas maps grow in every direction
+        return f"Infinite maps have no {pref_name} limit"
+
     if utils.is_new_value_allowed(name=pref_name,
                                   value=pref_value_change):
 
         # check if tiles are outside the new world_data size
-        max_rows, max_cols = utils.get_grid_max_row_col(world_data=menu_renderer.editor.world_data)
+        if pref_name in ("rows", "columns"):
+            max_rows, max_cols = utils.get_grid_max_row_col(world_data=menu_renderer.editor.world_data)
+        else:
+            max_rows, max_cols = 0, 0
 
         if menu_renderer.editor.selected_preference_name == "columns" and pref_value_change < max_cols:
             # Tiles present in cols to be removed
@@ -128,9 +113,9 @@ def manage_preferences_change(menu_renderer: Any) -> None | str:
             preference_feedback = "Tiles present in rows to be removed"
 
         else:
-            update_world_data_size(editor=menu_renderer.editor,
-                                   name=menu_renderer.editor.selected_preference_name,
-                                   value=pref_value_change)
+            update_map_preference(editor=menu_renderer.editor,
+                                  name=menu_renderer.editor.selected_preference_name,
+                                  value=pref_value_change)
 
             preference_feedback = utils.get_preferences_accepted_text(pref_name=pref_name,
                                                                       pref_value=pref_value,
@@ -1,4 +1,5 @@
 from collections import OrderedDict
+from functools import cached_property
 from typing import Any
 
 import pygame
@@ -8,7 +9,7 @@ from menu_manager.edit_menu import utils
 
 from utilities import buttons
 
-from settings.buttons import EDIT_BTN, PREF_BTN, CROP_BTN, BACK_BTN_LARGE, OK_BTN_LARGE, WIPE_BTN
+from settings.buttons import PREF_BTN, CROP_BTN, BACK_BTN_LARGE, OK_BTN_LARGE, WIPE_BTN
 from settings.setup import DARK_ORANGE
 
 
@@ -27,7 +28,6 @@ class EditMenuRenderer:
         # References
         self.editor = menu_controller.editor
         self.menu_controller = menu_controller
-        self.popup_renderer = menu_controller.popup_renderer
 
         # Info
         self.preferences_dict: OrderedDict[str, int] = utils.get_preferences_dict(
@@ -35,23 +35,35 @@ class EditMenuRenderer:
         )
         self.preferences_outline_recs: list[pygame.rect.Rect] = []
 
-        # Buttons
-        self.edit_button = buttons.get_utility_button(editor=self.editor,
-                                                      **EDIT_BTN)
-        self.pref_button = buttons.get_utility_button(editor=self.editor,
-                                                      **PREF_BTN)
-        self.crop_button = buttons.get_utility_button(editor=self.editor,
-                                                      **CROP_BTN)
-        self.wipe_button = buttons.get_utility_button(editor=self.editor,
-                                                      **WIPE_BTN)
+    @property
+    def popup_renderer(self) -> Any:
+        return self.menu_controller.popup_renderer
 
-        self.back_button = buttons.get_utility_button(editor=self.editor,
-                                                      **BACK_BTN_LARGE)
-        self.ok_button = buttons.get_utility_button(editor=self.editor,
-                                                    **OK_BTN_LARGE)
+    # Buttons of the menu, created the first time the menu is drawn
+    @cached_property
+    def pref_button(self) -> buttons.UtilityButton:
+        return buttons.get_utility_button(editor=self.editor,
+                                          **PREF_BTN)
 
-        # Trackers
-        self.clicked = False
+    @cached_property
+    def crop_button(self) -> buttons.UtilityButton:
+        return buttons.get_utility_button(editor=self.editor,
+                                          **CROP_BTN)
+
+    @cached_property
+    def wipe_button(self) -> buttons.UtilityButton:
+        return buttons.get_utility_button(editor=self.editor,
+                                          **WIPE_BTN)
+
+    @cached_property
+    def back_button(self) -> buttons.UtilityButton:
+        return buttons.get_utility_button(editor=self.editor,
+                                          **BACK_BTN_LARGE)
+
+    @cached_property
+    def ok_button(self) -> buttons.UtilityButton:
+        return buttons.get_utility_button(editor=self.editor,
+                                          **OK_BTN_LARGE)
 
     def pressed_ok_button(self) -> bool:
         """
@@ -73,17 +85,6 @@ class EditMenuRenderer:
         """
         return self.back_button.draw()
 
-    def draw_edit_menu_button(self) -> None:
-        """
-            Draws the Edit Menu button to the screen and sets the MenuController state to
-                the 'edit_menu' state if the user clicked on it.
-
-            Returns:
-                None.
-        """
-        if self.edit_button.draw():
-            self.menu_controller.set_state("edit_menu")
-
     def draw_edit_menu(self) -> None:
         """
             Draws all buttons in the Edit Menu category to the screen and
@@ -144,9 +145,7 @@ class EditMenuRenderer:
             self.menu_controller.set_state("reset")
 
         if self.popup_renderer.pressed_ok_button():
-            self.editor.world_data = utils.crop_world_data(world_data=self.editor.world_data)
-            self.editor.rows = self.editor.world_data.shape[0]
-            self.editor.columns = self.editor.world_data.shape[1]
+            self.editor.document.crop()
             # self.editor.background = helpers.update_background(editor=self.editor)
             self.menu_controller.set_state("reset")
 
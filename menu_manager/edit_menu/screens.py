@@ -88,15 +88,21 @@ def highlight_and_return_selected_preference(menu_renderer: Any) -> None | Tuple
        Returns:
            None | Tuple[str, int]: None or selected preference and its value.
     """
-    for i, outline_rect in enumerate(menu_renderer.preferences_outline_recs):
-        if outline_rect.collidepoint(menu_renderer.editor.mouse_pos):
-            pygame.draw.rect(
-                surface=menu_renderer.editor.screen,
-                color=PREFERENCES_COLOR,
-                rect=outline_rect,
-                width=5
-            )
-            if pygame.mouse.get_pressed()[0] == 1:
-                return list(menu_renderer.preferences_dict.items())[i]  # is still a Tuple
+    input_dispatcher = menu_renderer.editor.input_dispatcher
+    input_dispatcher.register_entries(group="preferences",
+                                      rects=menu_renderer.preferences_outline_recs)
+
+    hovered = input_dispatcher.get_hovered_entry(group="preferences")
+    if hovered is not None:
+        pygame.draw.rect(
+            surface=menu_renderer.editor.screen,
+            color=PREFERENCES_COLOR,
+            rect=menu_renderer.preferences_outline_recs[hovered],
+            width=5
+        )
+
+    held = input_dispatcher.get_held_entry(group="preferences")
+    if held is not None:
+        return list(menu_renderer.preferences_dict.items())[held]  # is still a Tuple
 
     return None
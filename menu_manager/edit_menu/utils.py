@@ -7,10 +7,10 @@ These functions do NOT interact with the program directly.
 from collections import OrderedDict
 from typing import Any, Tuple
 
-import numpy as np
-
 from settings.setup import GRID_PREFERENCES_DICT
 
+from utilities import map_analysis
+
 
 def get_preferences_accepted_text(pref_name: str,
                                   pref_value: int,
@@ -66,57 +66,18 @@ def is_new_value_allowed(name: str,
     return dict_[name]["min"] <= value <= dict_[name]["max"]
 
 
-def crop_world_data(world_data: np.ndarray) -> np.ndarray:
+def get_grid_max_row_col(world_data: Any) -> Tuple[int, int]:
     """
-        Removes all rows and columns, descending, that contain only -1 values.
+        Get the number of rows and columns that have to be kept to not remove any tiles.
+        First value is the row after the last row that contains a tile.
+        Second value is the column after the last column that contains a tile.
 
         Args:
-            world_data (np.ndarray): Nested list containing tile indexes of the map.
+            world_data (Any): DenseWorldData or SparseWorldData holding the tile indexes of the map.
 
         Returns:
-            np.ndarray: Cropped version of world_data
-    """
-    new_rows, new_cols = get_grid_max_row_col(world_data=world_data)
-
-    min_rows = GRID_PREFERENCES_DICT["rows"]["min"]
-    min_cols = GRID_PREFERENCES_DICT["columns"]["min"]
-    # User tries to crop map smaller than min map size
-    if new_rows < min_rows:
-        new_rows = min_rows
-
-    if new_cols < min_cols:
-        new_cols = min_cols
-
-    world_data = world_data[:new_rows, :]
-
-    new_world_data = world_data[:, :new_cols]
-
-    return new_world_data
-
-
-def get_grid_max_row_col(world_data: np.ndarray) -> Tuple[int, int]:
+            Tuple[int, int]: Number of rows and columns to keep.
     """
-        Get the number of rows and columns that can be removed from the end of world_data.
-        First value is the number of rows, descending, that contain no -1.
-        Second value is the number of columns, descending, that contain no -1
+    extent = map_analysis.get_map_extent(world_data=world_data)
 
-        Args:
-            world_data (list[list[int]]: Nested list containing tile indexes of the map.
-
-        Returns:
-            Tuple[int, int]: Number of rows and columns that can be safely removed.
-    """
-    rows_to_keep = world_data.shape[0]
-    for row in world_data[::-1]:
-        if all(index == -1 for index in row):
-            rows_to_keep -= 1
-        else:
-            break
-
-    cols_to_keep = 0
-    for row in world_data:
-        for i, col in enumerate(row):
-            if col != -1:
-                cols_to_keep = max(cols_to_keep, i + 1)
-
-    return rows_to_keep, cols_to_keep
+    return extent.row_stop, extent.col_stop
@@ -5,46 +5,38 @@ These functions DO interact with the program directly.
 """
 
 import os
-import pickle
 from typing import Any
 
-from menu_manager.file_menu import utils
 from settings.paths import MAPS_DIR
-from utilities import helpers
 
 
 def save_map(editor: Any) -> None:
     """
-        Serializes map-dependent variables into pickle format and
-            saves it under the maps name.
+        Saves the map under the maps name on the save thread,
+            the Editor keeps running while the map is written.
 
         Args:
             editor (any): Current Editor object.
     """
-    save_data = [
-        editor.rows,
-        editor.columns,
-        editor.grid_size_x,
-        editor.grid_size_y,
-        editor.world_data
-    ]
-
-    with open(file=os.path.join(MAPS_DIR, editor.map_name),
-              mode="wb") as pickle_out:
-        pickle.dump(obj=save_data,
-                    file=pickle_out)
+    editor.save_handler.save_map()
 
 
 def load_new_map(editor: Any,
                  selected_map: str) -> None:
     """
-        Gets deserialized map details and updates the Editors attributes to
-            load the new map.
+        Loads the selected map into the MapDocument and scrolls back to its origin.
+        Changes in the journals of the map are replayed,
+            including edits that were not saved before a crash.
 
         Args:
             editor (Any): Current Editor instance.
             selected_map (str): Map the user selected to load.
     """
-    map_attributes = utils.get_deserialized_map_details(map_name=selected_map)
-    helpers.update_class_dict(cls=editor,
-                              attributes=map_attributes)
+    editor.document.load(path=os.path.join(MAPS_DIR, selected_map))
+    editor.scroll_x = 0
+    editor.scroll_y = 0
+    editor.is_building = True
+    editor.save_handler.reset()
+    editor.save_handler.open_journal()
+    if editor.document.has_recovered_edits:
+        editor.save_handler.set_status(status=f"Recovered unsaved edits of '{selected_map}'")
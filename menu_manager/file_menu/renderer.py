@@ -1,3 +1,4 @@
+from functools import cached_property
 from typing import Any
 
 import pygame
@@ -8,7 +9,7 @@ from menu_manager.file_menu import utils
 from utilities import buttons
 
 from settings.setup import DARK_ORANGE
-from settings.buttons import FILE_BTN, SAVE_BTN, LOAD_BTN, NAME_BTN, NEW_BTN, BACK_BTN_LARGE, OK_BTN_LARGE
+from settings.buttons import SAVE_BTN, LOAD_BTN, NAME_BTN, NEW_BTN, BACK_BTN_LARGE, OK_BTN_LARGE
 
 
 class FileMenuRenderer:
@@ -26,32 +27,48 @@ class FileMenuRenderer:
         # References
         self.editor = menu_controller.editor
         self.menu_controller = menu_controller
-        self.popup_renderer = self.menu_controller.popup_renderer
 
-        # Info
-        self.saved_maps_names: list[str] = utils.get_saved_maps_names()
+        # Info, read from the map catalog when the load menu opens
+        self.saved_maps_names: list[str] = []
+        self.saved_maps_info: dict[str, str] = {}
+        self.saved_maps_thumbnails: dict[str, pygame.Surface] = {}
         self.saved_maps_outline_rects: list[pygame.rect.Rect] = []
         self.selected_map: str = None
 
-        # Buttons
-        self.file_button = buttons.get_utility_button(editor=self.editor,
-                                                      **FILE_BTN)
-        self.save_button = buttons.get_utility_button(editor=self.editor,
-                                                      **SAVE_BTN)
-        self.load_button = buttons.get_utility_button(editor=self.editor,
-                                                      **LOAD_BTN)
-        self.name_button = buttons.get_utility_button(editor=self.editor,
-                                                      **NAME_BTN)
-        self.new_button = buttons.get_utility_button(editor=self.editor,
-                                                     **NEW_BTN)
-
-        self.back_button = buttons.get_utility_button(editor=self.editor,
-                                                      **BACK_BTN_LARGE)
-        self.ok_button = buttons.get_utility_button(editor=self.editor,
-                                                    **OK_BTN_LARGE)
-
-        # Trackers
-        self.clicked = False
+    @property
+    def popup_renderer(self) -> Any:
+        return self.menu_controller.popup_renderer
+
+    # Buttons of the menu, created the first time the menu is drawn
+    @cached_property
+    def save_button(self) -> buttons.UtilityButton:
+        return buttons.get_utility_button(editor=self.editor,
+                                          **SAVE_BTN)
+
+    @cached_property
+    def load_button(self) -> buttons.UtilityButton:
+        return buttons.get_utility_button(editor=self.editor,
+                                          **LOAD_BTN)
+
+    @cached_property
+    def name_button(self) -> buttons.UtilityButton:
+        return buttons.get_utility_button(editor=self.editor,
+                                          **NAME_BTN)
+
+    @cached_property
+    def new_button(self) -> buttons.UtilityButton:
+        return buttons.get_utility_button(editor=self.editor,
+                                          **NEW_BTN)
+
+    @cached_property
+    def back_button(self) -> buttons.UtilityButton:
+        return buttons.get_utility_button(editor=self.editor,
+                                          **BACK_BTN_LARGE)
+
+    @cached_property
+    def ok_button(self) -> buttons.UtilityButton:
+        return buttons.get_utility_button(editor=self.editor,
+                                          **OK_BTN_LARGE)
 
     def pressed_ok_button(self) -> bool:
         """
@@ -73,17 +90,6 @@ class FileMenuRenderer:
         """
         return self.back_button.draw()
 
-    def draw_file_menu_button(self) -> None:
-        """
-            Blits File Menu button to the screen and sets the state to 'file_menu' if
-                the user clicks the button.
-
-            Returns:
-                None
-        """
-        if self.file_button.draw():
-            self.menu_controller.set_state("file_menu")
-
     def draw_file_menu(self) -> None:
         """
             Draws all buttons in the File Menu category to the screen and
@@ -99,6 +105,7 @@ class FileMenuRenderer:
         elif self.load_button.draw():
             self.menu_controller.set_state("close_sub_menus")
             self.menu_controller.set_state("loading_map")
+            self.open_load_map_menu()
 
         elif self.name_button.draw():
             self.menu_controller.set_state("close_sub_menus")
@@ -132,6 +139,24 @@ class FileMenuRenderer:
             actions.save_map(editor=self.editor)
             self.menu_controller.set_state("reset")
 
+    def open_load_map_menu(self) -> None:
+        """
+            Refreshes the map catalog and gets the names, metadata and thumbnails of the saved maps.
+            Only maps that changed since the last refresh are read.
+
+            Returns:
+                None.
+        """
+        map_catalog = self.editor.save_handler.map_catalog
+        self.saved_maps_names = map_catalog.refresh(open_map_name=self.editor.map_name)
+        self.saved_maps_info = {name: utils.get_map_info_text(entry=map_catalog.entries[name])
+                                for name in self.saved_maps_names}
+        self.saved_maps_thumbnails = {}
+        for name in self.saved_maps_names:
+            thumbnail = map_catalog.get_thumbnail(name=name)
+            if thumbnail is not None:
+                self.saved_maps_thumbnails[name] = utils.get_scaled_thumbnail(thumbnail=thumbnail)
+
     def draw_load_map_menu(self) -> None:
         """
             Draws load map menu to the screen,
@@ -174,6 +199,7 @@ class FileMenuRenderer:
     def draw_restart_map_menu(self) -> None:
         """
             Draws restart map menu to the screen.
+            Draws the canvas option to choose between a fixed size and an infinite new map.
             Draws OK and BACK buttons to the screen to restart the Editor or discard the changes
                 and switch back to the correct state after.
 
@@ -183,6 +209,9 @@ class FileMenuRenderer:
         self.popup_renderer.display_popup_title(text=self.popup_renderer.restart_map_title)
         self.popup_renderer.display_popup_info(text=self.popup_renderer.restart_map_info)
 
+        if self.popup_renderer.pressed_canvas_option():
+            self.editor.is_new_map_infinite = not self.editor.is_new_map_infinite
+
         if self.popup_renderer.pressed_back_button():
             self.menu_controller.set_state("reset")
 
@@ -9,7 +9,7 @@ from typing import Any
 
 import pygame
 
-from menu_manager.file_menu import utils, actions
+from menu_manager.file_menu import actions
 
 from utilities import fonts, render_text, helpers
 
@@ -22,24 +22,37 @@ def display_load_map(menu_renderer: Any) -> None:
 
         Uses:
            screen (pygame.display): Editor window.
-           saved_map_names (str): Map names to blit to screen.
+           saved_map_names (str): Map names to blit to screen, read from the map catalog
+               when the menu opened.
+           saved_maps_info (dict): Metadata per map.
+           saved_maps_thumbnails (dict): Thumbnail per map.
            font (pygame.font.Font): pygame.font object.
 
        Returns:
            None.
     """
-    menu_renderer.saved_maps_names = utils.get_saved_maps_names()
     saved_maps_outline_rects: list[pygame.rect.Rect] = []
 
     # Draw map names
     for i, name in enumerate(menu_renderer.saved_maps_names):
+        y_pos = i * SAVED_MAPS_Y_SPACING + SAVED_MAPS_Y
+        thumbnail = menu_renderer.saved_maps_thumbnails.get(name)
+        if thumbnail is not None:
+            menu_renderer.editor.screen.blit(thumbnail, (SAVED_MAPS_THUMBNAIL_X, y_pos))
+
         saved_map_text = render_text.position(screen=menu_renderer.editor.screen,
                                               text=str(name),
                                               font=fonts.load_map_font,
                                               color=SAVED_MAPS_COLOR,
                                               x_pos=SAVED_MAPS_X,
-                                              y_pos=i * SAVED_MAPS_Y_SPACING + SAVED_MAPS_Y,
+                                              y_pos=y_pos,
                                               get_rect=True)
+        render_text.position(screen=menu_renderer.editor.screen,
+                             text=menu_renderer.saved_maps_info.get(name, ""),
+                             font=fonts.load_map_info_font,
+                             color=SAVED_MAPS_INFO_COLOR,
+                             x_pos=SAVED_MAPS_X,
+                             y_pos=y_pos + SAVED_MAPS_INFO_Y_OFFSET)
 
         saved_map_rect = pygame.Rect(saved_map_text)
         selection_map_rect = helpers.get_enlarged_rect(rect=saved_map_rect,
@@ -91,24 +104,22 @@ def highlight_selected_map(menu_renderer: Any) -> None | str:
        Returns:
            Union[None, str].
     """
-    for i, outline_rect in enumerate(menu_renderer.saved_maps_outline_rects):
-        if outline_rect.collidepoint(menu_renderer.editor.mouse_pos):
-            pygame.draw.rect(
-                surface=menu_renderer.editor.screen,
-                color=SAVED_MAPS_HIGHLIGHT_COLOR,
-                rect=outline_rect,
-                width=SAVED_MAPS_HIGHLIGHT_WIDTH
-            )
-            if menu_renderer.clicked:
-                for event in menu_renderer.editor.events:
-                    if event.type == pygame.MOUSEBUTTONUP:
-                        menu_renderer.selected_map = menu_renderer.saved_maps_names[i]
-
-            if pygame.mouse.get_pressed()[0] == 1:
-                menu_renderer.clicked = True
-
-            else:
-                menu_renderer.clicked = False
+    input_dispatcher = menu_renderer.editor.input_dispatcher
+    input_dispatcher.register_entries(group="saved_maps",
+                                      rects=menu_renderer.saved_maps_outline_rects)
+
+    hovered = input_dispatcher.get_hovered_entry(group="saved_maps")
+    if hovered is not None:
+        pygame.draw.rect(
+            surface=menu_renderer.editor.screen,
+            color=SAVED_MAPS_HIGHLIGHT_COLOR,
+            rect=menu_renderer.saved_maps_outline_rects[hovered],
+            width=SAVED_MAPS_HIGHLIGHT_WIDTH
+        )
+
+    clicked = input_dispatcher.get_clicked_entry(group="saved_maps")
+    if clicked is not None:
+        menu_renderer.selected_map = menu_renderer.saved_maps_names[clicked]
 
 
 def display_rename(menu_renderer: Any) -> None:
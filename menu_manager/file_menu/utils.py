@@ -4,68 +4,57 @@ All functions return data.
 These functions do NOT interact with the program directly.
 """
 
-import os
-import pickle
-from typing import Any, Tuple
+import time
 
+import pygame
+
+from settings.menus import SAVED_MAPS_THUMBNAIL_SIZE
 from settings.paths import MAPS_DIR
+from utilities import map_catalog
 
 
 def get_saved_maps_names() -> list[str]:
     """
         Creates and returns a list with the names of the saved maps in the MAPS_DIR folder.
+        Journals, unfinished saves and the map catalog are skipped.
 
         Returns:
              List[str]: Names of all saved maps.
     """
-    return os.listdir(MAPS_DIR)
+    return map_catalog.get_map_names(maps_dir=MAPS_DIR)
 
 
-def get_deserialized_map_details(map_name: str) -> dict:
+def get_map_info_text(entry: dict) -> str:
     """
-        Deserialize a pickled map and load the attributes into a dict.
+        Gets the metadata of a map as shown in the load menu.
 
         Args:
-            map_name (str): Name of the map to deserialize.
+            entry (dict): MapCatalog entry of the map.
 
         Returns:
-             Dict: Dictionary containing attributes to update a class instance.
+            str: Dimensions, number of tiles, file size and modification date.
     """
-    load_data = get_loaded_map_details(map_name=map_name)
-
-    rows, columns, grid_size_x, grid_size_y, world_data = load_data
-
-    dict_updater = {
-        "scroll_x": 0,
-        "scroll_y": 0,
-        "map_name": map_name,
-        "temp_map_name": map_name,
-
-        "rows": rows,
-        "columns": columns,
-        "grid_size_x": grid_size_x,
-        "grid_size_y": grid_size_y,
-
-        "world_data": world_data,
-
-        "is_building": True,
-    }
+    if entry["is_infinite"]:
+        dimensions = "Infinite"
+    else:
+        dimensions = f"{entry['columns']}x{entry['rows']}"
+    modified = time.strftime("%Y-%m-%d %H:%M", time.localtime(entry["mtime_ns"] / 1e9))
 
-    return dict_updater
+    return f"{dimensions}  |  {entry['tile_count']} tiles  |  {entry['size'] / 1024:.0f} KB  |  {modified}"
 
 
-def get_loaded_map_details(map_name: str) -> Tuple[int, int, int, int, list[list[int]]]:
+def get_scaled_thumbnail(thumbnail: pygame.Surface) -> pygame.Surface:
     """
-        Loads map-dependent variables from a pickle file and deserializes it.
+        Scales a map thumbnail to fit SAVED_MAPS_THUMBNAIL_SIZE, keeping its aspect ratio.
 
         Args:
-            map_name (str): Name of the map to load.
+            thumbnail (pygame.Surface): Thumbnail with one pixel per cell.
 
         Returns:
-            list[int, int, int, int, list[list[int]]]: A list containing map-dependent variables.
+            pygame.Surface: Scaled thumbnail.
     """
-    pickle_in = open(os.path.join(MAPS_DIR, map_name),
-                     mode="rb")
-    load_data = pickle.load(pickle_in)
+    width, height = thumbnail.get_size()
+    factor = SAVED_MAPS_THUMBNAIL_SIZE / max(width, height)
 
-    return load_data
+    return pygame.transform.scale(thumbnail, (max(1, round(width * factor)),
+                                              max(1, round(height * factor))))
@@ -1,9 +1,23 @@
+import importlib
 from typing import Any, Self
 
-from menu_manager.popup_menu.renderer import PopupMenuRenderer
-from menu_manager.presets_menu.renderer import PresetsMenuRenderer
-from menu_manager.file_menu.renderer import FileMenuRenderer
-from menu_manager.edit_menu.renderer import EditMenuRenderer
+from settings.buttons import SETS_BTN, FILE_BTN, EDIT_BTN
+from settings.display import DEFERRED_INIT
+from settings.presets import PRESETS_MAX_NAME_LENGTH
+
+from utilities import buttons
+from utilities import general
+from utilities.preset_registry import registry
+from utilities.startup_timer import startup_timer
+
+
+# Attribute name -> (module, class) of the MenuRenderers
+RENDERERS = {
+    "popup_renderer": ("menu_manager.popup_menu.renderer", "PopupMenuRenderer"),
+    "presets_renderer": ("menu_manager.presets_menu.renderer", "PresetsMenuRenderer"),
+    "file_menu_renderer": ("menu_manager.file_menu.renderer", "FileMenuRenderer"),
+    "edit_menu_renderer": ("menu_manager.edit_menu.renderer", "EditMenuRenderer"),
+}
 
 
 class MenuController:
@@ -12,6 +26,8 @@ class MenuController:
         Draws Menu Category buttons to the screen,
             keeps track of all states and
             calls the correct MenuRenderer to handle the menu itself.
+        The Menu Category buttons are always visible and created with the MenuController.
+        With DEFERRED_INIT the MenuRenderers are imported and created the first time their menu opens.
 
         Args:
             editor (Any): Current Editor instance.
@@ -41,11 +57,116 @@ class MenuController:
         self.is_cropping_map = False
         self.is_wiping_map = False
 
+        # Buttons
+        self.sets_button = buttons.get_utility_button(editor=self.editor,
+                                                      **SETS_BTN)
+        self.file_button = buttons.get_utility_button(editor=self.editor,
+                                                      **FILE_BTN)
+        self.edit_button = buttons.get_utility_button(editor=self.editor,
+                                                      **EDIT_BTN)
+
         # Renderers
-        self.popup_renderer = PopupMenuRenderer(menu_controller=self)
-        self.presets_renderer = PresetsMenuRenderer(menu_controller=self)
-        self.file_menu_renderer = FileMenuRenderer(menu_controller=self)
-        self.edit_menu_renderer = EditMenuRenderer(menu_controller=self)
+        self.renderers: dict[str, Any] = {}
+        if not DEFERRED_INIT:
+            for name in RENDERERS:
+                self.get_renderer(name=name)
+
+    def get_renderer(self,
+                     name: str) -> Any:
+        """
+            Gets a MenuRenderer, it is imported and created the first time.
+
+            Args:
+                name (str): Attribute name of the MenuRenderer in RENDERERS.
+
+            Returns:
+                Any: The MenuRenderer.
+        """
+        renderer = self.renderers.get(name)
+        if renderer is None:
+            module_name, class_name = RENDERERS[name]
+            with startup_timer.phase("renderers"):
+                renderer_class = getattr(importlib.import_module(module_name), class_name)
+                renderer = renderer_class(menu_controller=self)
+            self.renderers[name] = renderer
+
+        return renderer
+
+    @property
+    def popup_renderer(self) -> Any:
+        return self.get_renderer(name="popup_renderer")
+
+    @property
+    def presets_renderer(self) -> Any:
+        return self.get_renderer(name="presets_renderer")
+
+    @property
+    def file_menu_renderer(self) -> Any:
+        return self.get_renderer(name="file_menu_renderer")
+
+    @property
+    def edit_menu_renderer(self) -> Any:
+        return self.get_renderer(name="edit_menu_renderer")
+
+    def draw_presets_button(self) -> None:
+        """
+            Blits Preset Menu button to the screen and sets the state to 'preset_menu' if
+                the user clicks the button.
+            Presets added, removed or changed on disk are picked up when the menu opens.
+
+            Returns:
+                None
+        """
+        if self.sets_button.draw():
+            if not self.is_displaying_presets and registry.refresh():
+                self.editor.preset_names = registry.get_preset_names()
+                self.editor.shortened_preset_names = general.limit_string_length(
+                    string_list=registry.get_preset_names(),
+                    max_length=PRESETS_MAX_NAME_LENGTH
+                )
+                if "presets_renderer" in self.renderers:
+                    self.presets_renderer.set_preset_names()
+            self.set_state("preset_menu")
+
+    def draw_file_menu_button(self) -> None:
+        """
+            Blits File Menu button to the screen and sets the state to 'file_menu' if
+                the user clicks the button.
+
+            Returns:
+                None
+        """
+        if self.file_button.draw():
+            self.set_state("file_menu")
+
+    def draw_edit_menu_button(self) -> None:
+        """
+            Draws the Edit Menu button to the screen and sets the MenuController state to
+                the 'edit_menu' state if the user clicked on it.
+
+            Returns:
+                None.
+        """
+        if self.edit_button.draw():
+            self.set_state("edit_menu")
+
+    def get_state(self) -> tuple:
+        """
+            Gets all Menu state attributes so changes can be detected.
+
+            Returns:
+                tuple: Current Menu states.
+        """
+        return (self.is_displaying_presets,
+                self.is_in_file_menu,
+                self.is_in_edit_menu,
+                self.is_saving_map,
+                self.is_loading_map,
+                self.is_renaming_map,
+                self.is_restarting_map,
+                self.is_changing_preferences,
+                self.is_cropping_map,
+                self.is_wiping_map)
 
     def set_state(self,
                   state: str) -> None:
@@ -141,14 +262,14 @@ class MenuController:
                  None
         """
         # Presets
-        self.presets_renderer.draw_presets_button()
+        self.draw_presets_button()
 
         if self.editor.is_displaying_presets:
             self.presets_renderer.draw_presets_menu()
 
         # Menu buttons
-        self.file_menu_renderer.draw_file_menu_button()
-        self.edit_menu_renderer.draw_edit_menu_button()
+        self.draw_file_menu_button()
+        self.draw_edit_menu_button()
 
         # File Menu
         if self.is_in_file_menu:
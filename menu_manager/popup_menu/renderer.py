@@ -1,9 +1,13 @@
+from functools import cached_property
 from typing import Any
 
+import pygame
+
 import utilities.buttons as buttons
 import utilities.fonts as fonts
 import utilities.render_text as render_text
 import utilities.general as utilities
+import utilities.helpers as helpers
 
 from settings.buttons import BACK_BTN_SMALL, OK_BTN_SMALL
 from settings.menus import *
@@ -40,17 +44,62 @@ class PopupMenuRenderer:
         self.wipe_map_title = "Restart map"
         self.wipe_map_info = "Removes all tiles from the map."
 
-        self.back_button = buttons.get_utility_button(editor=self.editor,
-                                                      **BACK_BTN_SMALL)
-        self.ok_button = buttons.get_utility_button(editor=self.editor,
-                                                    **OK_BTN_SMALL)
+    # Buttons of the menu, created the first time the menu is drawn
+    @cached_property
+    def back_button(self) -> buttons.UtilityButton:
+        return buttons.get_utility_button(editor=self.editor,
+                                          **BACK_BTN_SMALL)
 
-        # Trackers
-        self.clicked = False
+    @cached_property
+    def ok_button(self) -> buttons.UtilityButton:
+        return buttons.get_utility_button(editor=self.editor,
+                                          **OK_BTN_SMALL)
 
     def set_save_map_info(self) -> None:
         self.save_map_info = f"{utilities.limit_string_length(string_list=self.editor.map_name, max_length=15)}"
 
+    def get_canvas_text(self) -> str:
+        """
+            Returns the restart popup option text of the canvas new maps start with.
+
+            Returns:
+                str: Canvas option text.
+        """
+        if self.editor.is_new_map_infinite:
+            return "Canvas: infinite"
+        return "Canvas: fixed size"
+
+    def pressed_canvas_option(self) -> bool:
+        """
+            Draws the canvas option on the screen, highlights it on hover and returns True
+                if the user clicked on it, False otherwise.
+
+            Returns:
+                bool: True if user clicked, False otherwise.
+        """
+        option_text = render_text.position(screen=self.editor.screen,
+                                           text=self.get_canvas_text(),
+                                           font=fonts.popup_font,
+                                           color=POPUP_MENU_COLOR,
+                                           x_pos=POPUP_MENU_OPTION_X,
+                                           y_pos=POPUP_MENU_OPTION_Y,
+                                           get_rect=True)
+        outline_rect = helpers.get_enlarged_rect(rect=pygame.Rect(option_text),
+                                                 pixels=POPUP_MENU_HIGHLIGHT_WIDTH * 2)
+        input_dispatcher = self.editor.input_dispatcher
+        input_dispatcher.register_entries(group="canvas_option",
+                                          rects=[outline_rect])
+
+        if input_dispatcher.get_hovered_entry(group="canvas_option") is not None:
+            pygame.draw.rect(
+                surface=self.editor.screen,
+                color=POPUP_MENU_HIGHLIGHT_COLOR,
+                rect=outline_rect,
+                width=POPUP_MENU_HIGHLIGHT_WIDTH
+            )
+
+        return input_dispatcher.get_clicked_entry(group="canvas_option") is not None
+
     def pressed_ok_button(self) -> bool:
         """
             Draws an OK button on the screen and returns True if the user clicked
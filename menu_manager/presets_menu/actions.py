@@ -28,8 +28,9 @@ def load_new_preset(editor: Any,
     editor.current_preset = selected_preset
     editor.current_tile = 0
 
-    editor.current_object = general.get_tile_indexes(
-        preset_name=editor.current_preset)[0]
+    editor.tile_indexes = general.get_tile_indexes(
+        preset_name=editor.current_preset)
+    editor.current_object = editor.tile_indexes[0]
     editor.tile_list = sprites.get_preset_sprites(
         preset_name=editor.current_preset
     )
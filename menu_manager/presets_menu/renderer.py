@@ -6,9 +6,7 @@ from menu_manager.presets_menu import screens, actions
 from menu_manager.presets_menu import utis
 
 from utilities import general
-from utilities import buttons
 
-from settings.buttons import SETS_BTN
 from settings.presets import PRESETS_MAX_NAME_LENGTH
 
 
@@ -19,7 +17,7 @@ class PresetsMenuRenderer:
         """
             Responsible for rendering all Preset Menu features and controlling the user interaction
                 with the Editor.
-            Draws Preset Menu buttons to the screen depending on MenuController state,
+            Draws the Preset Menu to the screen depending on MenuController state,
                 sets the correct  MenuController state,
                 loads the correct screen and
                 applies changes to the Editor.
@@ -29,30 +27,23 @@ class PresetsMenuRenderer:
         self.menu_controller = menu_controller
 
         # Info
-        self.preset_names: list[str] = utis.get_presets_dir_names()
-        self.shortened_preset_names: list[str] = general.limit_string_length(
-            string_list=self.preset_names,
-            max_length=PRESETS_MAX_NAME_LENGTH
-        )
+        self.preset_names: list[str] = []
+        self.shortened_preset_names: list[str] = []
+        self.set_preset_names()
         self.preset_names_outline_rects: list[pygame.rect.Rect] = []
 
-        # Buttons
-        self.sets_button = buttons.get_utility_button(editor=self.editor,
-                                                      **SETS_BTN)
-
-        # Trackers
-        self.clicked = False
-
-    def draw_presets_button(self) -> None:
+    def set_preset_names(self) -> None:
         """
-            Blits Preset Menu button to the screen and sets the state to 'preset_menu' if
-                the user clicks the button.
+            Gets the names of the presets from the preset registry.
 
             Returns:
                 None
         """
-        if self.sets_button.draw():
-            self.menu_controller.set_state("preset_menu")
+        self.preset_names = utis.get_presets_dir_names()
+        self.shortened_preset_names = general.limit_string_length(
+            string_list=self.preset_names,
+            max_length=PRESETS_MAX_NAME_LENGTH
+        )
 
     def draw_presets_menu(self) -> None:
         """
@@ -49,9 +49,9 @@ def display_presets_previews(presets_renderer: Any) -> None:
             None
     """
     for i, name in enumerate(presets_renderer.preset_names):
-        preview_img = pygame.transform.scale(surface=sprites.get_preview_image(preset_name=name),
-                                             size=(PREVIEW_WIDTH,
-                                                   PREVIEW_HEIGHT))
+        preview_img = sprites.get_preview_image(preset_name=name,
+                                                size=(PREVIEW_WIDTH,
+                                                      PREVIEW_HEIGHT))
         presets_renderer.editor.screen.blit(source=preview_img,
                                             dest=(PREVIEW_X,
                                                   PREVIEW_Y + i * PRESETS_NAME_Y_SPACING))
@@ -64,30 +64,29 @@ def highlight_selected_preset(presets_renderer: Any) -> None | str:
        Returns:
            None.
     """
-    for i, outline_rect in enumerate(presets_renderer.preset_names_outline_rects):
-
-        if outline_rect.collidepoint(presets_renderer.editor.mouse_pos):
-            pygame.draw.rect(
-                surface=presets_renderer.editor.screen,
-                color=PRESETS_HIGHLIGHT_COLOR,
-                rect=(outline_rect[0] + PRESETS_HIGHLIGHT_LEFT_OFFSET,
-                      outline_rect[1] + PRESETS_HIGHLIGHT_TOP_OFFSET * 1.5,
-                      outline_rect[2] - 16,
-                      outline_rect[3] + PRESETS_HIGHLIGHT_BOTTOM_OFFSET * 3),
-                width=PRESETS_HIGHLIGHT_WIDTH
-            )
-
-            # Selection on mouse release so need to check for previous mouse press
-            if presets_renderer.clicked:
-                for event in presets_renderer.editor.events:
-                    if event.type == pygame.MOUSEBUTTONUP:
-                        return presets_renderer.preset_names[i]
-
-            if pygame.mouse.get_pressed()[0] == 1:
-                presets_renderer.clicked = True
-
-            else:
-                presets_renderer.clicked = False
-
-    # No hover detected
+    input_dispatcher = presets_renderer.editor.input_dispatcher
+    input_dispatcher.register_entries(group="presets",
+                                      rects=presets_renderer.preset_names_outline_rects)
+
+    hovered = input_dispatcher.get_hovered_entry(group="presets")
+    if hovered is None:
+        # No hover detected
+        return None
+
+    outline_rect = presets_renderer.preset_names_outline_rects[hovered]
+    pygame.draw.rect(
+        surface=presets_renderer.editor.screen,
+        color=PRESETS_HIGHLIGHT_COLOR,
+        rect=(outline_rect[0] + PRESETS_HIGHLIGHT_LEFT_OFFSET,
+              outline_rect[1] + PRESETS_HIGHLIGHT_TOP_OFFSET * 1.5,
+              outline_rect[2] - 16,
+              outline_rect[3] + PRESETS_HIGHLIGHT_BOTTOM_OFFSET * 3),
+        width=PRESETS_HIGHLIGHT_WIDTH
+    )
+
+    # Selection on mouse release of a press on the same preset
+    clicked = input_dispatcher.get_clicked_entry(group="presets")
+    if clicked is not None:
+        return presets_renderer.preset_names[clicked]
+
     return None
@@ -1,17 +1,17 @@
-import os
-
 from settings.presets import PRESETS_MAX_NAME_LENGTH
-from settings.paths import PRESETS_DIR
+
+from utilities.preset_registry import registry
 
 
 def get_presets_dir_names() -> list[str]:
     """
        Creates and returns a list of folders in the PRESETS_DIR folder.
+       The folders are scanned once by the preset registry.
 
        Returns:
            List[str]: List of names of folders in the PRESETS_DIR folder.
        """
-    return sorted([f.name for f in os.scandir(PRESETS_DIR) if f.is_dir()])
+    return registry.get_preset_names()
 
 
 def get_shortened_presets_dir_names(names: list[str]) -> list[str]:
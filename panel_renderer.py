@@ -0,0 +1,139 @@
+from typing import Any, Self
+
+import pygame
+
+from settings.display import *
+from settings.presets import *
+
+import utilities.fonts as fonts
+import utilities.render_text as render_text
+
+
+class PanelLayer:
+    """
+        Offscreen surface holding the static contents of a panel.
+        The layer is composed again only when its key changes, other frames blit it as is.
+
+        Args:
+            rect (tuple[int, int, int, int]): Position and size of the panel in the window.
+
+        Returns:
+            Self.
+    """
+
+    def __init__(self,
+                 rect: tuple[int, int, int, int]) -> Self:
+        self.rect = pygame.Rect(rect)
+        self.surface = pygame.Surface(self.rect.size).convert()
+        self.key: tuple | None = None
+
+        # Statistics
+        self.compositions = 0
+
+    def is_outdated(self,
+                    key: tuple) -> bool:
+        return key != self.key
+
+    def set_composed(self,
+                     key: tuple) -> None:
+        self.key = key
+        self.compositions += 1
+
+
+class PanelRenderer:
+    """
+        Responsible for drawing the right and bottom panels to the screen.
+        Each panel is a PanelLayer, composed when the selected tile, the preset or the menu state
+            changes and blitted in a single call on all other frames.
+        Buttons on top of the panels draw themselves from images prepared per hover state,
+            see UtilityButton.
+
+        Args:
+            editor (Any): Current Editor instance.
+
+        Returns:
+            Self.
+    """
+
+    def __init__(self,
+                 editor: Any) -> Self:
+        self.editor = editor
+
+        self.right_panel = PanelLayer(rect=RIGHT_PANEL_RECT)
+        self.bottom_panel = PanelLayer(rect=BOTTOM_PANEL_RECT)
+
+    def get_right_panel_key(self) -> tuple:
+        """
+            Gets all Editor attributes shown in the right panel.
+            The tile buttons and names are copied, so changing the lists in place also outdates the layer.
+            The images of the tile buttons are part of the key too, so an image replaced on
+                an existing button outdates the layer as well.
+
+            Returns:
+                tuple: Current right panel state.
+        """
+        editor = self.editor
+        return (editor.is_building,
+                editor.is_displaying_presets,
+                editor.current_preset,
+                editor.current_tile,
+                tuple(editor.tile_buttons),
+                tuple(button.image for button in editor.tile_buttons),
+                tuple(editor.tile_names))
+
+    def compose_tiles(self,
+                      surface: pygame.Surface) -> None:
+        """
+            Draws the tile buttons, their labels and the highlight of the selected tile
+                on the right panel layer.
+            Limits the number of tiles to MAX_NR_TILES.
+
+            Args:
+                surface (pygame.Surface): Surface of the right panel layer.
+        """
+        editor = self.editor
+        offset_x, offset_y = -self.right_panel.rect.x, -self.right_panel.rect.y
+        for button, label in zip(editor.tile_buttons[:MAX_NR_TILES], editor.tile_names[:MAX_NR_TILES]):
+            surface.blit(button.image, button.rect.move(offset_x, offset_y))
+            render_text.position(screen=surface,
+                                 text=str(label),
+                                 font=fonts.label_font,
+                                 color=TILE_LABEL_COLOR,
+                                 x_pos=button.rect.x + offset_x,
+                                 y_pos=button.rect.y + offset_y - TILE_LABEL_Y_OFFSET)
+
+        if editor.current_tile < len(editor.tile_buttons[:MAX_NR_TILES]):
+            selected_rect = editor.tile_buttons[editor.current_tile].rect
+            pygame.draw.rect(
+                surface=surface,
+                color=TILE_HIGHLIGHT_COLOR,
+                rect=(selected_rect.x + offset_x + TILE_HIGHLIGHT_LEFT_OFFSET,
+                      selected_rect.y + offset_y + TILE_HIGHLIGHT_LEFT_OFFSET,
+                      TILE_SIZE_X + TILE_HIGHLIGHT_RIGHT_OFFSET,
+                      TILE_SIZE_Y + TILE_HIGHLIGHT_RIGHT_OFFSET),
+                width=TILE_HIGHLIGHT_WIDTH)
+
+    def draw_right_panel(self) -> None:
+        """
+            Blits the right panel layer to the screen, composing it first if it is outdated.
+            Tiles are shown while building and the Preset Menu is closed.
+        """
+        key = self.get_right_panel_key()
+        if self.right_panel.is_outdated(key=key):
+            self.right_panel.surface.fill(RIGHT_PANEL_COLOR)
+            if self.editor.is_building and not self.editor.is_displaying_presets:
+                self.compose_tiles(surface=self.right_panel.surface)
+            self.right_panel.set_composed(key=key)
+
+        self.editor.screen.blit(self.right_panel.surface, self.right_panel.rect)
+
+    def draw_bottom_panel(self) -> None:
+        """
+            Blits the bottom panel layer to the screen, composing it first if it is outdated.
+        """
+        key = ()
+        if self.bottom_panel.is_outdated(key=key):
+            self.bottom_panel.surface.fill(BOTTOM_PANEL_COLOR)
+            self.bottom_panel.set_composed(key=key)
+
+        self.editor.screen.blit(self.bottom_panel.surface, self.bottom_panel.rect)
@@ -0,0 +1,409 @@
+import os
+import queue
+import threading
+import time
+from typing import Any, Self
+
+import pygame
+
+from settings.paths import MAPS_DIR
+from settings.map_file import *
+
+from utilities import map_catalog, map_format, map_journal
+from utilities.map_catalog import MapCatalog
+
+
+# Posted by the save thread when a save finished so an idle Editor updates its caption
+SAVE_FINISHED = pygame.event.custom_type()
+
+
+class SaveJob:
+    """
+        A map save waiting for the save thread.
+
+        Args:
+            path (str): Path of the map file.
+            world_data (Any): Snapshot of world_data.
+            rows (int): Number of rows.
+            columns (int): Number of columns.
+            grid_size_x (int): Width of a cell.
+            grid_size_y (int): Height of a cell.
+            is_autosave (bool): Whether the save was started by the autosave.
+            journal_paths (list[str]): Journals folded into this save, removed once it is written.
+
+        Returns:
+            Self.
+    """
+
+    def __init__(self,
+                 path: str,
+                 world_data: Any,
+                 rows: int,
+                 columns: int,
+                 grid_size_x: int,
+                 grid_size_y: int,
+                 is_autosave: bool,
+                 journal_paths: list[str]) -> Self:
+        self.path = path
+        self.world_data = world_data
+        self.rows = rows
+        self.columns = columns
+        self.grid_size_x = grid_size_x
+        self.grid_size_y = grid_size_y
+        self.is_autosave = is_autosave
+        self.journal_paths = journal_paths
+
+
+class SyncJob:
+    """
+        A journal waiting for the save thread to sync it to disk.
+
+        Args:
+            fd (int): Duplicated file descriptor of the journal, closed once it is synced.
+            name (str): Name of the map.
+            is_autosave (bool): Whether the save was started by the autosave.
+            start (float): time.perf_counter() when the save started.
+            world_data (Any): Snapshot of the committed world_data for the map catalog,
+                None for an autosave.
+            rows (int): Number of rows.
+            columns (int): Number of columns.
+
+        Returns:
+            Self.
+    """
+
+    def __init__(self,
+                 fd: int,
+                 name: str,
+                 is_autosave: bool,
+                 start: float,
+                 world_data: Any = None,
+                 rows: int = 0,
+                 columns: int = 0) -> Self:
+        self.fd = fd
+        self.name = name
+        self.is_autosave = is_autosave
+        self.start = start
+        self.world_data = world_data
+        self.rows = rows
+        self.columns = columns
+
+
+class SaveHandler:
+    """
+        Saves maps on a background thread so the frame loop never waits for
+            serializing, compressing or writing a map.
+        The Editor only takes a snapshot of world_data and the map attributes, the save thread
+            writes it to a temporary file and renames it over the map file.
+        Saved maps keep an edit journal (see map_journal), saving them only commits and syncs the
+            journal until it grows beyond MAP_JOURNAL_COMPACT_BYTES and is folded into a full save.
+        Unsaved edits are autosaved after AUTOSAVE_INTERVAL_MS or AUTOSAVE_EDIT_COUNT tile changes,
+            by syncing the journal without committing it or, for maps without one, into
+            AUTOSAVE_GENERATIONS rotating '<map name>.autosave<n>' files.
+        Autosaves never change the map file, they are only used to recover from a crash.
+        Progress and the duration of the last save are shown in the window caption.
+
+        Args:
+            editor (Any): Current Editor instance.
+
+        Returns:
+            Self.
+    """
+
+    def __init__(self,
+                 editor: Any) -> Self:
+        self.editor = editor
+
+        self.AUTOSAVE = AUTOSAVE
+        self.AUTOSAVE_INTERVAL_MS = AUTOSAVE_INTERVAL_MS
+        self.AUTOSAVE_EDIT_COUNT = AUTOSAVE_EDIT_COUNT
+        self.AUTOSAVE_GENERATIONS = AUTOSAVE_GENERATIONS
+        self.SAVE_STATUS_DURATION_MS = SAVE_STATUS_DURATION_MS
+        self.MAP_JOURNAL = MAP_JOURNAL
+        self.MAP_JOURNAL_COMPACT_BYTES = MAP_JOURNAL_COMPACT_BYTES
+
+        # Updated by the save thread, read when the load menu opens
+        self.map_catalog = MapCatalog(maps_dir=MAPS_DIR)
+
+        self.jobs: queue.Queue[SaveJob | SyncJob | None] = queue.Queue()
+        self.thread = threading.Thread(target=self.work,
+                                       name="SaveHandler",
+                                       daemon=True)
+        self.thread.start()
+
+        # Written by the save thread, read by the frame loop
+        self.status_lock = threading.Lock()
+        self.status = ""
+        self.status_time = 0
+        self.last_save_ms = 0.0
+
+        # Edits since the last save
+        self.tracked_world_data: Any = None
+        self.tracked_revision = 0
+        self.edit_count = 0
+        self.last_save_time = 0
+        self.autosave_generation = 0
+        self.reset()
+
+    def save(self,
+             path: str,
+             is_autosave: bool = False,
+             journal_paths: list[str] | None = None) -> None:
+        """
+            Takes a snapshot of the map and hands it to the save thread.
+
+            Args:
+                path (str): Path of the map file.
+                is_autosave (bool): Whether the save was started by the autosave.
+                journal_paths (list[str] | None): Journals folded into this save.
+        """
+        editor = self.editor
+        self.jobs.put(SaveJob(path=path,
+                              world_data=self.editor.world_data.copy(),
+                              rows=editor.rows,
+                              columns=editor.columns,
+                              grid_size_x=editor.grid_size_x,
+                              grid_size_y=editor.grid_size_y,
+                              is_autosave=is_autosave,
+                              journal_paths=journal_paths or []))
+        self.set_status(status="Autosaving..." if is_autosave else "Saving...")
+        self.mark_saved()
+
+    def mark_saved(self) -> None:
+        self.track_edits()
+        self.edit_count = 0
+        self.last_save_time = pygame.time.get_ticks()
+
+    def save_map(self,
+                 is_autosave: bool = False) -> None:
+        """
+            Saves the current map under its name.
+            If the map has a small journal only the journal is committed and the save thread syncs it,
+                otherwise the map is fully saved and a new journal is started.
+            An autosave only syncs the journal, its edits stay unsaved.
+
+            Args:
+                is_autosave (bool): Whether the save was started by the autosave.
+        """
+        editor = self.editor
+        path = os.path.join(MAPS_DIR, editor.map_name)
+        journal = editor.journal
+
+        if journal.map_path == path and (is_autosave or journal.size < self.MAP_JOURNAL_COMPACT_BYTES):
+            start = time.perf_counter()
+            try:
+                if not is_autosave:
+                    journal.commit()
+                fd = journal.get_sync_fd()
+            except OSError as error:
+                self.set_status(status=f"Saving '{editor.map_name}' failed: {error}")
+                return
+
+            if fd is not None:
+                self.jobs.put(SyncJob(fd=fd,
+                                      name=editor.map_name,
+                                      is_autosave=is_autosave,
+                                      start=start,
+                                      world_data=None if is_autosave else editor.world_data.copy(),
+                                      rows=editor.rows,
+                                      columns=editor.columns))
+                self.set_status(status="Autosaving..." if is_autosave else "Saving...")
+            self.mark_saved()
+            return
+
+        journal_paths = []
+        if self.MAP_JOURNAL:
+            journal_paths = journal.start(map_name=editor.map_name,
+                                          map_path=path)
+        self.save(path=path,
+                  is_autosave=is_autosave,
+                  journal_paths=journal_paths)
+
+    def open_journal(self) -> None:
+        """
+            Continues the journal of the current map after it was loaded,
+                the journal file is opened on the first edit.
+        """
+        if self.MAP_JOURNAL:
+            self.editor.journal.attach(map_name=self.editor.map_name,
+                                       map_path=os.path.join(MAPS_DIR, self.editor.map_name))
+
+    def autosave(self) -> None:
+        """
+            Syncs the journal of the current map, or saves the current map into the next of
+                the rotating autosave files if it has no journal.
+        """
+        if self.editor.journal.map_name == self.editor.map_name:
+            self.save_map(is_autosave=True)
+            return
+
+        path = map_catalog.get_autosave_path(map_path=os.path.join(MAPS_DIR, self.editor.map_name),
+                                             generation=self.autosave_generation)
+        self.autosave_generation = (self.autosave_generation + 1) % self.AUTOSAVE_GENERATIONS
+        self.save(path=path,
+                  is_autosave=True)
+
+    def set_status(self,
+                   status: str) -> None:
+        with self.status_lock:
+            self.status = status
+            self.status_time = pygame.time.get_ticks()
+
+    def get_status(self) -> str:
+        """
+            Gets the save progress or the result of the last save,
+                results are cleared after SAVE_STATUS_DURATION_MS.
+
+            Returns:
+                str: Text for the window caption.
+        """
+        with self.status_lock:
+            if self.jobs.unfinished_tasks == 0 and \
+                    pygame.time.get_ticks() - self.status_time > self.SAVE_STATUS_DURATION_MS:
+                return ""
+
+            return self.status
+
+    def work(self) -> None:
+        """
+            Runs on the save thread, writes the queued jobs in order.
+        """
+        while True:
+            job = self.jobs.get()
+            if job is None:
+                self.jobs.task_done()
+                return
+
+            if isinstance(job, SyncJob):
+                self.sync(job=job)
+                continue
+
+            name = os.path.basename(job.path)
+            self.set_status(status=f"Saving '{name}'...")
+            start = time.perf_counter()
+            try:
+                map_format.save_map(path=job.path,
+                                    world_data=job.world_data,
+                                    rows=job.rows,
+                                    columns=job.columns,
+                                    grid_size_x=job.grid_size_x,
+                                    grid_size_y=job.grid_size_y)
+            except (OSError, ValueError) as error:
+                self.set_status(status=f"Saving '{name}' failed: {error}")
+            else:
+                # The map file now holds all changes of the folded journals
+                map_journal.remove_journals(paths=job.journal_paths)
+                self.last_save_ms = (time.perf_counter() - start) * 1000
+                self.set_status(status=f"Saved '{name}' in {self.last_save_ms:.0f} ms")
+                if not job.is_autosave:
+                    self.update_catalog(name=name,
+                                        rows=job.rows,
+                                        columns=job.columns,
+                                        world_data=job.world_data)
+            finally:
+                self.jobs.task_done()
+                pygame.event.post(pygame.event.Event(SAVE_FINISHED))
+
+    def sync(self,
+             job: SyncJob) -> None:
+        """
+            Runs on the save thread, waits until a committed journal is on disk and
+                updates the catalog entry of the map.
+
+            Args:
+                job (SyncJob): Journal to sync.
+        """
+        try:
+            os.fsync(job.fd)
+        except OSError as error:
+            self.set_status(status=f"Saving '{job.name}' failed: {error}")
+        else:
+            self.last_save_ms = (time.perf_counter() - job.start) * 1000
+            self.set_status(status=f"{'Autosaved' if job.is_autosave else 'Saved'} '{job.name}' "
+                                   f"to its journal in {self.last_save_ms:.0f} ms")
+            if not job.is_autosave:
+                self.update_catalog(name=job.name,
+                                    rows=job.rows,
+                                    columns=job.columns,
+                                    world_data=job.world_data)
+        finally:
+            os.close(job.fd)
+            self.jobs.task_done()
+            pygame.event.post(pygame.event.Event(SAVE_FINISHED))
+
+    def update_catalog(self,
+                       name: str,
+                       rows: int,
+                       columns: int,
+                       world_data: Any) -> None:
+        """
+            Updates the map catalog entry of a saved map, after a full save or a journal commit.
+            A failed update is repaired when the load menu refreshes the catalog.
+
+            Args:
+                name (str): Name of the map.
+                rows (int): Number of rows.
+                columns (int): Number of columns.
+                world_data (Any): world_data that was saved.
+        """
+        try:
+            self.map_catalog.update_entry(name=name,
+                                          rows=rows,
+                                          columns=columns,
+                                          world_data=world_data)
+        except (OSError, pygame.error):
+            pass
+
+    def track_edits(self) -> None:
+        """
+            Counts tile changes since the last call.
+            Replacing world_data (wipe, crop, resize, load) counts as a single change.
+        """
+        world_data = self.editor.world_data
+        if world_data is not self.tracked_world_data:
+            self.edit_count += 1
+            self.tracked_world_data = world_data
+        else:
+            self.edit_count += world_data.revision - self.tracked_revision
+
+        self.tracked_revision = world_data.revision
+
+    def reset(self) -> None:
+        """
+            Marks the current map as saved.
+            Is called after a map is loaded or a new map is started.
+        """
+        self.tracked_world_data = self.editor.world_data
+        self.tracked_revision = self.editor.world_data.revision
+        self.edit_count = 0
+        self.last_save_time = pygame.time.get_ticks()
+
+    def update(self) -> None:
+        """
+            Starts an autosave when there are unsaved edits and either AUTOSAVE_INTERVAL_MS passed
+                or AUTOSAVE_EDIT_COUNT tiles changed since the last save.
+            Writes the changes of this frame to the journal.
+            Is called every frame, also while the Editor is idle.
+        """
+        journal = self.editor.journal
+        if journal.is_attached and journal.map_name != self.editor.map_name:
+            # A renamed map is a new map until it is saved
+            journal.close()
+        journal.flush()
+
+        self.track_edits()
+        if not self.AUTOSAVE or self.edit_count == 0:
+            return
+
+        if self.edit_count >= self.AUTOSAVE_EDIT_COUNT or \
+                pygame.time.get_ticks() - self.last_save_time >= self.AUTOSAVE_INTERVAL_MS:
+            self.autosave()
+
+    def stop(self) -> None:
+        """
+            Waits for all queued saves and stops the save thread.
+            Is called when the Editor quits, unsaved edits are removed from the journal.
+        """
+        self.jobs.put(None)
+        self.thread.join()
+        self.editor.journal.close()
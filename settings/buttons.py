@@ -1,9 +1,10 @@
-from utilities.sprites import *
+from settings.setup import *
 
 
 BUTTON_WIDTH = 64
 BUTTON_HEIGHT = 32
 
+BUTTON_IDLE_ALPHA = 200  # buttons are opaque while hovered
 BUTTON_HIGHLIGHT_COLOR = RED
 BUTTON_HIGHLIGHT_WIDTH = 4
 BUTTON_MARGIN_X = 16
@@ -77,11 +78,13 @@ ZOOM_IN_BUTTON_Y = TEST_BUTTON_Y
 ZOOM_OUT_BUTTON_X = REDO_BUTTON_X
 ZOOM_OUT_BUTTON_Y = TEST_BUTTON_Y
 
+# Button images are file names in IMAGES_DIR, loaded when the button is created
+
 # Presets Buttons
 SETS_BTN = {
     "x": SETS_BUTTON_X,
     "y": SETS_BUTTON_Y,
-    "image": sets_button_image,
+    "image": "sets_btn.png",
     "scale": 1,
     "name": "sets_btn",
 }
@@ -90,7 +93,7 @@ SETS_BTN = {
 FILE_BTN = {
     "x": FILE_BUTTON_X,
     "y": FILE_BUTTON_Y,
-    "image": file_button_image,
+    "image": "file_btn.png",
     "scale": 1,
     "name": "file_btn",
 }
@@ -98,7 +101,7 @@ FILE_BTN = {
 EDIT_BTN = {
     "x": EDIT_BUTTON_X,
     "y": EDIT_BUTTON_Y,
-    "image": edit_button_image,
+    "image": "edit_btn.png",
     "scale": 1,
     "name": "edit_btn",
 }
@@ -107,7 +110,7 @@ EDIT_BTN = {
 SAVE_BTN = {
     "x": SAVE_BUTTON_X,
     "y": SAVE_BUTTON_Y,
-    "image": save_button_image,
+    "image": "save_btn.png",
     "scale": 1,
     "name": "save_btn",
 }
@@ -115,7 +118,7 @@ SAVE_BTN = {
 LOAD_BTN = {
     "x": LOAD_BUTTON_X,
     "y": LOAD_BUTTON_Y,
-    "image": load_button_image,
+    "image": "load_btn.png",
     "scale": 1,
     "name": "load_btn",
 }
@@ -123,7 +126,7 @@ LOAD_BTN = {
 NEW_BTN = {
     "x": NEW_BUTTON_X,
     "y": NEW_BUTTON_Y,
-    "image": new_button_image,
+    "image": "new_btn.png",
     "scale": 1,
     "name": "new_btn",
 }
@@ -131,7 +134,7 @@ NEW_BTN = {
 NAME_BTN = {
     "x": NAME_BUTTON_X,
     "y": NAME_BUTTON_Y,
-    "image": name_button_image,
+    "image": "name_btn.png",
     "scale": 1,
     "name": "name_btn",
 }
@@ -140,7 +143,7 @@ NAME_BTN = {
 PREF_BTN = {
     "x": PREF_BUTTON_X,
     "y": PREF_BUTTON_Y,
-    "image": pref_button_image,
+    "image": "pref_btn.png",
     "scale": 1,
     "name": "pref_btn",
 }
@@ -148,7 +151,7 @@ PREF_BTN = {
 CROP_BTN = {
     "x": CROP_BUTTON_X,
     "y": CROP_BUTTON_Y,
-    "image": crop_button_image,
+    "image": "crop_btn.png",
     "scale": 1,
     "name": "crop_btn",
 }
@@ -156,7 +159,7 @@ CROP_BTN = {
 WIPE_BTN = {
     "x": WIPE_BUTTON_X,
     "y": WIPE_BUTTON_Y,
-    "image": wipe_button_image,
+    "image": "wipe_btn.png",
     "scale": 1,
     "name": "wipe_btn",
 }
@@ -165,7 +168,7 @@ WIPE_BTN = {
 BACK_BTN_LARGE = {
     "x": BACK_BUTTON_LARGE_X,
     "y": BACK_BUTTON_LARGE_Y,
-    "image": back_button_image,
+    "image": "back_btn.png",
     "scale": 1,
     "name": "back_btn",
 }
@@ -173,7 +176,7 @@ BACK_BTN_LARGE = {
 OK_BTN_LARGE = {
     "x": OK_BUTTON_LARGE_X,
     "y": OK_BUTTON_LARGE_Y,
-    "image": ok_button_image,
+    "image": "ok_btn.png",
     "scale": 1,
     "name": "ok_btn",
 }
@@ -181,7 +184,7 @@ OK_BTN_LARGE = {
 BACK_BTN_SMALL = {
     "x": BACK_BUTTON_SMALL_X,
     "y": BACK_BUTTON_SMALL_Y,
-    "image": back_button_image,
+    "image": "back_btn.png",
     "scale": 1,
     "name": "back_btn",
 }
@@ -189,7 +192,7 @@ BACK_BTN_SMALL = {
 OK_BTN_SMALL = {
     "x": OK_BUTTON_SMALL_X,
     "y": OK_BUTTON_SMALL_Y,
-    "image": ok_button_image,
+    "image": "ok_btn.png",
     "scale": 1,
     "name": "ok_btn",
 }
@@ -198,7 +201,7 @@ OK_BTN_SMALL = {
 UNDO_BTN = {
     "x": UNDO_BUTTON_X,
     "y": UNDO_BUTTON_Y,
-    "image": undo_button_image,
+    "image": "undo_btn.png",
     "scale": 1,
     "name": "undo_btn",
 }
@@ -206,7 +209,7 @@ UNDO_BTN = {
 REDO_BTN = {
     "x": REDO_BUTTON_X,
     "y": REDO_BUTTON_Y,
-    "image": redo_button_image,
+    "image": "redo_btn.png",
     "scale": 1,
     "name": "redo_btn",
 }
@@ -214,7 +217,7 @@ REDO_BTN = {
 GRID_BTN = {
     "x": GRID_BUTTON_X,
     "y": GRID_BUTTON_Y,
-    "image": grid_button_image,
+    "image": "grid_btn.png",
     "scale": 1,
     "name": "grid_btn",
 }
@@ -222,7 +225,7 @@ GRID_BTN = {
 MAP_BTN = {
     "x": MAP_BUTTON_X,
     "y": MAP_BUTTON_Y,
-    "image": map_button_image,
+    "image": "map_btn.png",
     "scale": 1,
     "name": "map_btn",
 }
@@ -230,14 +233,14 @@ MAP_BTN = {
 ZOOM_IN_BTN = {
     "x": ZOOM_IN_BUTTON_X,
     "y": ZOOM_IN_BUTTON_Y,
-    "image": zoom_in_button_image,
+    "image": "zoom_in_btn.png",
     "scale": 1,
     "name": "zoom_in_btn",
 }
 ZOOM_OUT_BTN = {
     "x": ZOOM_OUT_BUTTON_X,
     "y": ZOOM_OUT_BUTTON_Y,
-    "image": zoom_out_button_image,
+    "image": "zoom_out_btn.png",
     "scale": 1,
     "name": "zoom_out_btn",
 }
@@ -0,0 +1,36 @@
+from settings.setup import *
+
+
+# ######## Dirty regions ######## #
+DIRTY_RECTS = True  # False redraws and updates the whole window every frame
+IDLE_WAIT_MS = 500  # Maximum time to block on pygame.event.wait while idle
+
+MAP_VIEW_RECT = (0, 0, SCREEN_WIDTH, SCREEN_HEIGHT)
+RIGHT_PANEL_RECT = (SCREEN_WIDTH, 0, RIGHT_MARGIN, SCREEN_HEIGHT)
+BOTTOM_PANEL_RECT = (0, SCREEN_HEIGHT, SCREEN_WIDTH, BOTTOM_MARGIN)
+MINIMAP_RECT = (SCREEN_WIDTH, SCREEN_HEIGHT, RIGHT_MARGIN, BOTTOM_MARGIN)
+
+
+# ######## Loading screen ######## #
+ASSET_PRELOAD_WORKERS = 8  # threads decoding images while the loading screen is shown
+ASSET_DEDUPE_MAX_PIXELS = 256 * 256  # larger images (backgrounds) are not hashed for deduplication
+LOADING_TEXT = "Loading images"
+LOADING_TEXT_Y_OFFSET = -60  # from the center of the window
+LOADING_BAR_WIDTH = 400
+LOADING_BAR_HEIGHT = 24
+LOADING_BAR_OUTLINE_WIDTH = 2
+LOADING_BAR_COLOR = WHITE
+LOADING_BACKGROUND_COLOR = DARK_ORANGE
+
+
+# ######## Startup ######## #
+DEFERRED_INIT = True  # menus and their buttons are created when first used instead of at startup
+STARTUP_REPORT = False  # prints the duration of each startup phase after the first frame
+
+
+# ######## Input ######## #
+INPUT_GRID_CELL_SIZE = 64  # size of the buckets of the widget spatial index
+
+
+# ######## Text ######## #
+TEXT_CACHE_SIZE = 512  # number of rendered texts to keep
@@ -0,0 +1,41 @@
+from settings.setup import *
+
+
+# ######## Map file format ######## #
+MAP_FILE_MAGIC = b"MAPEDIT\x00"
+MAP_FILE_VERSION = 1
+MAP_FILE_HEADER_SIZE = 64  # header is padded so the tile payload starts aligned
+MAP_FILE_COMPRESSION = "zlib"  # 'zlib', 'lzma' or 'raw'
+MAP_FILE_COMPRESSION_LEVEL = 6
+# Maps with at least this many cells (about 450 x 450) are saved uncompressed and opened with
+#   a copy-on-write np.memmap, only the parts that are shown are read from the file.
+# Edits stay in memory until the map is saved, every save writes the whole map
+MAP_FILE_MEMMAP = False
+MAP_FILE_MEMMAP_MIN_CELLS = 200_000
+
+
+# ######## Saving ######## #
+AUTOSAVE = True
+AUTOSAVE_INTERVAL_MS = 2 * 60 * 1000  # autosave unsaved edits after this time
+AUTOSAVE_EDIT_COUNT = 500  # or after this many tile changes, whichever comes first
+AUTOSAVE_GENERATIONS = 3  # number of rotating '<map name>.autosave<n>' files
+AUTOSAVE_SUFFIX = ".autosave"
+SAVE_STATUS_DURATION_MS = 4000  # time the last save result stays in the window caption
+
+
+# ######## Edit journal ######## #
+MAP_JOURNAL = True  # append every edit of a saved map to '<map name>.journal'
+MAP_JOURNAL_MAGIC = b"MAPJRNL\x00"
+MAP_JOURNAL_VERSION = 2  # version 2 added commit records
+MAP_JOURNAL_SUFFIX = ".journal"
+# Journals larger than this are folded into the map file on the next save
+MAP_JOURNAL_COMPACT_BYTES = 4 * 1024 * 1024
+
+
+# ######## Map catalog ######## #
+# Index of the maps in MAPS_DIR shown by the load menu, refreshed when the menu opens
+MAP_CATALOG_NAME = ".catalog.json"
+MAP_CATALOG_VERSION = 1
+MAP_THUMBNAILS_DIR_NAME = ".thumbnails"
+MAP_THUMBNAIL_SIZE = 64  # cells along the longest side of a thumbnail
+MAP_THUMBNAIL_EMPTY_COLOR = (89, 160, 205)
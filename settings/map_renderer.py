@@ -0,0 +1,20 @@
+from settings.setup import *
+
+
+# ######## Chunks ######## #
+CHUNK_SIZE = 16  # cells per chunk side
+CHUNK_CACHE_MAX_BYTES = 128 * 1024 * 1024
+
+
+# ######## Sprite atlas ######## #
+SPRITE_ATLAS_MAX_WIDTH = 2048
+ATLAS_CACHE_MAX_BYTES = 64 * 1024 * 1024
+
+
+# ######## Background ######## #
+BACKGROUND_TILE_SIZE = 1024  # size of one background tile in map pixels (scale 1.0)
+BACKGROUND_CACHE_SIZE = 2  # number of zoom levels to keep a scaled tile for
+
+
+# ######## Grid ######## #
+GRID_COLOR_KEY = (255, 0, 255)  # transparent color of the grid overlay, must differ from GRID_LINE_COLOR
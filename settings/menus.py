@@ -6,6 +6,11 @@ POPUP_MENU_TEXT_X = None
 POPUP_MENU_TITLE_Y = SCREEN_HEIGHT + BOTTOM_MARGIN - 135
 POPUP_MENU_INFO_X = None
 POPUP_MENU_INFO_Y = SCREEN_HEIGHT + BOTTOM_MARGIN - 95
+# Option next to the OK button
+POPUP_MENU_OPTION_X = SCREEN_WIDTH // 2 + 150
+POPUP_MENU_OPTION_Y = SCREEN_HEIGHT + BOTTOM_MARGIN - 48
+POPUP_MENU_HIGHLIGHT_WIDTH = 2
+POPUP_MENU_HIGHLIGHT_COLOR = RED
 
 # Saved maps
 SAVED_MAPS_X = (SCREEN_WIDTH + RIGHT_MARGIN) // 3
@@ -16,6 +21,11 @@ SAVED_MAPS_HIGHLIGHT_WIDTH = 5
 SAVED_MAPS_COLOR = WHITE
 SAVED_MAPS_HIGHLIGHT_COLOR = RED
 
+SAVED_MAPS_THUMBNAIL_SIZE = 64
+SAVED_MAPS_THUMBNAIL_X = SAVED_MAPS_X - SAVED_MAPS_THUMBNAIL_SIZE - 20
+SAVED_MAPS_INFO_Y_OFFSET = 40
+SAVED_MAPS_INFO_COLOR = WHITE
+
 # Load map
 LOAD_MAP_NAME_Y = SCREEN_HEIGHT - 75
 LOAD_MAP_TEXT = "Selected map:"
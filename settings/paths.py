@@ -6,3 +6,5 @@ EDITOR_DIR = os.path.dirname(os.path.abspath(sys.argv[0]))
 IMAGES_DIR = os.path.join(os.path.dirname(os.path.abspath(sys.argv[0])), "images/")
 MAPS_DIR = os.path.join(os.path.dirname(os.path.abspath(sys.argv[0])), "maps/")
 PRESETS_DIR = os.path.join(os.path.dirname(os.path.abspath(sys.argv[0])), "images/presets/")
+# Packed tile atlases of the presets, rebuilt when a preset folder changes
+ATLAS_CACHE_DIR = os.path.join(os.path.dirname(os.path.abspath(sys.argv[0])), "images/.atlases/")
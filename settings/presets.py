@@ -17,6 +17,12 @@ PRESETS_NAME_COLOR = (255, 255, 255)
 PRESETS_HIGHLIGHT_COLOR = (200, 25, 25)
 
 MAX_NR_PRESETS = 15
+# Minimum time between checks of the preset folders for added, removed or changed presets
+PRESET_REGISTRY_CHECK_INTERVAL_MS = 2000
+
+# Tile atlas cache, see tile_atlas.py
+ATLAS_VERSION = 2  # increase when the atlas or index format changes
+TILE_ATLAS_MAX_WIDTH = 1024
 
 
 # ######## Tile Preview ######## #
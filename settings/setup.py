@@ -31,7 +31,18 @@ BOTTOM_PANEL_COLOR = BROWN
 MIN_VISIBLE_COLS = 1
 MIN_VISIBLE_ROWS = 1
 
-MAX_TILE_TRACKING = 500
+# Memory used by undo and redo steps before the oldest steps are dropped
+HISTORY_MEMORY_BUDGET = 64 * 1024 * 1024
+
+EMPTY_TILE = -1
+# Tile indexes are small, int16 keeps a 500 x 500 map at 0.5 MB
+WORLD_DATA_DTYPE = "int16"
+# 'dense' stores every cell, 'sparse' only stores blocks that hold tiles
+WORLD_DATA_BACKEND = "dense"
+WORLD_DATA_BLOCK_SIZE = 16
+# New maps have no rows or columns limit and grow in every direction,
+#   the default of the canvas choice in the File Menu restart popup
+INFINITE_CANVAS = False
 
 GRID_PREFERENCES_DICT = {
     "rows": {
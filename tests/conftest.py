@@ -0,0 +1,8 @@
+import os
+import sys
+
+# The editor modules are imported from the repository root, as run.py does
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+# Surfaces are created without opening a window
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
@@ -0,0 +1,71 @@
+from types import SimpleNamespace
+
+import pygame
+import pytest
+
+from map_renderer.chunk_renderer import ChunkRenderer
+
+LAYOUTS = [(1.0, 32, 32), (2.0, 32, 32)]
+
+
+@pytest.fixture
+def chunk_renderer(monkeypatch):
+    chunk_renderer = ChunkRenderer(editor=SimpleNamespace())
+    chunk_renderer.built = []
+
+    def build_chunk(layout, chunk_row, chunk_col):
+        chunk_renderer.built.append((layout, chunk_row, chunk_col))
+        return pygame.Surface((8, 8))
+
+    monkeypatch.setattr(chunk_renderer, "build_chunk", build_chunk)
+
+    for layout in LAYOUTS:
+        for chunk_row in range(2):
+            for chunk_col in range(2):
+                chunk_renderer.get_chunk(layout=layout,
+                                         chunk_row=chunk_row,
+                                         chunk_col=chunk_col)
+    chunk_renderer.built.clear()
+    return chunk_renderer
+
+
+def test_cached_chunks_are_not_rebuilt(chunk_renderer):
+    chunk_renderer.get_chunk(layout=LAYOUTS[0],
+                             chunk_row=1,
+                             chunk_col=1)
+
+    assert chunk_renderer.built == []
+
+
+def test_tile_edit_invalidates_its_chunk_in_every_layout(chunk_renderer):
+    cache_bytes = chunk_renderer.cache_bytes
+    revision = chunk_renderer.revision
+    size = chunk_renderer.CHUNK_SIZE
+
+    # Column size + 1 and row 2 lie in chunk row 0, chunk column 1
+    chunk_renderer.invalidate_tile(x=size + 1,
+                                   y=2)
+
+    for layout in LAYOUTS:
+        assert (layout, 0, 1) not in chunk_renderer.chunks
+        assert (layout, 0, 0) in chunk_renderer.chunks
+        assert (layout, 1, 1) in chunk_renderer.chunks
+    assert chunk_renderer.cache_bytes == cache_bytes - 2 * 8 * 8 * pygame.Surface((8, 8)).get_bytesize()
+    assert chunk_renderer.revision == revision + 1
+
+    chunk_renderer.get_chunk(layout=LAYOUTS[1],
+                             chunk_row=0,
+                             chunk_col=1)
+    assert chunk_renderer.built == [(LAYOUTS[1], 0, 1)]
+
+
+def test_invalidate_all_clears_the_cache(chunk_renderer):
+    chunk_renderer.invalidate_all()
+
+    assert not chunk_renderer.chunks
+    assert chunk_renderer.cache_bytes == 0
+
+    chunk_renderer.get_chunk(layout=LAYOUTS[0],
+                             chunk_row=0,
+                             chunk_col=0)
+    assert chunk_renderer.built == [(LAYOUTS[0], 0, 0)]
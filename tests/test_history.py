@@ -0,0 +1,79 @@
+from types import SimpleNamespace
+
+from utilities.history import History, TileStroke
+
+
+class Command(SimpleNamespace):
+    """
+        Stand-in command of a given size that records how it was applied.
+    """
+
+    def undo(self, **_) -> None:
+        self.applied = "undo"
+
+    def redo(self, **_) -> None:
+        self.applied = "redo"
+
+
+def test_stroke_keeps_first_old_and_last_new_value():
+    stroke = TileStroke()
+    stroke.add(row=1, col=2, old_value=-1, new_value=3)
+    stroke.add(row=1, col=2, old_value=3, new_value=4)
+    stroke.add(row=5, col=6, old_value=-1, new_value=7)
+    # Painted and erased again within the stroke
+    stroke.add(row=8, col=9, old_value=-1, new_value=2)
+    stroke.add(row=8, col=9, old_value=2, new_value=-1)
+    stroke.finish()
+
+    assert len(stroke) == 2
+    assert list(zip(stroke.rows.tolist(), stroke.cols.tolist(),
+                    stroke.old_values.tolist(), stroke.new_values.tolist())) == [(1, 2, -1, 4), (5, 6, -1, 7)]
+    assert stroke.nbytes == stroke.rows.nbytes * 2 + stroke.old_values.nbytes * 2
+
+
+def test_empty_stroke_is_not_pushed():
+    history = History()
+    history.record_tile(row=0, col=0, old_value=-1, new_value=1)
+    history.record_tile(row=0, col=0, old_value=1, new_value=-1)
+    history.end_stroke()
+
+    assert not history.undo_stack
+    assert history.nbytes == 0
+
+
+def test_oldest_commands_are_dropped_over_budget():
+    history = History(memory_budget=100)
+    commands = [Command(nbytes=40) for _ in range(4)]
+    for command in commands:
+        history.push(command=command)
+
+    assert list(history.undo_stack) == commands[2:]
+    assert history.nbytes == 80
+
+    # The newest command is kept even if it is larger than the budget
+    large = Command(nbytes=500)
+    history.push(command=large)
+    assert list(history.undo_stack) == [large]
+    assert history.nbytes == 500
+
+
+def test_push_clears_redo_commands():
+    history = History(memory_budget=100)
+    first, second = Command(nbytes=10), Command(nbytes=20)
+    history.push(command=first)
+    history.push(command=second)
+
+    # The stand-in commands need no map to be applied to
+    history.undo(None)
+    assert second.applied == "undo"
+    assert list(history.redo_stack) == [second]
+
+    history.redo(None)
+    assert second.applied == "redo"
+    history.undo(None)
+
+    third = Command(nbytes=30)
+    history.push(command=third)
+    assert not history.redo_stack
+    assert list(history.undo_stack) == [first, third]
+    assert history.nbytes == 40
@@ -0,0 +1,64 @@
+import pytest
+
+from utilities import map_analysis, world_data as world_data_backend
+
+
+@pytest.mark.parametrize("backend", ["dense", "sparse", "infinite"])
+def test_empty_map(backend):
+    world_data = world_data_backend.get_world_data(rows=10,
+                                                   columns=12,
+                                                   backend=backend)
+
+    extent = map_analysis.get_map_extent(world_data=world_data)
+
+    assert extent.is_empty
+    assert (extent.row_start, extent.row_stop, extent.col_start, extent.col_stop) == (0, 0, 0, 0)
+    assert extent.tile_counts == {}
+    assert extent.is_within(rows=1, columns=1)
+
+
+@pytest.mark.parametrize("backend", ["dense", "sparse"])
+def test_full_map(backend):
+    world_data = world_data_backend.get_world_data(rows=10,
+                                                   columns=12,
+                                                   backend=backend)
+    for row in range(10):
+        for col in range(12):
+            world_data[row, col] = 3
+
+    extent = map_analysis.get_map_extent(world_data=world_data)
+
+    assert (extent.row_start, extent.row_stop, extent.col_start, extent.col_stop) == (0, 10, 0, 12)
+    assert extent.used_rows.all() and extent.used_cols.all()
+    assert extent.tile_counts == {3: 120}
+    assert extent.is_within(rows=10, columns=12)
+    assert not extent.is_within(rows=9, columns=12)
+
+
+def test_partial_map():
+    world_data = world_data_backend.get_world_data(rows=10,
+                                                   columns=12,
+                                                   backend="dense")
+    world_data[2, 3] = 0
+    world_data[6, 9] = 5
+    world_data[4, 4] = 5
+
+    extent = map_analysis.get_map_extent(world_data=world_data)
+
+    assert (extent.row_start, extent.row_stop, extent.col_start, extent.col_stop) == (2, 7, 3, 10)
+    assert extent.used_rows.tolist() == [False, False, True, False, True, False, True, False, False, False]
+    assert extent.tile_counts == {0: 1, 5: 2}
+
+
+def test_infinite_map_uses_map_coordinates():
+    world_data = world_data_backend.get_world_data(rows=0,
+                                                   columns=0,
+                                                   backend="infinite")
+    world_data[-4, -7] = 1
+    world_data[5, 2] = 1
+
+    extent = map_analysis.get_map_extent(world_data=world_data)
+
+    assert (extent.row_start, extent.row_stop, extent.col_start, extent.col_stop) == (-4, 6, -7, 3)
+    assert extent.tile_counts == {1: 2}
+    assert not extent.is_within(rows=100, columns=100)
@@ -0,0 +1,125 @@
+import os
+
+import pytest
+
+from utilities import map_catalog, map_format, map_journal, world_data as world_data_backend
+from utilities.map_catalog import MapCatalog
+
+
+def save_map(path: str,
+             tiles: dict) -> None:
+    world_data = world_data_backend.get_world_data(rows=10,
+                                                   columns=10,
+                                                   backend="dense")
+    for (row, col), value in tiles.items():
+        world_data[row, col] = value
+    map_format.save_map(path=path,
+                        world_data=world_data,
+                        rows=10,
+                        columns=10,
+                        grid_size_x=32,
+                        grid_size_y=32)
+
+
+def touch(path: str) -> None:
+    # Make sure the change is seen on file systems with a coarse modification time
+    stat = os.stat(path)
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+
+
+@pytest.fixture
+def load_calls(monkeypatch):
+    calls = []
+    load_map = map_format.load_map
+
+    def counting_load_map(path):
+        calls.append(os.path.basename(path))
+        return load_map(path=path)
+
+    monkeypatch.setattr(map_format, "load_map", counting_load_map)
+    return calls
+
+
+def test_refresh_lists_maps_only(tmp_path, load_calls):
+    save_map(path=str(tmp_path / "a"), tiles={(0, 0): 1, (1, 1): 2})
+    save_map(path=str(tmp_path / "b"), tiles={})
+    (tmp_path / "notes.txt").write_text("not a map")
+    (tmp_path / "a.journal").write_bytes(b"")
+    (tmp_path / "c.tmp").write_bytes(b"")
+
+    catalog = MapCatalog(maps_dir=str(tmp_path))
+
+    assert catalog.refresh() == ["a", "b"]
+    assert sorted(load_calls) == ["a", "b", "notes.txt"]
+    assert catalog.entries["a"]["tile_count"] == 2
+    assert (catalog.entries["a"]["rows"], catalog.entries["a"]["columns"]) == (10, 10)
+    assert catalog.entries["a"]["checksum"] == map_catalog.get_checksum(path=str(tmp_path / "a"))
+    assert os.path.isfile(tmp_path / map_catalog.MAP_THUMBNAILS_DIR_NAME / catalog.entries["a"]["thumbnail"])
+
+
+def test_refresh_only_loads_changed_maps(tmp_path, load_calls):
+    save_map(path=str(tmp_path / "a"), tiles={(0, 0): 1})
+    save_map(path=str(tmp_path / "b"), tiles={(0, 0): 1})
+    catalog = MapCatalog(maps_dir=str(tmp_path))
+    catalog.refresh()
+    load_calls.clear()
+
+    assert catalog.refresh() == ["a", "b"]
+    assert load_calls == []
+
+    save_map(path=str(tmp_path / "b"), tiles={(0, 0): 1, (5, 5): 3})
+    touch(path=str(tmp_path / "b"))
+    catalog.refresh()
+    assert load_calls == ["b"]
+    assert catalog.entries["b"]["tile_count"] == 2
+
+
+def test_catalog_is_kept_between_sessions(tmp_path, load_calls):
+    save_map(path=str(tmp_path / "a"), tiles={(0, 0): 1})
+    MapCatalog(maps_dir=str(tmp_path)).refresh()
+    load_calls.clear()
+
+    catalog = MapCatalog(maps_dir=str(tmp_path))
+    assert catalog.refresh() == ["a"]
+    assert load_calls == []
+
+
+def test_removed_maps_leave_the_catalog(tmp_path, load_calls):
+    save_map(path=str(tmp_path / "a"), tiles={})
+    save_map(path=str(tmp_path / "b"), tiles={})
+    catalog = MapCatalog(maps_dir=str(tmp_path))
+    catalog.refresh()
+
+    os.remove(tmp_path / "a")
+
+    assert catalog.refresh() == ["b"]
+    assert "a" not in MapCatalog(maps_dir=str(tmp_path)).entries
+
+
+def test_autosaves_are_not_listed(tmp_path, load_calls):
+    map_path = str(tmp_path / "a")
+    save_map(path=map_path, tiles={})
+    save_map(path=map_catalog.get_autosave_path(map_path=map_path, generation=0), tiles={})
+    save_map(path=map_catalog.get_autosave_path(map_path=map_path, generation=1), tiles={})
+
+    assert map_catalog.get_map_names(maps_dir=str(tmp_path)) == ["a"]
+    assert MapCatalog(maps_dir=str(tmp_path)).refresh() == ["a"]
+    assert load_calls == ["a"]
+
+
+def test_refresh_keeps_the_open_map(tmp_path, load_calls):
+    save_map(path=str(tmp_path / "a"), tiles={(0, 0): 1})
+    catalog = MapCatalog(maps_dir=str(tmp_path))
+    catalog.refresh()
+    load_calls.clear()
+
+    # Every flushed edit of the open map touches its journal
+    journal_path = map_journal.get_journal_path(map_path=str(tmp_path / "a"))
+    open(journal_path, "wb").close()
+    touch(path=journal_path)
+
+    assert catalog.refresh(open_map_name="a") == ["a"]
+    assert load_calls == []
+
+    catalog.refresh()
+    assert load_calls == ["a"]
@@ -0,0 +1,129 @@
+from settings.setup import EMPTY_TILE
+from map_document import MapDocument
+from utilities import map_format
+
+
+def place_stroke(document: MapDocument,
+                 cells: dict) -> None:
+    for (row, col), value in cells.items():
+        document.place_tile(row=row, col=col, value=value)
+    document.end_stroke()
+
+
+def test_undo_redo_across_snapshot():
+    document = MapDocument(rows=20,
+                           columns=20,
+                           infinite=False)
+    place_stroke(document=document,
+                 cells={(1, 1): 4, (2, 2): 5})
+    document.resize(rows=30,
+                    columns=25)
+    place_stroke(document=document,
+                 cells={(25, 22): 6})
+
+    document.undo()
+    assert document.world_data[25, 22] == EMPTY_TILE
+    assert (document.rows, document.columns) == (30, 25)
+
+    document.undo()
+    assert (document.rows, document.columns) == (20, 20)
+    assert document.world_data.shape == (20, 20)
+    assert (document.world_data[1, 1], document.world_data[2, 2]) == (4, 5)
+
+    document.undo()
+    assert (document.world_data[1, 1], document.world_data[2, 2]) == (EMPTY_TILE, EMPTY_TILE)
+
+    document.redo()
+    document.redo()
+    assert (document.rows, document.columns) == (30, 25)
+    assert (document.world_data[1, 1], document.world_data[2, 2]) == (4, 5)
+
+    document.redo()
+    assert document.world_data[25, 22] == 6
+
+
+def test_wipe_is_undone_with_the_tiles_placed_before():
+    document = MapDocument(rows=10,
+                           columns=10,
+                           infinite=True)
+    place_stroke(document=document,
+                 cells={(-5, -5): 2, (3, 4): 3})
+    document.wipe()
+    assert document.world_data.get_bounds() is None
+
+    document.undo()
+    assert (document.world_data[-5, -5], document.world_data[3, 4]) == (2, 3)
+
+    document.redo()
+    assert document.world_data[-5, -5] == EMPTY_TILE
+
+
+def test_views_are_notified_of_changes():
+    document = MapDocument(rows=10,
+                           columns=10,
+                           infinite=False)
+    changed_tiles = []
+    changed_maps = []
+    document.on_tile_changed = lambda x, y: changed_tiles.append((x, y))
+    document.on_map_changed = lambda: changed_maps.append(document.world_data)
+
+    assert document.place_tile(row=2, col=7, value=1)
+    # Placing the same tile again is not a change
+    assert not document.place_tile(row=2, col=7, value=1)
+    document.end_stroke()
+    assert changed_tiles == [(7, 2)]
+
+    document.undo()
+    assert changed_tiles == [(7, 2), (7, 2)]
+
+    document.wipe()
+    assert changed_maps == [document.world_data]
+
+
+def test_save_and_load(tmp_path):
+    path = str(tmp_path / "level")
+    document = MapDocument(rows=12,
+                           columns=14,
+                           infinite=False)
+    document.set_grid_size(grid_size_x=16)
+    place_stroke(document=document,
+                 cells={(0, 0): 1, (11, 13): 2})
+    document.save(path=path)
+
+    loaded = MapDocument()
+    loaded.load(path=path)
+
+    assert loaded.map_name == "level"
+    assert (loaded.rows, loaded.columns, loaded.grid_size_x) == (12, 14, 16)
+    assert (loaded.world_data[0, 0], loaded.world_data[11, 13]) == (1, 2)
+
+    # Loading is a single undo step back to the previous map
+    loaded.undo()
+    assert loaded.map_name == "New map"
+
+
+def test_memory_mapped_map_is_only_changed_by_saving(tmp_path, monkeypatch):
+    monkeypatch.setattr(map_format, "MAP_FILE_MEMMAP", True)
+    monkeypatch.setattr(map_format, "MAP_FILE_MEMMAP_MIN_CELLS", 100)
+    path_a = str(tmp_path / "a")
+    path_b = str(tmp_path / "b")
+    MapDocument(rows=20,
+                columns=20,
+                infinite=False).save(path=path_a)
+
+    document = MapDocument()
+    document.load(path=path_a)
+    assert document.world_data.is_memmap
+    place_stroke(document=document,
+                 cells={(1, 1): 4})
+    document.save(path=path_b)
+    place_stroke(document=document,
+                 cells={(2, 2): 5})
+    document.close()
+
+    map_a = MapDocument()
+    map_a.load(path=path_a)
+    map_b = MapDocument()
+    map_b.load(path=path_b)
+    assert (map_a.world_data[1, 1], map_a.world_data[2, 2]) == (EMPTY_TILE, EMPTY_TILE)
+    assert (map_b.world_data[1, 1], map_b.world_data[2, 2]) == (4, EMPTY_TILE)
@@ -0,0 +1,212 @@
+import pickle
+
+import numpy as np
+import pytest
+
+from settings.setup import EMPTY_TILE, WORLD_DATA_DTYPE
+from utilities import map_format, world_data as world_data_backend
+
+
+def get_tiles(rows: int,
+              columns: int) -> np.ndarray:
+    tiles = world_data_backend.get_empty_array(rows=rows,
+                                               columns=columns)
+    tiles[0, 0] = 0
+    tiles[3, 7] = 12
+    tiles[rows - 1, columns - 1] = 255
+    return tiles
+
+
+def save_and_load(path: str,
+                  world_data: object,
+                  rows: int,
+                  columns: int,
+                  compression: str | None = None) -> tuple:
+    # Without a compression the default MAP_FILE_COMPRESSION is used
+    options = {} if compression is None else {"compression": compression}
+    map_format.save_map(path=path,
+                        world_data=world_data,
+                        rows=rows,
+                        columns=columns,
+                        grid_size_x=32,
+                        grid_size_y=48,
+                        **options)
+    return map_format.load_map(path=path)
+
+
+@pytest.mark.parametrize("compression", ["raw", "zlib", "lzma"])
+def test_dense_round_trip(tmp_path, compression):
+    tiles = get_tiles(rows=20, columns=30)
+    world_data = world_data_backend.from_array(array=tiles,
+                                               backend="dense")
+
+    rows, columns, grid_size_x, grid_size_y, loaded = save_and_load(path=str(tmp_path / "map"),
+                                                                    world_data=world_data,
+                                                                    rows=20,
+                                                                    columns=30,
+                                                                    compression=compression)
+
+    assert map_format.is_map_file(path=str(tmp_path / "map"))
+    assert (rows, columns, grid_size_x, grid_size_y) == (20, 30, 32, 48)
+    assert loaded.to_array().dtype == WORLD_DATA_DTYPE
+    np.testing.assert_array_equal(loaded.to_array(), tiles)
+
+
+def test_sparse_round_trip(tmp_path):
+    tiles = get_tiles(rows=40, columns=50)
+    world_data = world_data_backend.from_array(array=tiles,
+                                               backend="sparse")
+
+    rows, columns, _, _, loaded = save_and_load(path=str(tmp_path / "map"),
+                                                world_data=world_data,
+                                                rows=40,
+                                                columns=50)
+
+    assert (rows, columns) == (40, 50)
+    np.testing.assert_array_equal(loaded.to_array(), tiles)
+
+
+def test_infinite_round_trip(tmp_path):
+    world_data = world_data_backend.get_world_data(rows=0,
+                                                   columns=0,
+                                                   backend="infinite")
+    cells = {(-40, -3): 5, (0, 0): 1, (17, 100): 9}
+    for (row, col), value in cells.items():
+        world_data[row, col] = value
+
+    _, _, _, _, loaded = save_and_load(path=str(tmp_path / "map"),
+                                       world_data=world_data,
+                                       rows=0,
+                                       columns=0)
+
+    assert loaded.backend == "infinite"
+    assert loaded.get_bounds() == world_data.get_bounds()
+    for (row, col), value in cells.items():
+        assert loaded[row, col] == value
+    assert loaded[1, 1] == EMPTY_TILE
+    np.testing.assert_array_equal(loaded.to_array(), world_data.to_array())
+
+
+def test_legacy_pickle_is_converted(tmp_path):
+    # Maps saved before the binary format, world_data was an int64 array
+    tiles = get_tiles(rows=10, columns=12).astype(np.int64)
+    path = tmp_path / "legacy"
+    path.write_bytes(pickle.dumps([10, 12, 32, 32, tiles]))
+
+    assert not map_format.is_map_file(path=str(path))
+    rows, columns, grid_size_x, grid_size_y, loaded = map_format.load_map(path=str(path))
+
+    assert (rows, columns, grid_size_x, grid_size_y) == (10, 12, 32, 32)
+    assert loaded.to_array().dtype == WORLD_DATA_DTYPE
+    np.testing.assert_array_equal(loaded.to_array(), tiles)
+
+    # Saving again writes the binary format
+    rows, columns, _, _, resaved = save_and_load(path=str(path),
+                                                 world_data=loaded,
+                                                 rows=rows,
+                                                 columns=columns)
+    assert map_format.is_map_file(path=str(path))
+    np.testing.assert_array_equal(resaved.to_array(), tiles)
+
+
+def test_legacy_pickle_refuses_globals(tmp_path):
+    path = tmp_path / "legacy"
+    path.write_bytes(pickle.dumps([10, 10, 32, 32, print]))
+
+    with pytest.raises(pickle.UnpicklingError):
+        map_format.load_map(path=str(path))
+
+
+@pytest.fixture
+def memmap_size(monkeypatch):
+    monkeypatch.setattr(map_format, "MAP_FILE_MEMMAP", True)
+    monkeypatch.setattr(map_format, "MAP_FILE_MEMMAP_MIN_CELLS", 100)
+
+
+def test_large_map_is_memory_mapped(tmp_path, memmap_size):
+    tiles = get_tiles(rows=20, columns=30)
+    _, _, _, _, loaded = save_and_load(path=str(tmp_path / "map"),
+                                       world_data=world_data_backend.from_array(array=tiles,
+                                                                                backend="dense"),
+                                       rows=20,
+                                       columns=30)
+
+    assert loaded.is_memmap
+    np.testing.assert_array_equal(loaded.to_array(), tiles)
+
+
+def test_memory_mapped_map_saves_its_edits(tmp_path, memmap_size):
+    path = str(tmp_path / "map")
+    tiles = get_tiles(rows=20, columns=30)
+    _, _, _, _, loaded = save_and_load(path=path,
+                                       world_data=world_data_backend.from_array(array=tiles,
+                                                                                backend="dense"),
+                                       rows=20,
+                                       columns=30)
+    loaded[5, 5] = 42
+
+    map_format.save_map(path=path,
+                        world_data=loaded,
+                        rows=20,
+                        columns=30,
+                        grid_size_x=16,
+                        grid_size_y=24)
+    rows, columns, grid_size_x, grid_size_y, reloaded = map_format.load_map(path=path)
+
+    tiles[5, 5] = 42
+    assert (rows, columns, grid_size_x, grid_size_y) == (20, 30, 16, 24)
+    np.testing.assert_array_equal(reloaded.to_array(), tiles)
+
+    # Saving under another name writes the whole map
+    other_path = str(tmp_path / "other")
+    map_format.save_map(path=other_path,
+                        world_data=loaded,
+                        rows=20,
+                        columns=30,
+                        grid_size_x=16,
+                        grid_size_y=24)
+    _, _, _, _, other = map_format.load_map(path=other_path)
+    np.testing.assert_array_equal(other.to_array(), tiles)
+
+
+def test_unsaved_edits_of_a_memory_mapped_map_stay_out_of_its_file(tmp_path, memmap_size):
+    path = str(tmp_path / "map")
+    tiles = get_tiles(rows=20, columns=30)
+    _, _, _, _, loaded = save_and_load(path=path,
+                                       world_data=world_data_backend.from_array(array=tiles,
+                                                                                backend="dense"),
+                                       rows=20,
+                                       columns=30)
+    loaded[5, 5] = 42
+    # Closing the map without saving
+    del loaded
+
+    _, _, _, _, reloaded = map_format.load_map(path=path)
+    np.testing.assert_array_equal(reloaded.to_array(), tiles)
+
+
+def test_memory_mapped_map_saved_under_another_name(tmp_path, memmap_size):
+    path = str(tmp_path / "map")
+    tiles = get_tiles(rows=20, columns=30)
+    _, _, _, _, loaded = save_and_load(path=path,
+                                       world_data=world_data_backend.from_array(array=tiles,
+                                                                                backend="dense"),
+                                       rows=20,
+                                       columns=30)
+    loaded[5, 5] = 42
+
+    other_path = str(tmp_path / "other")
+    map_format.save_map(path=other_path,
+                        world_data=loaded,
+                        rows=20,
+                        columns=30,
+                        grid_size_x=32,
+                        grid_size_y=48)
+    # Edits after saving belong to the other map, and only once it is saved again
+    loaded[6, 6] = 43
+
+    _, _, _, _, original = map_format.load_map(path=path)
+    _, _, _, _, other = map_format.load_map(path=other_path)
+    np.testing.assert_array_equal(original.to_array(), tiles)
+    tiles[5, 5] = 42
+    np.testing.assert_array_equal(other.to_array(), tiles)
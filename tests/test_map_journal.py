@@ -0,0 +1,113 @@
+import os
+
+import numpy as np
+
+from settings.setup import EMPTY_TILE
+from utilities import map_format, map_journal, world_data as world_data_backend
+from utilities.map_journal import MapJournal
+
+
+def save_empty_map(path: str) -> None:
+    map_format.save_map(path=path,
+                        world_data=world_data_backend.get_world_data(rows=10,
+                                                                     columns=10,
+                                                                     backend="dense"),
+                        rows=10,
+                        columns=10,
+                        grid_size_x=32,
+                        grid_size_y=32)
+
+
+def load_and_replay(path: str) -> np.ndarray:
+    rows, columns, grid_size_x, grid_size_y, world_data = map_format.load_map(path=path)
+    _, _, _, _, world_data = map_journal.replay(map_path=path,
+                                                rows=rows,
+                                                columns=columns,
+                                                grid_size_x=grid_size_x,
+                                                grid_size_y=grid_size_y,
+                                                world_data=world_data)
+    return world_data.to_array()
+
+
+def test_replay_stops_at_truncated_record(tmp_path):
+    path = str(tmp_path / "map")
+    save_empty_map(path=path)
+
+    journal = MapJournal()
+    journal.attach(map_name="map",
+                   map_path=path)
+    journal.record_tile(row=1, col=2, value=7)
+    journal.flush()
+    journal.record_tile(row=3, col=4, value=8)
+    journal.flush()
+    journal.file.close()
+    journal.file = None
+
+    # A crash while writing the last record
+    journal_path = map_journal.get_journal_path(map_path=path)
+    os.truncate(journal_path, os.path.getsize(journal_path) - 2)
+
+    tiles = load_and_replay(path=path)
+    assert tiles[1, 2] == 7
+    assert tiles[3, 4] == EMPTY_TILE
+    assert map_journal.has_unsaved_edits(map_path=path)
+
+    # Continuing the journal drops the cut off record
+    journal = MapJournal()
+    journal.attach(map_name="map",
+                   map_path=path)
+    journal.record_tile(row=5, col=6, value=9)
+    journal.commit()
+    journal.close()
+
+    tiles = load_and_replay(path=path)
+    assert (tiles[1, 2], tiles[3, 4], tiles[5, 6]) == (7, EMPTY_TILE, 9)
+    assert not map_journal.has_unsaved_edits(map_path=path)
+
+
+def test_close_discards_unsaved_edits(tmp_path):
+    path = str(tmp_path / "map")
+    save_empty_map(path=path)
+
+    journal = MapJournal()
+    journal.attach(map_name="map",
+                   map_path=path)
+    journal.record_tile(row=1, col=1, value=3)
+    journal.commit()
+    journal.record_tile(row=2, col=2, value=4)
+    journal.flush()
+    journal.close()
+
+    tiles = load_and_replay(path=path)
+    assert tiles[1, 1] == 3
+    assert tiles[2, 2] == EMPTY_TILE
+    assert not map_journal.has_unsaved_edits(map_path=path)
+
+
+def test_renamed_journals_replay_in_order(tmp_path):
+    path = str(tmp_path / "map")
+    save_empty_map(path=path)
+
+    journal = MapJournal()
+    journal.attach(map_name="map",
+                   map_path=path)
+    journal.record_tile(row=1, col=1, value=3)
+    journal.commit()
+
+    # A full save that did not finish writing the map file
+    renamed = journal.start(map_name="map",
+                            map_path=path)
+    assert [os.path.basename(renamed_path) for renamed_path in renamed] == [
+        os.path.basename(map_journal.get_journal_path(map_path=path)) + ".0"]
+
+    journal.record_tile(row=1, col=1, value=4)
+    journal.record_tile(row=2, col=2, value=5)
+    journal.commit()
+    journal.close()
+
+    tiles = load_and_replay(path=path)
+    assert (tiles[1, 1], tiles[2, 2]) == (4, 5)
+
+    # Once the map file is written the renamed journals are folded into it
+    map_journal.remove_journals(paths=renamed)
+    assert map_journal.get_journal_paths(map_path=path) == [map_journal.get_journal_path(map_path=path)]
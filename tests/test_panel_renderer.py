@@ -0,0 +1,34 @@
+from types import SimpleNamespace
+
+import pygame
+import pytest
+
+from panel_renderer import PanelRenderer
+
+
+@pytest.fixture
+def panel_renderer():
+    # PanelLayer surfaces are converted to the format of the window
+    pygame.display.init()
+    pygame.display.set_mode((1, 1))
+    tile_buttons = [SimpleNamespace(image=pygame.Surface((8, 8))) for _ in range(2)]
+    editor = SimpleNamespace(is_building=True,
+                             is_displaying_presets=False,
+                             current_preset="hedge",
+                             current_tile=0,
+                             tile_buttons=tile_buttons,
+                             tile_names=["a", "b"])
+    return PanelRenderer(editor=editor)
+
+
+def test_right_panel_key_is_unchanged_without_changes(panel_renderer):
+    assert panel_renderer.get_right_panel_key() == panel_renderer.get_right_panel_key()
+
+
+def test_replacing_a_tile_image_changes_the_right_panel_key(panel_renderer):
+    key = panel_renderer.get_right_panel_key()
+    panel_renderer.right_panel.set_composed(key=key)
+
+    panel_renderer.editor.tile_buttons[1].image = pygame.Surface((8, 8))
+
+    assert panel_renderer.right_panel.is_outdated(key=panel_renderer.get_right_panel_key())
@@ -0,0 +1,45 @@
+import pygame
+import pytest
+
+import save_handler as save_handler_module
+from map_document import MapDocument
+from save_handler import SaveHandler
+from utilities import map_catalog
+
+
+@pytest.fixture
+def document(tmp_path, monkeypatch):
+    # The save thread posts an event after every save
+    pygame.display.init()
+    monkeypatch.setattr(save_handler_module, "MAPS_DIR", str(tmp_path))
+    MapDocument(rows=10,
+                columns=10,
+                infinite=False).save(path=str(tmp_path / "a"))
+
+    document = MapDocument()
+    document.load(path=str(tmp_path / "a"))
+    return document
+
+
+def test_journal_save_updates_the_catalog(tmp_path, document):
+    # The SaveHandler only uses the map attributes the Editor forwards to its MapDocument
+    save_handler = SaveHandler(editor=document)
+    save_handler.open_journal()
+
+    document.place_tile(row=1, col=1, value=2)
+    document.end_stroke()
+    save_handler.save_map()
+    save_handler.jobs.join()
+
+    entry = save_handler.map_catalog.entries["a"]
+    assert entry["tile_count"] == 1
+    assert (entry["size"], entry["mtime_ns"]) == map_catalog.get_stamp(map_path=str(tmp_path / "a"))
+
+    # Autosaved edits are not saved, the catalog keeps the saved map
+    document.place_tile(row=2, col=2, value=2)
+    document.end_stroke()
+    save_handler.save_map(is_autosave=True)
+    save_handler.jobs.join()
+    assert save_handler.map_catalog.entries["a"]["tile_count"] == 1
+
+    save_handler.stop()
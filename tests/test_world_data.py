@@ -0,0 +1,89 @@
+import numpy as np
+import pytest
+
+from settings.setup import EMPTY_TILE
+from utilities import world_data as world_data_backend
+
+
+def get_infinite_world_data(cells: dict) -> world_data_backend.InfiniteWorldData:
+    world_data = world_data_backend.get_world_data(rows=0,
+                                                   columns=0,
+                                                   backend="infinite")
+    for (row, col), value in cells.items():
+        world_data[row, col] = value
+    return world_data
+
+
+def test_infinite_negative_coordinates():
+    world_data = get_infinite_world_data(cells={(-3, -9): 1, (20, 7): 2})
+
+    assert world_data[-3, -9] == 1
+    assert world_data[20, 7] == 2
+    assert world_data[-3, -8] == EMPTY_TILE
+    assert world_data[-1000, 1000] == EMPTY_TILE
+    # Negative indexes are cells above and left of the origin, not counted from the end
+    assert world_data[-1, -1] == EMPTY_TILE
+
+
+def test_infinite_bounds():
+    world_data = get_infinite_world_data(cells={})
+    assert world_data.get_bounds() is None
+    assert world_data.shape == (0, 0)
+    assert world_data.to_array().shape == (0, 0)
+
+    world_data[-3, -9] = 1
+    world_data[20, 7] = 2
+    assert world_data.get_bounds() == (-3, 21, -9, 8)
+    assert world_data.shape == (24, 17)
+
+    tiles = world_data.to_array()
+    assert tiles.shape == (24, 17)
+    assert (tiles[0, 0], tiles[23, 16]) == (1, 2)
+    assert np.count_nonzero(tiles != EMPTY_TILE) == 2
+
+    # Bounds shrink again once the outer tile is removed
+    world_data[20, 7] = EMPTY_TILE
+    assert world_data.get_bounds() == (-3, -2, -9, -8)
+
+
+def test_infinite_releases_empty_blocks():
+    world_data = get_infinite_world_data(cells={(-1, -1): 4})
+    assert len(world_data.blocks) == 1
+
+    world_data[-1, -1] = EMPTY_TILE
+    assert not world_data.blocks
+    assert world_data.get_bounds() is None
+
+    # Erasing where nothing was placed does not allocate a block
+    world_data[500, -500] = EMPTY_TILE
+    assert not world_data.blocks
+
+
+def test_infinite_region_across_the_origin():
+    world_data = get_infinite_world_data(cells={(-1, -1): 1, (0, 0): 2, (-1, 0): 3})
+    size = world_data.BLOCK_SIZE
+
+    region = world_data.region(row_start=-2,
+                               row_stop=2,
+                               col_start=-2,
+                               col_stop=2)
+    expected = np.full((4, 4), EMPTY_TILE)
+    expected[1, 1], expected[2, 2], expected[1, 2] = 1, 2, 3
+    np.testing.assert_array_equal(region, expected)
+
+    assert world_data.has_tiles(row_start=-1, row_stop=0, col_start=-1, col_stop=0)
+    assert not world_data.has_tiles(row_start=size, row_stop=2 * size, col_start=0, col_stop=size)
+
+
+def test_sparse_keeps_numpy_bounds():
+    world_data = world_data_backend.get_world_data(rows=10,
+                                                   columns=20,
+                                                   backend="sparse")
+    world_data[-1, -1] = 5
+
+    # Negative indexes count from the end like a Numpy array
+    assert world_data[9, 19] == 5
+    with pytest.raises(IndexError):
+        world_data[10, 0] = 1
+    with pytest.raises(IndexError):
+        world_data[0, -21]
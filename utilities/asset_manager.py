@@ -0,0 +1,187 @@
+"""
+Central cache of the images used by the Editor.
+Every PNG is decoded once, the Surface is shared by the level objects, the tile lists and
+    the tile buttons.
+Images with identical pixels are stored once, whatever their path, except images larger than
+    ASSET_DEDUPE_MAX_PIXELS.
+Shared surfaces must not be changed, callers that change an image (alpha, colorkey) copy it first.
+At startup all images can be decoded on a thread pool with preload().
+"""
+
+import hashlib
+import os
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from typing import Callable, Self, Tuple
+
+import pygame
+
+from settings.display import ASSET_DEDUPE_MAX_PIXELS
+
+
+def decode_image(path: str) -> Tuple[str, Tuple[int, int], bytes]:
+    """
+        Reads and decodes an image into RGBA pixels.
+        Runs on a preload thread, the pixels are turned into a Surface on the main thread.
+
+        Args:
+            path (str): Path of the image.
+
+        Returns:
+            Tuple[str, Tuple[int, int], bytes]: Path, size and RGBA pixels of the image.
+    """
+    image = pygame.image.load(path)
+
+    return path, image.get_size(), pygame.image.tobytes(image, "RGBA")
+
+
+class AssetManager:
+    """
+        Loads and caches images by path.
+
+        Returns:
+            Self.
+    """
+
+    def __init__(self) -> Self:
+        # (absolute path, has alpha) -> Surface
+        self.surfaces: dict[tuple[str, bool], pygame.Surface] = {}
+        # (has alpha, size, sha1 of the pixels) -> Surface
+        self.contents: dict[tuple[bool, tuple[int, int], bytes], pygame.Surface] = {}
+
+        # Statistics
+        self.decoded = 0
+        self.hits = 0
+        self.duplicates = 0
+        self.decode_ms = 0.0
+
+    def load(self,
+             path: str,
+             alpha: bool = True) -> pygame.Surface:
+        """
+            Gets the image at path, it is decoded and converted the first time only.
+
+            Args:
+                path (str): Path of the image.
+                alpha (bool): Convert with per pixel alpha (convert_alpha) or without (convert).
+
+            Returns:
+                pygame.Surface: Shared image.
+        """
+        key = (os.path.abspath(path), alpha)
+        surface = self.surfaces.get(key)
+        if surface is not None:
+            self.hits += 1
+            return surface
+
+        preloaded = self.surfaces.get((key[0], True))
+        if not alpha and preloaded is not None:
+            # Images are preloaded with alpha, converting them again needs no decoding
+            self.hits += 1
+            surface = self.dedupe(surface=preloaded.convert())
+            self.surfaces[key] = surface
+            return surface
+
+        start = time.perf_counter()
+        surface = pygame.image.load(path)
+        surface = surface.convert_alpha() if alpha else surface.convert()
+        self.decode_ms += (time.perf_counter() - start) * 1000
+        self.decoded += 1
+
+        surface = self.dedupe(surface=surface)
+        self.surfaces[key] = surface
+
+        return surface
+
+    def dedupe(self,
+               surface: pygame.Surface,
+               pixels: bytes | None = None) -> pygame.Surface:
+        """
+            Gets the stored surface with the same pixels, surface is stored if it is new.
+
+            Args:
+                surface (pygame.Surface): Converted image.
+                pixels (bytes | None): RGBA pixels of the image if already known.
+
+            Returns:
+                pygame.Surface: Shared image with the pixels of surface.
+        """
+        if surface.get_width() * surface.get_height() > ASSET_DEDUPE_MAX_PIXELS:
+            return surface
+
+        if pixels is None:
+            pixels = pygame.image.tobytes(surface, "RGBA")
+        key = (bool(surface.get_flags() & pygame.SRCALPHA), surface.get_size(), hashlib.sha1(pixels).digest())
+
+        shared = self.contents.setdefault(key, surface)
+        if shared is not surface:
+            self.duplicates += 1
+
+        return shared
+
+    def preload(self,
+                paths: list[str],
+                workers: int,
+                on_progress: Callable[[int, int], None] | None = None) -> None:
+        """
+            Decodes images on a thread pool and converts them (convert_alpha) on the main thread.
+            Images that fail to decode are skipped, load() reports their error later.
+
+            Args:
+                paths (list[str]): Paths of the images.
+                workers (int): Number of decoding threads.
+                on_progress (Callable[[int, int], None] | None): Called on the main thread with the
+                    number of finished images and the total after every image.
+        """
+        paths = [path for path in paths if (os.path.abspath(path), True) not in self.surfaces]
+        if not paths:
+            return
+
+        start = time.perf_counter()
+        with ThreadPoolExecutor(max_workers=workers,
+                                thread_name_prefix="AssetPreload") as pool:
+            futures = [pool.submit(decode_image, path) for path in paths]
+            for done, future in enumerate(as_completed(futures), start=1):
+                try:
+                    path, size, pixels = future.result()
+                except (OSError, pygame.error):
+                    pass
+                else:
+                    surface = pygame.image.frombuffer(pixels, size, "RGBA").convert_alpha()
+                    self.surfaces[(os.path.abspath(path), True)] = self.dedupe(surface=surface,
+                                                                              pixels=pixels)
+                    self.decoded += 1
+
+                if on_progress is not None:
+                    on_progress(done, len(paths))
+
+        self.decode_ms += (time.perf_counter() - start) * 1000
+
+    def get_nbytes(self) -> int:
+        # Shared and deduplicated surfaces are counted once
+        surfaces = {id(surface): surface for surface in self.surfaces.values()}
+        return sum(surface.get_pitch() * surface.get_height() for surface in surfaces.values())
+
+    def get_stats(self) -> dict[str, int | float]:
+        """
+            Gets the load statistics.
+
+            Returns:
+                dict[str, int | float]: Decoded files, cache hits, duplicate images, decode time and pixel memory.
+        """
+        return {
+            "decoded": self.decoded,
+            "hits": self.hits,
+            "duplicates": self.duplicates,
+            "decode_ms": round(self.decode_ms, 1),
+            "nbytes": self.get_nbytes(),
+        }
+
+    def __str__(self) -> str:
+        stats = self.get_stats()
+        return (f"AssetManager: {stats['decoded']} images decoded in {stats['decode_ms']} ms, "
+                f"{stats['hits']} cache hits, {stats['duplicates']} duplicates, "
+                f"{stats['nbytes'] / 1024 / 1024:.1f} MB")
+
+
+assets = AssetManager()
@@ -6,6 +6,8 @@ from settings.buttons import *
 from settings.paths import *
 from settings.presets import *
 
+from utilities.asset_manager import assets
+from utilities.general import get_tile_indexes
 from utilities.sprites import get_preset_sprites
 
 
@@ -32,12 +34,15 @@ class TileButton:
         """
         width = image.get_width()
         height = image.get_height()
-        self.image = pygame.transform.scale(image,
-                                            (int(width * scale),
-                                             int(height * scale)))
+        # Unscaled images are the shared preset sprite, TileButtons never change their image
+        if scale == 1:
+            self.image = image
+        else:
+            self.image = pygame.transform.scale(image,
+                                                (int(width * scale),
+                                                 int(height * scale)))
         self.rect = self.image.get_rect()
         self.rect.topleft = (x, y)
-        self.clicked = False
         self.tile_index = tile_index
 
         self.editor = editor
@@ -45,28 +50,20 @@ class TileButton:
     def __str__(self) -> str:
         return f"TileButton instance (index: {self.tile_index})"
 
-    def draw(self) -> bool:
+    def update(self) -> bool:
         """
-            Draws the TileButton on screen.
-            Listens for mouse click and returns a bool conveying
+            Registers the button with the InputDispatcher and returns a bool conveying
                 if user clicked (mouse 1) on the Button.
+            The button is drawn as part of the right panel layer, see PanelRenderer.
 
             Returns:
                 bool: True if the button was clicked, False otherwise.
         """
-        action = False
-
-        if self.rect.collidepoint(self.editor.mouse_pos):
-            if pygame.mouse.get_pressed()[0] == 1 and not self.clicked:
-                self.clicked = True
-                action = True
+        input_dispatcher = self.editor.input_dispatcher
+        input_dispatcher.register(widget=self,
+                                  rect=self.rect)
 
-        if pygame.mouse.get_pressed()[0] == 0:
-            self.clicked = False
-
-        self.editor.screen.blit(self.image, (self.rect.x, self.rect.y))
-
-        return action
+        return input_dispatcher.is_pressed(widget=self)
 
 
 class UtilityButton:
@@ -92,14 +89,15 @@ class UtilityButton:
         width = image.get_width()
         height = image.get_height()
 
-        self.image = pygame.transform.scale(image,
-                                            (int(width * scale),
-                                             int(height * scale)))
-        self.image.set_alpha(200)
+        image = pygame.transform.scale(image,
+                                       (int(width * scale),
+                                        int(height * scale)))
+        # Image per state, so drawing a button is a single blit
+        self.images: dict[str, pygame.Surface] = self.get_state_images(image=image)
+        self.state = "idle"
 
-        self.rect = self.image.get_rect()
+        self.rect = image.get_rect()
         self.rect.topleft = (x, y)
-        self.clicked = False
 
         self.name = name
         self.editor = editor
@@ -107,6 +105,57 @@ class UtilityButton:
     def __str__(self) -> str:
         return f"UtilityButton instance (name: {self.name})"
 
+    @staticmethod
+    def get_state_images(image: pygame.Surface) -> dict[str, pygame.Surface]:
+        """
+            Prepares the image of the button for each state:
+                idle is translucent, hover is opaque and pressed is opaque with a highlight.
+
+            Args:
+                image (pygame.Surface): Scaled image of the button.
+
+            Returns:
+                dict[str, pygame.Surface]: Image per state.
+        """
+        idle_image = image.copy()
+        idle_image.set_alpha(BUTTON_IDLE_ALPHA)
+
+        pressed_image = image.copy()
+        pygame.draw.rect(
+            surface=pressed_image,
+            color=BUTTON_HIGHLIGHT_COLOR,
+            rect=pressed_image.get_rect(),
+            width=BUTTON_HIGHLIGHT_WIDTH
+        )
+
+        return {
+            "idle": idle_image,
+            "hover": image,
+            "pressed": pressed_image,
+        }
+
+    def update(self) -> bool:
+        """
+            Registers the button with the InputDispatcher and returns a bool conveying
+                if user clicked (mouse 1 down and up) on the Button.
+            Sets the state of the button (idle, hover or pressed).
+
+            Returns:
+                bool: True if the button was clicked, False otherwise.
+        """
+        input_dispatcher = self.editor.input_dispatcher
+        input_dispatcher.register(widget=self,
+                                  rect=self.rect)
+
+        if input_dispatcher.is_held(widget=self):
+            self.state = "pressed"
+        elif input_dispatcher.is_hovered(widget=self):
+            self.state = "hover"
+        else:
+            self.state = "idle"
+
+        return input_dispatcher.is_clicked(widget=self)
+
     def draw(self) -> bool:
         """
             Draws the button on screen.
@@ -118,38 +167,8 @@ class UtilityButton:
             Returns:
                 bool: True if the button was clicked, False otherwise.
         """
-        button_selected = False
-        action = False
-
-        if self.rect.collidepoint(self.editor.mouse_pos):
-            self.image.set_alpha(255)
-
-            if self.clicked:
-                for event in self.editor.events:
-                    if event.type == pygame.MOUSEBUTTONUP:
-                        action = True
-
-            if pygame.mouse.get_pressed()[0] == 1:
-                button_selected = True
-
-                if not self.clicked:
-                    self.clicked = True
-
-        else:
-            self.image.set_alpha(200)
-
-        if pygame.mouse.get_pressed()[0] == 0:
-            self.clicked = False
-
-        self.editor.screen.blit(self.image, (self.rect.x, self.rect.y))
-        if button_selected:
-            pygame.draw.rect(
-                surface=self.editor.screen,
-                color=BUTTON_HIGHLIGHT_COLOR,
-                rect=self.rect,
-                width=BUTTON_HIGHLIGHT_WIDTH
-            )
-            self.image.set_alpha(255)
+        action = self.update()
+        self.editor.screen.blit(self.images[self.state], self.rect)
 
         return action
 
@@ -173,9 +192,7 @@ def get_tile_buttons(preset_name: str,
     # Get tiles corresponding to the current tab
     tile_list_ = get_preset_sprites(preset_name=preset_name)
     # Get their indexes for tile-map
-    index_list = sorted([int(f.split("_")[0]) for f in
-                         os.listdir(os.path.join(PRESETS_DIR, preset_name)) if
-                         f.endswith('.png')])
+    index_list = get_tile_indexes(preset_name=preset_name)
 
     # Create and append all tile buttons
     for i in range(len(tile_list_)):
@@ -198,14 +215,16 @@ def get_utility_button(editor: any,
                        **kwargs) -> UtilityButton:
     """
         Creates a UtilityButton instance based on a dict containing the Button's parameters.
+        The image is loaded through the AssetManager when the first button using it is created.
 
         Args:
              editor (any): Current Editor instance.
-             **kwargs (dict): Button parameters (x, y, image, scale, tile_index)
+             **kwargs (dict): Button parameters (x, y, image file name in IMAGES_DIR, scale, name)
 
         Returns:
               A UtilityButton with kwargs attributes.
     """
+    kwargs["image"] = assets.load(os.path.join(IMAGES_DIR, kwargs["image"]))
     util_button = UtilityButton(editor=editor,
                                 **kwargs)
     return util_button
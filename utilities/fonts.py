@@ -1,23 +1,39 @@
+"""
+Fonts of the Editor, each font is looked up (SysFont) the first time it is used.
+Use them as module attributes: fonts.label_font.
+"""
+
 import pygame
 
+from utilities.startup_timer import startup_timer
+
 FONT = "Futura"
 
+# Name -> size
+FONT_SIZES = {
+    "label_font": 22,
+
+    # Menus
+    "presets_font": 32,  # linked with presets.py
+    "rename_map_font": 40,
+    "load_map_font": 40,
+    "load_map_info_font": 22,
+    "preferences_font": 40,
+    "popup_font": 32,
+
+    # Errors
+    "error_font": 24,
+}
+
+
+def __getattr__(name: str) -> pygame.font.Font:
+    if name not in FONT_SIZES:
+        raise AttributeError(f"module '{__name__}' has no attribute '{name}'")
+
+    with startup_timer.phase("fonts"):
+        font = pygame.font.SysFont(name=FONT,
+                                   size=FONT_SIZES[name])
+    # Later lookups find the font without calling __getattr__
+    globals()[name] = font
 
-label_font = pygame.font.SysFont(name=FONT,
-                                 size=22)
-
-# Menus
-presets_font = pygame.font.SysFont(name=FONT,
-                                   size=32)  # linked with presets.py
-rename_map_font = pygame.font.SysFont(name=FONT,
-                                      size=40)
-load_map_font = pygame.font.SysFont(name=FONT,
-                                    size=40)
-preferences_font = pygame.font.SysFont(name=FONT,
-                                       size=40)
-popup_font = pygame.font.SysFont(name=FONT,
-                                 size=32)
-
-# Errors
-error_font = pygame.font.SysFont(name=FONT,
-                                 size=24)
+    return font
@@ -3,11 +3,14 @@ import numpy as np
 from settings.presets import *
 from settings.paths import *
 
+from utilities import world_data
+from utilities.preset_registry import registry
+
 
 def get_filled_world_data(columns: int,
-                          rows: int) -> np.array:
+                          rows: int) -> world_data.DenseWorldData | world_data.SparseWorldData:
     """
-        Gets a Numpy 2d array of size columns * rows
+        Gets a world_data of size columns * rows
             where each item is 40.
 
         Args:
@@ -15,25 +18,36 @@ def get_filled_world_data(columns: int,
             rows (int): Number of rows.
 
         Returns:
-            np.array: Numpy 2d array where each item is -1.
+            DenseWorldData | SparseWorldData: world_data where each item is 40.
     """
-    return np.full((rows, columns), 40)
+    return world_data.from_array(array=np.full((rows, columns), 40, dtype=WORLD_DATA_DTYPE))
 
 
 def get_fresh_world_data(columns: int,
-                         rows: int) -> np.array:
+                         rows: int,
+                         infinite: bool = INFINITE_CANVAS) -> (world_data.DenseWorldData |
+                                                               world_data.SparseWorldData |
+                                                               world_data.InfiniteWorldData):
     """
-        Gets a Numpy 2d array of size columns * rows
-            where each item is -1.
+        Gets an empty world_data of size columns * rows
+            using the WORLD_DATA_BACKEND storage,
+            or an empty infinite canvas.
 
         Args:
             columns (int): Number of columns.
             rows (int): Number of rows.
+            infinite (bool): Whether the map has no size.
 
         Returns:
-            np.array: Numpy 2d array where each item is -1.
+            DenseWorldData | SparseWorldData | InfiniteWorldData: world_data where each item is -1.
     """
-    return np.full((rows, columns), -1)
+    if infinite:
+        return world_data.get_world_data(rows=rows,
+                                         columns=columns,
+                                         backend="infinite")
+
+    return world_data.get_world_data(rows=rows,
+                                     columns=columns)
 
 
 def get_sorted_tile_names(preset_name: str) -> list[str]:
@@ -43,16 +57,7 @@ def get_sorted_tile_names(preset_name: str) -> list[str]:
         Args:
             preset_name (str): Name of the preset
     """
-    indexes = get_tile_indexes(preset_name=preset_name)
-    full_names = os.listdir(os.path.join(PRESETS_DIR, preset_name))
-    tile_names = []
-
-    for i in range(indexes[0], indexes[-1] + 1):
-        for name in full_names:
-            if int(name.split("_")[0]) == i:
-                tile_names.append(name)
-
-    return tile_names
+    return list(registry.get_preset(preset_name=preset_name).file_names)
 
 
 def limit_string_length(string_list: list[str] | str,
@@ -90,11 +95,7 @@ def get_tile_names(preset_name: str) -> list[str]:
        Returns:
            List[str]: List of tile names.
        """
-    sorted_tile_file_names = get_sorted_tile_names(preset_name=preset_name)
-
-    tile_names = [f.split(".")[0].split("_")[-1] for f in
-                  sorted_tile_file_names
-                  if f.endswith(".png")]
+    tile_names = list(registry.get_preset(preset_name=preset_name).tile_names)
 
     return limit_string_length(string_list=tile_names,
                                max_length=MAX_TILE_NAME_LENGTH)
@@ -103,6 +104,7 @@ def get_tile_names(preset_name: str) -> list[str]:
 def get_tile_indexes(preset_name: str) -> list[int]:
     """
        Get a sorted list of tile indexes for the preset.
+       Indexes of identical images are replaced by their canonical tile id.
 
        Args:
            preset_name (str): Name of the preset.
@@ -110,6 +112,5 @@ def get_tile_indexes(preset_name: str) -> list[int]:
        Returns:
            List[int]: Sorted list of tile indexes.
        """
-    return sorted(
-        [int(f.split("_")[0]) for f in os.listdir(os.path.join(PRESETS_DIR, preset_name)) if
-         f.endswith(".png")])
+    return [registry.get_canonical_id(tile_index=tile_index)
+            for tile_index in registry.get_preset(preset_name=preset_name).tile_indexes]
@@ -14,18 +14,6 @@ def update_background(editor: Any) -> pygame.Surface:
                                   ))
 
 
-def get_scaled_backgrounds(background: pygame.Surface) -> dict[str, pygame.Surface]:
-    scales = [0.4, 0.6, 0.8, 1.0, 1.2, 1.4, 1.6]
-    backgrounds: dict[str, pygame.Surface] = {}
-    for scale in scales:
-        backgrounds[str(scale)] = pygame.transform.scale(surface=background,
-                                                         size=(
-                                                             (background.get_width() * scale),
-                                                             (background.get_height() * scale)
-                                                         ))
-    return backgrounds
-
-
 def update_class_dict(cls: Any,
                       attributes: dict):
     """
@@ -75,6 +63,10 @@ def can_place_tile(editor: Any,
     if tile_test == editor.current_object:
         return False
 
+    # Infinite canvas maps have no boundaries
+    if editor.is_infinite:
+        return True
+
     # Check top and left boundaries
     if grid_x < 0 or grid_y < 0:
         return False
@@ -111,12 +103,44 @@ def can_remove_tile(editor: Any,
     except IndexError:
         return False
 
+    # Infinite canvas maps have no boundaries
+    if editor.is_infinite:
+        return True
+
     if 0 <= grid_y < editor.world_data.shape[0] and 0 <= grid_x < editor.world_data.shape[1]:
         return True
 
     return False
 
 
+def get_minimap_extent(editor: Any) -> Tuple[float, float, float, float]:
+    """
+       Get the area of the map shown on the minimap, expressed in unscaled pixels.
+       Maps of a fixed size show the whole map.
+       Infinite canvas maps show the area holding all placed tiles and the user's view.
+
+       Returns:
+           tuple[float, float, float, float]: left, top, width and height.
+    """
+    if not editor.is_infinite:
+        return 0, 0, editor.columns * editor.grid_size_x, editor.rows * editor.grid_size_y
+
+    left = -editor.scroll_x
+    top = -editor.scroll_y
+    right = left + SCREEN_WIDTH / editor.scale
+    bottom = top + SCREEN_HEIGHT / editor.scale
+
+    bounds = editor.world_data.get_bounds()
+    if bounds is not None:
+        row_start, row_stop, col_start, col_stop = bounds
+        left = min(left, col_start * editor.grid_size_x)
+        top = min(top, row_start * editor.grid_size_y)
+        right = max(right, col_stop * editor.grid_size_x)
+        bottom = max(bottom, row_stop * editor.grid_size_y)
+
+    return left, top, right - left, bottom - top
+
+
 def get_minimap_dimensions(editor: Any) -> Tuple[float, float, float]:
     """
        Get a tuple containing the dimensions of the minimap
@@ -125,8 +149,7 @@ def get_minimap_dimensions(editor: Any) -> Tuple[float, float, float]:
        Returns:
            tuple[float, float]: minimap size.
     """
-    map_width = editor.columns * editor.grid_size_x
-    map_height = editor.rows * editor.grid_size_y
+    _, _, map_width, map_height = get_minimap_extent(editor=editor)
 
     scale_width = RIGHT_MARGIN / map_width
     scale_height = BOTTOM_MARGIN / map_height
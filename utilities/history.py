@@ -0,0 +1,349 @@
+"""
+Undo and redo history of a MapDocument.
+Every change is stored as a command object that can undo and redo itself:
+    TileStroke: all tiles placed or removed from mouse down to mouse up.
+    MapSnapshot: the map attributes before and after a bulk change (wipe, crop, resize, load).
+Commands are kept in deques bounded by HISTORY_MEMORY_BUDGET instead of a number of entries.
+Every change, including undo and redo, is also passed to the MapJournal of the map.
+"""
+
+from collections import deque
+from typing import Any, Self
+
+import numpy as np
+
+from settings.setup import HISTORY_MEMORY_BUDGET, WORLD_DATA_DTYPE
+
+
+# MapDocument attributes stored by a MapSnapshot
+SNAPSHOT_ATTRIBUTES = (
+    "world_data",
+    "rows",
+    "columns",
+    "grid_size_x",
+    "grid_size_y",
+    "map_name",
+    "temp_map_name",
+)
+
+# Estimated memory of a MapSnapshot apart from world_data
+SNAPSHOT_OVERHEAD = 512
+
+
+class TileStroke:
+    """
+        All tiles placed or removed during one stroke, from mouse down to mouse up.
+        While recording, changes are collected per cell so a cell changed twice keeps
+            its first old value and its last new value.
+        Once finished the changes are stored as Numpy arrays.
+
+        Returns:
+            Self.
+    """
+
+    def __init__(self) -> Self:
+        # (row, col) -> [old tile index, new tile index]
+        self.changes: dict[tuple[int, int], list[int]] = {}
+
+        self.rows: np.ndarray | None = None
+        self.cols: np.ndarray | None = None
+        self.old_values: np.ndarray | None = None
+        self.new_values: np.ndarray | None = None
+
+    def __len__(self) -> int:
+        if self.rows is None:
+            return len(self.changes)
+
+        return len(self.rows)
+
+    @property
+    def nbytes(self) -> int:
+        if self.rows is None:
+            return len(self.changes) * 200
+
+        return self.rows.nbytes + self.cols.nbytes + self.old_values.nbytes + self.new_values.nbytes
+
+    def add(self,
+            row: int,
+            col: int,
+            old_value: int,
+            new_value: int) -> None:
+        """
+            Records a single tile change.
+
+            Args:
+                row (int): Row of the tile.
+                col (int): Column of the tile.
+                old_value (int): Tile index before the change.
+                new_value (int): Tile index after the change.
+        """
+        change = self.changes.get((row, col))
+        if change is None:
+            self.changes[(row, col)] = [int(old_value), int(new_value)]
+        else:
+            change[1] = int(new_value)
+
+    def finish(self) -> None:
+        """
+            Converts the recorded changes to Numpy arrays.
+            Cells that ended with their old value are dropped.
+        """
+        changes = [(row, col, old_value, new_value)
+                   for (row, col), (old_value, new_value) in self.changes.items()
+                   if old_value != new_value]
+        self.changes = {}
+
+        coords = np.array([change[:2] for change in changes], dtype=np.int64).reshape(-1, 2)
+        values = np.array([change[2:] for change in changes], dtype=WORLD_DATA_DTYPE).reshape(-1, 2)
+        self.rows = coords[:, 0].copy()
+        self.cols = coords[:, 1].copy()
+        self.old_values = values[:, 0].copy()
+        self.new_values = values[:, 1].copy()
+
+    def apply(self,
+              document: Any,
+              values: np.ndarray) -> None:
+        """
+            Sets the tiles of the stroke to the given values.
+
+            Args:
+                document (Any): MapDocument of the map.
+                values (np.ndarray): Tile index per changed cell.
+        """
+        for row, col, value in zip(self.rows.tolist(), self.cols.tolist(), values.tolist()):
+            document.world_data[row, col] = value
+            document.invalidate_tile(x=col, y=row)
+
+    def undo(self,
+             document: Any) -> None:
+        self.apply(document=document,
+                   values=self.old_values)
+
+    def redo(self,
+             document: Any) -> None:
+        self.apply(document=document,
+                   values=self.new_values)
+
+
+class MapSnapshot:
+    """
+        The map attributes before and after a bulk change.
+        Bulk changes replace world_data instead of changing it, the replaced world_data is
+            therefore stored as is (copy-on-write) and only swapped back on undo.
+
+        Args:
+            before (dict): SNAPSHOT_ATTRIBUTES before the change.
+            after (dict): SNAPSHOT_ATTRIBUTES after the change.
+
+        Returns:
+            Self.
+    """
+
+    def __init__(self,
+                 before: dict,
+                 after: dict) -> Self:
+        self.before = before
+        self.after = after
+
+    @property
+    def nbytes(self) -> int:
+        # The world_data after the change is either the current map or part of a later command
+        return self.before["world_data"].nbytes + SNAPSHOT_OVERHEAD
+
+    @staticmethod
+    def apply(document: Any,
+              attributes: dict) -> None:
+        """
+            Sets the map attributes of the MapDocument.
+
+            Args:
+                document (Any): MapDocument of the map.
+                attributes (dict): SNAPSHOT_ATTRIBUTES to set.
+        """
+        for name, value in attributes.items():
+            setattr(document, name, value)
+        document.invalidate_all()
+
+    def undo(self,
+             document: Any) -> None:
+        self.apply(document=document,
+                   attributes=self.before)
+
+    def redo(self,
+             document: Any) -> None:
+        self.apply(document=document,
+                   attributes=self.after)
+
+
+class History:
+    """
+        Keeps track of the undo and redo commands of a MapDocument.
+        Oldest commands are dropped once the commands use more than memory_budget bytes.
+
+        Args:
+            memory_budget (int): Maximum number of bytes used by all commands.
+            journal (Any): MapJournal receiving every change, or None.
+
+        Returns:
+            Self.
+    """
+
+    def __init__(self,
+                 memory_budget: int = HISTORY_MEMORY_BUDGET,
+                 journal: Any = None) -> Self:
+        self.memory_budget = memory_budget
+        self.journal = journal
+
+        self.undo_stack: deque[TileStroke | MapSnapshot] = deque()
+        self.redo_stack: deque[TileStroke | MapSnapshot] = deque()
+        self.nbytes = 0
+
+        # Stroke being recorded while a mouse button is held
+        self.stroke: TileStroke | None = None
+
+    @staticmethod
+    def get_snapshot_attributes(document: Any) -> dict:
+        """
+            Gets the current map attributes of the MapDocument.
+
+            Args:
+                document (Any): MapDocument of the map.
+
+            Returns:
+                dict: SNAPSHOT_ATTRIBUTES and their values.
+        """
+        return {name: getattr(document, name) for name in SNAPSHOT_ATTRIBUTES}
+
+    def record_tile(self,
+                    row: int,
+                    col: int,
+                    old_value: int,
+                    new_value: int) -> None:
+        """
+            Adds a tile change to the current stroke, starting a stroke if needed.
+
+            Args:
+                row (int): Row of the tile.
+                col (int): Column of the tile.
+                old_value (int): Tile index before the change.
+                new_value (int): Tile index after the change.
+        """
+        if self.stroke is None:
+            self.stroke = TileStroke()
+
+        self.stroke.add(row=row,
+                        col=col,
+                        old_value=old_value,
+                        new_value=new_value)
+        if self.journal is not None:
+            self.journal.record_tile(row=row,
+                                     col=col,
+                                     value=new_value)
+
+    def end_stroke(self) -> None:
+        """
+            Finishes the current stroke and stores it as a single command.
+            Is called when the mouse buttons are released.
+        """
+        if self.stroke is None:
+            return
+
+        stroke = self.stroke
+        self.stroke = None
+        stroke.finish()
+        if len(stroke):
+            self.push(command=stroke)
+
+    def record_snapshot(self,
+                        document: Any,
+                        before: dict) -> None:
+        """
+            Stores a bulk change as a single command.
+
+            Args:
+                document (Any): MapDocument of the map.
+                before (dict): Result of get_snapshot_attributes from before the change.
+        """
+        self.end_stroke()
+        self.push(command=MapSnapshot(before=before,
+                                      after=self.get_snapshot_attributes(document=document)))
+        if self.journal is not None:
+            self.journal.record_snapshot(document=document)
+
+    def journal_command(self,
+                        document: Any,
+                        command: TileStroke | MapSnapshot,
+                        is_undo: bool) -> None:
+        """
+            Passes the changes of an undone or redone command to the journal.
+
+            Args:
+                document (Any): MapDocument of the map.
+                command (TileStroke | MapSnapshot): Undone or redone command.
+                is_undo (bool): Whether the command was undone.
+        """
+        if self.journal is None:
+            return
+
+        if isinstance(command, TileStroke):
+            self.journal.record_tiles(rows=command.rows,
+                                      cols=command.cols,
+                                      values=command.old_values if is_undo else command.new_values)
+        else:
+            self.journal.record_snapshot(document=document)
+
+    def push(self,
+             command: TileStroke | MapSnapshot) -> None:
+        """
+            Adds a new command, clears the redo commands and drops the oldest commands
+                when memory_budget is exceeded.
+
+            Args:
+                command (TileStroke | MapSnapshot): Command to add.
+        """
+        self.undo_stack.append(command)
+        self.nbytes += command.nbytes
+
+        self.nbytes -= sum(redo_command.nbytes for redo_command in self.redo_stack)
+        self.redo_stack.clear()
+
+        while self.nbytes > self.memory_budget and len(self.undo_stack) > 1:
+            self.nbytes -= self.undo_stack.popleft().nbytes
+
+    def undo(self,
+             document: Any) -> None:
+        """
+            Undoes the last command and moves it to the redo commands.
+
+            Args:
+                document (Any): MapDocument of the map.
+        """
+        self.end_stroke()
+        if not self.undo_stack:
+            return
+
+        command = self.undo_stack.pop()
+        command.undo(document=document)
+        self.journal_command(document=document,
+                             command=command,
+                             is_undo=True)
+        self.redo_stack.append(command)
+
+    def redo(self,
+             document: Any) -> None:
+        """
+            Redoes the last undone command and moves it back to the undo commands.
+
+            Args:
+                document (Any): MapDocument of the map.
+        """
+        self.end_stroke()
+        if not self.redo_stack:
+            return
+
+        command = self.redo_stack.pop()
+        command.redo(document=document)
+        self.journal_command(document=document,
+                             command=command,
+                             is_undo=False)
+        self.undo_stack.append(command)
@@ -0,0 +1,98 @@
+from typing import Any, NamedTuple
+
+import numpy as np
+
+from settings.setup import EMPTY_TILE
+
+
+class MapExtent(NamedTuple):
+    """
+        Result of analysing world_data.
+        The bounding box uses stop values that are one past the last used row and column,
+            it is (0, 0, 0, 0) when no tiles are placed.
+
+        Attributes:
+            row_start (int): First row holding a tile.
+            row_stop (int): Row after the last row holding a tile.
+            col_start (int): First column holding a tile.
+            col_stop (int): Column after the last column holding a tile.
+            used_rows (np.ndarray): Per row of the analysed area, True if it holds a tile.
+            used_cols (np.ndarray): Per column of the analysed area, True if it holds a tile.
+            tile_counts (dict[int, int]): Number of placed tiles per tile index.
+    """
+    row_start: int
+    row_stop: int
+    col_start: int
+    col_stop: int
+    used_rows: np.ndarray
+    used_cols: np.ndarray
+    tile_counts: dict[int, int]
+
+    @property
+    def is_empty(self) -> bool:
+        return not self.tile_counts
+
+    def is_within(self,
+                  rows: int,
+                  columns: int) -> bool:
+        """
+            Checks if all placed tiles fit in a map of the given size.
+
+            Args:
+                rows (int): Number of rows.
+                columns (int): Number of columns.
+
+            Returns:
+                bool: True if no tile is placed outside the given size, else False.
+        """
+        return self.is_empty or (self.row_start >= 0 and self.col_start >= 0
+                                 and self.row_stop <= rows and self.col_stop <= columns)
+
+
+def get_map_extent(world_data: Any) -> MapExtent:
+    """
+        Gets the bounding box of the placed tiles, the per row and column occupancy and
+            the number of tiles per tile index using Numpy reductions over a single mask.
+
+        Args:
+            world_data (Any): DenseWorldData, SparseWorldData or InfiniteWorldData.
+
+        Returns:
+            MapExtent: Analysis of world_data.
+    """
+    array = world_data.to_array()
+
+    # Infinite canvas maps return the area holding all tiles, which may start at negative coordinates
+    row_offset, col_offset = 0, 0
+    if world_data.backend == "infinite" and world_data.get_bounds() is not None:
+        row_offset, _, col_offset, _ = world_data.get_bounds()
+
+    mask = array != EMPTY_TILE
+    used_rows = np.any(mask, axis=1)
+    used_cols = np.any(mask, axis=0)
+
+    if not used_rows.any():
+        return MapExtent(row_start=0,
+                         row_stop=0,
+                         col_start=0,
+                         col_stop=0,
+                         used_rows=used_rows,
+                         used_cols=used_cols,
+                         tile_counts={})
+
+    # argmax returns the first True, on the reversed mask the last True
+    row_start = int(np.argmax(used_rows))
+    row_stop = len(used_rows) - int(np.argmax(used_rows[::-1]))
+    col_start = int(np.argmax(used_cols))
+    col_stop = len(used_cols) - int(np.argmax(used_cols[::-1]))
+
+    counts = np.bincount(array[mask].astype(np.intp))
+    tile_counts = {int(index): int(counts[index]) for index in np.flatnonzero(counts)}
+
+    return MapExtent(row_start=row_start + row_offset,
+                     row_stop=row_stop + row_offset,
+                     col_start=col_start + col_offset,
+                     col_stop=col_stop + col_offset,
+                     used_rows=used_rows,
+                     used_cols=used_cols,
+                     tile_counts=tile_counts)
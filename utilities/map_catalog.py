@@ -0,0 +1,342 @@
+"""
+Catalog of the maps in MAPS_DIR, used by the load menu.
+
+The catalog is stored in MAPS_DIR/MAP_CATALOG_NAME as json, per map:
+    size          bytes of the map file
+    mtime_ns      last change of the map file or its journal
+    rows          number of rows
+    columns       number of columns
+    is_infinite   whether the map is an infinite canvas
+    tile_count    number of placed tiles
+    checksum      crc32 of the map file
+    thumbnail     file name of the thumbnail PNG in MAP_THUMBNAILS_DIR_NAME
+
+Entries are updated by the save thread after a map is written or its journal is committed,
+    and refreshed when the load menu opens, only maps whose size or modification time changed are read.
+"""
+
+import json
+import os
+import pickle
+import threading
+import zlib
+from typing import Any
+
+import numpy as np
+import pygame
+
+from settings.map_file import *
+
+from utilities import map_format, map_journal
+
+
+def get_autosave_path(map_path: str,
+                      generation: int) -> str:
+    return f"{map_path}{AUTOSAVE_SUFFIX}{generation}"
+
+
+def is_autosave_file(file_name: str) -> bool:
+    """
+        Checks if a file in MAPS_DIR is an autosave instead of a map.
+
+        Args:
+            file_name (str): Name of the file.
+
+        Returns:
+            bool: True if the file is one of the rotating autosaves of a map, else False.
+    """
+    name, separator, generation = file_name.rpartition(AUTOSAVE_SUFFIX)
+    return bool(separator) and bool(name) and generation.isdigit()
+
+
+def get_map_names(maps_dir: str) -> list[str]:
+    """
+        Gets the names of the map files in a folder.
+        Journals, autosaves, unfinished saves, the catalog and the thumbnails are skipped.
+
+        Args:
+            maps_dir (str): Folder containing the maps.
+
+        Returns:
+            list[str]: Sorted names of the map files.
+    """
+    return sorted(file_name for file_name in os.listdir(maps_dir)
+                  if not file_name.startswith(".")
+                  and not file_name.endswith(".tmp")
+                  and not map_journal.is_journal_file(file_name=file_name)
+                  and not is_autosave_file(file_name=file_name)
+                  and os.path.isfile(os.path.join(maps_dir, file_name)))
+
+
+def get_stamp(map_path: str) -> tuple[int, int]:
+    """
+        Gets the size of a map file and the last time the map or its journal changed.
+
+        Args:
+            map_path (str): Path of the map file.
+
+        Returns:
+            tuple[int, int]: Size in bytes and modification time in nanoseconds.
+    """
+    stat = os.stat(map_path)
+    mtime_ns = stat.st_mtime_ns
+    try:
+        mtime_ns = max(mtime_ns, os.stat(map_journal.get_journal_path(map_path=map_path)).st_mtime_ns)
+    except FileNotFoundError:
+        pass
+
+    return stat.st_size, mtime_ns
+
+
+def get_checksum(path: str) -> str:
+    """
+        Gets the crc32 of a file, read in chunks.
+
+        Args:
+            path (str): Path of the file.
+
+        Returns:
+            str: Checksum as 8 hexadecimal characters.
+    """
+    checksum = 0
+    with open(file=path,
+              mode="rb") as file:
+        while chunk := file.read(1 << 20):
+            checksum = zlib.crc32(chunk, checksum)
+
+    return f"{checksum:08x}"
+
+
+def get_thumbnail_pixels(world_data: Any) -> np.ndarray:
+    """
+        Gets a thumbnail of the map with one pixel per block of cells.
+        A block shows its highest tile index, so single tiles stay visible on large maps.
+        Tiles get a fixed color per tile index.
+
+        Args:
+            world_data (Any): DenseWorldData, SparseWorldData or InfiniteWorldData.
+
+        Returns:
+            np.ndarray: (height, width, 3) array of RGB values.
+    """
+    array = world_data.to_array()
+    if array.size == 0:
+        array = np.full((1, 1), EMPTY_TILE, dtype=WORLD_DATA_DTYPE)
+
+    step = max(1, int(np.ceil(max(array.shape) / MAP_THUMBNAIL_SIZE)))
+    height, width = -(-array.shape[0] // step), -(-array.shape[1] // step)
+    padded = np.full((height * step, width * step), EMPTY_TILE, dtype=array.dtype)
+    padded[:array.shape[0], :array.shape[1]] = array
+    # EMPTY_TILE is lower than every tile index
+    cells = padded.reshape(height, step, width, step).max(axis=(1, 3))
+
+    pixels = np.empty(cells.shape + (3,), dtype=np.uint8)
+    pixels[:] = MAP_THUMBNAIL_EMPTY_COLOR
+    mask = cells != EMPTY_TILE
+    tile_indexes = cells[mask].astype(np.int64)
+    pixels[mask] = np.stack([(tile_indexes * 97) % 200 + 55,
+                             (tile_indexes * 57) % 200 + 55,
+                             (tile_indexes * 31) % 200 + 55], axis=1)
+
+    return pixels
+
+
+class MapCatalog:
+    """
+        Keeps the catalog of MAPS_DIR and the thumbnails of the maps.
+        Is shared by the save thread and the load menu, access to the entries is locked.
+
+        Args:
+            maps_dir (str): Folder containing the maps.
+
+        Returns:
+            Self.
+    """
+
+    def __init__(self,
+                 maps_dir: str):
+        self.maps_dir = maps_dir
+        self.path = os.path.join(maps_dir, MAP_CATALOG_NAME)
+        self.thumbnails_dir = os.path.join(maps_dir, MAP_THUMBNAILS_DIR_NAME)
+
+        self.lock = threading.Lock()
+        self.entries: dict[str, dict] = self.read()
+
+        # name -> (mtime_ns, thumbnail), loaded by the main thread
+        self.thumbnails: dict[str, tuple[int, pygame.Surface]] = {}
+
+    def read(self) -> dict[str, dict]:
+        """
+            Reads the catalog file, a missing or outdated catalog is rebuilt by refresh().
+
+            Returns:
+                dict[str, dict]: Entry per map name.
+        """
+        try:
+            with open(file=self.path,
+                      mode="r",
+                      encoding="utf-8") as catalog_file:
+                catalog = json.load(catalog_file)
+        except (OSError, ValueError):
+            return {}
+
+        if catalog.get("version") != MAP_CATALOG_VERSION:
+            return {}
+
+        return catalog.get("maps", {})
+
+    def write(self) -> None:
+        catalog = {
+            "version": MAP_CATALOG_VERSION,
+            "maps": self.entries,
+        }
+        map_format.write_file(self.path,
+                              json.dumps(catalog, indent=1, sort_keys=True).encode("utf-8"))
+
+    def get_entry(self,
+                  name: str,
+                  rows: int,
+                  columns: int,
+                  world_data: Any) -> dict:
+        """
+            Builds the catalog entry of a map and writes its thumbnail.
+
+            Args:
+                name (str): Name of the map.
+                rows (int): Number of rows.
+                columns (int): Number of columns.
+                world_data (Any): world_data of the map including its journal.
+
+            Returns:
+                dict: Catalog entry.
+        """
+        map_path = os.path.join(self.maps_dir, name)
+        size, mtime_ns = get_stamp(map_path=map_path)
+
+        os.makedirs(self.thumbnails_dir, exist_ok=True)
+        thumbnail = f"{name}.png"
+        thumbnail_path = os.path.join(self.thumbnails_dir, thumbnail)
+        temp_path = os.path.join(self.thumbnails_dir, f"{name}.tmp.png")
+        pixels = get_thumbnail_pixels(world_data=world_data)
+        pygame.image.save(pygame.surfarray.make_surface(pixels.swapaxes(0, 1)), temp_path)
+        os.replace(temp_path, thumbnail_path)
+
+        return {
+            "size": size,
+            "mtime_ns": mtime_ns,
+            "rows": rows,
+            "columns": columns,
+            "is_infinite": world_data.backend == "infinite",
+            "tile_count": int(np.count_nonzero(world_data.to_array() != EMPTY_TILE)),
+            "checksum": get_checksum(path=map_path),
+            "thumbnail": thumbnail,
+        }
+
+    def update_entry(self,
+                     name: str,
+                     rows: int,
+                     columns: int,
+                     world_data: Any) -> None:
+        """
+            Updates the entry of a map that was just saved.
+            Is called by the save thread.
+
+            Args:
+                name (str): Name of the map.
+                rows (int): Number of rows.
+                columns (int): Number of columns.
+                world_data (Any): world_data that was saved.
+        """
+        with self.lock:
+            self.entries[name] = self.get_entry(name=name,
+                                                rows=rows,
+                                                columns=columns,
+                                                world_data=world_data)
+            self.write()
+
+    def refresh(self,
+                open_map_name: str | None = None) -> list[str]:
+        """
+            Brings the catalog up to date with MAPS_DIR.
+            Only maps that are new or whose size or modification time changed are loaded,
+                files that cannot be loaded as a map are left out.
+            The entry of the map being edited is kept, its journal changes with every edit.
+                The save thread updates the entry whenever the map is saved.
+
+            Args:
+                open_map_name (str | None): Name of the map being edited.
+
+            Returns:
+                list[str]: Sorted names of the maps in the catalog.
+        """
+        with self.lock:
+            names = get_map_names(maps_dir=self.maps_dir)
+            is_changed = False
+
+            for name in set(self.entries) - set(names):
+                del self.entries[name]
+                self.thumbnails.pop(name, None)
+                is_changed = True
+
+            for name in names:
+                map_path = os.path.join(self.maps_dir, name)
+                size, mtime_ns = get_stamp(map_path=map_path)
+                entry = self.entries.get(name)
+                if entry is not None and (name == open_map_name
+                                          or (entry["size"] == size and entry["mtime_ns"] == mtime_ns)):
+                    continue
+
+                try:
+                    rows, columns, grid_size_x, grid_size_y, world_data = map_format.load_map(path=map_path)
+                    rows, columns, grid_size_x, grid_size_y, world_data = map_journal.replay(
+                        map_path=map_path,
+                        rows=rows,
+                        columns=columns,
+                        grid_size_x=grid_size_x,
+                        grid_size_y=grid_size_y,
+                        world_data=world_data
+                    )
+                except (OSError, ValueError, EOFError, pickle.UnpicklingError):
+                    # Not a map file
+                    self.entries.pop(name, None)
+                    continue
+
+                self.entries[name] = self.get_entry(name=name,
+                                                    rows=rows,
+                                                    columns=columns,
+                                                    world_data=world_data)
+                is_changed = True
+
+            if is_changed:
+                self.write()
+
+            return [name for name in names if name in self.entries]
+
+    def get_thumbnail(self,
+                      name: str) -> pygame.Surface | None:
+        """
+            Gets the thumbnail of a map, thumbnails are loaded once per change of the map.
+
+            Args:
+                name (str): Name of the map.
+
+            Returns:
+                pygame.Surface | None: Thumbnail or None if the map has no thumbnail.
+        """
+        entry = self.entries.get(name)
+        if entry is None:
+            return None
+
+        cached = self.thumbnails.get(name)
+        if cached is not None and cached[0] == entry["mtime_ns"]:
+            return cached[1]
+
+        try:
+            thumbnail = pygame.image.load(os.path.join(self.thumbnails_dir, entry["thumbnail"])).convert()
+        except (OSError, pygame.error):
+            return None
+
+        self.thumbnails[name] = (entry["mtime_ns"], thumbnail)
+
+        return thumbnail
+
@@ -0,0 +1,419 @@
+"""
+Reading and writing map files.
+
+A map file starts with a header of MAP_FILE_HEADER_SIZE bytes, little-endian:
+    magic         8s   MAP_FILE_MAGIC
+    version       H    MAP_FILE_VERSION
+    compression   B    0 raw, 1 zlib, 2 lzma
+    kind          B    0 map of a fixed size, 1 infinite canvas
+    dtype         8s   Numpy dtype string of the tiles, e.g. '<i2'
+    rows          i
+    columns       i
+    grid_size_x   i
+    grid_size_y   i
+    block_size    i    cells per block side, infinite canvas only
+    nr_blocks     i    number of blocks, infinite canvas only
+    payload_size  Q    number of (compressed) payload bytes
+    padding            zeros up to MAP_FILE_HEADER_SIZE
+
+The payload directly follows the header:
+    fixed size:      rows * columns tiles in row-major order.
+    infinite canvas: nr_blocks * 2 int32 block coordinates (block_row, block_col),
+                     followed by nr_blocks * block_size * block_size tiles.
+
+Files without the magic are maps saved before this format, a pickled list of
+    [rows, columns, grid_size_x, grid_size_y, world_data].
+They are read with an Unpickler that only accepts Numpy arrays.
+
+None of the functions depend on pygame.
+"""
+
+import io
+import lzma
+import os
+import pickle
+import struct
+import zlib
+from typing import Any, Tuple
+
+import numpy as np
+
+from settings.map_file import *
+
+from utilities import world_data as world_data_backend
+
+
+HEADER = struct.Struct("<8sHBB8siiiiiiQ")
+
+COMPRESSIONS = {
+    "raw": 0,
+    "zlib": 1,
+    "lzma": 2,
+}
+
+KIND_FIXED = 0
+KIND_INFINITE = 1
+
+# Globals needed to unpickle the Numpy arrays of legacy maps
+LEGACY_PICKLE_GLOBALS = {
+    ("numpy.core.multiarray", "_reconstruct"),
+    ("numpy._core.multiarray", "_reconstruct"),
+    ("numpy.core.multiarray", "scalar"),
+    ("numpy._core.multiarray", "scalar"),
+    ("numpy", "ndarray"),
+    ("numpy", "dtype"),
+}
+
+
+class LegacyMapUnpickler(pickle.Unpickler):
+    """
+        Unpickler for maps saved before the binary format.
+        Refuses every global except the ones needed to rebuild Numpy arrays,
+            so loading a map cannot run arbitrary code.
+    """
+
+    def find_class(self,
+                   module: str,
+                   name: str) -> Any:
+        if (module, name) in LEGACY_PICKLE_GLOBALS:
+            return super().find_class(module, name)
+
+        raise pickle.UnpicklingError(f"Map file contains forbidden global '{module}.{name}'.")
+
+
+def compress(payload: bytes,
+             compression: str) -> bytes:
+    """
+        Compresses the tile payload.
+
+        Args:
+            payload (bytes): Uncompressed tiles.
+            compression (str): 'raw', 'zlib' or 'lzma'.
+
+        Returns:
+            bytes: Compressed tiles.
+    """
+    match compression:
+        case "raw":
+            return payload
+        case "zlib":
+            return zlib.compress(payload, MAP_FILE_COMPRESSION_LEVEL)
+        case "lzma":
+            return lzma.compress(payload)
+
+    raise ValueError(f"Unknown map file compression '{compression}'.")
+
+
+def decompress(payload: bytes | bytearray,
+               compression: int) -> bytes | bytearray:
+    """
+        Decompresses the tile payload.
+
+        Args:
+            payload (bytes | bytearray): Compressed tiles.
+            compression (int): Compression id from the header.
+
+        Returns:
+            bytes | bytearray: Uncompressed tiles.
+    """
+    match compression:
+        case 0:
+            return payload
+        case 1:
+            return zlib.decompress(payload)
+        case 2:
+            return lzma.decompress(payload)
+
+    raise ValueError(f"Unknown map file compression id {compression}.")
+
+
+def get_payload(world_data: Any) -> Tuple[int, int, int, bytes]:
+    """
+        Gets the uncompressed tile payload of world_data.
+
+        Args:
+            world_data (Any): DenseWorldData, SparseWorldData or InfiniteWorldData.
+
+        Returns:
+            Tuple[int, int, int, bytes]: kind, block_size, nr_blocks and the payload.
+    """
+    if world_data.backend != "infinite":
+        array = np.ascontiguousarray(world_data.to_array(), dtype=WORLD_DATA_DTYPE)
+        return KIND_FIXED, 0, 0, array.tobytes()
+
+    save_data = world_data.get_save_data()
+    keys = np.array(list(save_data["blocks"].keys()), dtype="<i4").reshape(-1, 2)
+    blocks = np.array(list(save_data["blocks"].values()), dtype=WORLD_DATA_DTYPE)
+
+    return KIND_INFINITE, save_data["block_size"], len(keys), keys.tobytes() + blocks.tobytes()
+
+
+def is_memmap_size(rows: int,
+                   columns: int) -> bool:
+    """
+        Checks if a map is large enough to be stored uncompressed and opened with np.memmap.
+
+        Args:
+            rows (int): Number of rows.
+            columns (int): Number of columns.
+
+        Returns:
+            bool: True if MAP_FILE_MEMMAP is set and the map has at least MAP_FILE_MEMMAP_MIN_CELLS cells,
+                else False.
+    """
+    return MAP_FILE_MEMMAP and rows * columns >= MAP_FILE_MEMMAP_MIN_CELLS
+
+
+def get_header(compression: str,
+               kind: int,
+               rows: int,
+               columns: int,
+               grid_size_x: int,
+               grid_size_y: int,
+               block_size: int,
+               nr_blocks: int,
+               payload_size: int) -> bytes:
+    """
+        Packs the header of a map file, padded to MAP_FILE_HEADER_SIZE.
+
+        Returns:
+            bytes: Header.
+    """
+    header = HEADER.pack(MAP_FILE_MAGIC,
+                         MAP_FILE_VERSION,
+                         COMPRESSIONS[compression],
+                         kind,
+                         np.dtype(WORLD_DATA_DTYPE).newbyteorder("<").str.encode(),
+                         rows,
+                         columns,
+                         grid_size_x,
+                         grid_size_y,
+                         block_size,
+                         nr_blocks,
+                         payload_size)
+
+    return header.ljust(MAP_FILE_HEADER_SIZE, b"\x00")
+
+
+def write_file(path: str,
+               *parts: bytes) -> None:
+    """
+        Writes a file to a temporary file first and renames it over path,
+            so a failed write never leaves a broken map and open memory maps of
+            the old file stay valid.
+
+        Args:
+            path (str): Path of the file.
+            *parts (bytes): Content of the file.
+    """
+    temp_path = f"{path}.tmp"
+    with open(file=temp_path,
+              mode="wb") as temp_file:
+        for part in parts:
+            temp_file.write(part)
+
+    os.replace(temp_path, path)
+
+
+def save_map(path: str,
+             world_data: Any,
+             rows: int,
+             columns: int,
+             grid_size_x: int,
+             grid_size_y: int,
+             compression: str | None = None) -> None:
+    """
+        Writes a map file.
+        Large maps are stored uncompressed so they can be opened with np.memmap.
+
+        Args:
+            path (str): Path of the map file.
+            world_data (Any): DenseWorldData, SparseWorldData or InfiniteWorldData.
+            rows (int): Number of rows.
+            columns (int): Number of columns.
+            grid_size_x (int): Width of a cell.
+            grid_size_y (int): Height of a cell.
+            compression (str | None): 'raw', 'zlib', 'lzma' or None to pick one based on the map size.
+    """
+    write_file(path,
+               *get_map_parts(world_data=world_data,
+                              rows=rows,
+                              columns=columns,
+                              grid_size_x=grid_size_x,
+                              grid_size_y=grid_size_y,
+                              compression=compression))
+
+
+def get_map_parts(world_data: Any,
+                  rows: int,
+                  columns: int,
+                  grid_size_x: int,
+                  grid_size_y: int,
+                  compression: str | None = None) -> Tuple[bytes, bytes]:
+    """
+        Gets the header and the compressed payload of a map file.
+
+        Args:
+            world_data (Any): DenseWorldData, SparseWorldData or InfiniteWorldData.
+            rows (int): Number of rows.
+            columns (int): Number of columns.
+            grid_size_x (int): Width of a cell.
+            grid_size_y (int): Height of a cell.
+            compression (str | None): 'raw', 'zlib', 'lzma' or None to pick one based on the map size.
+
+        Returns:
+            Tuple[bytes, bytes]: Header and payload.
+    """
+    kind, block_size, nr_blocks, payload = get_payload(world_data=world_data)
+    if compression is None:
+        if kind == KIND_FIXED and is_memmap_size(rows=rows, columns=columns):
+            compression = "raw"
+        else:
+            compression = MAP_FILE_COMPRESSION
+
+    payload = compress(payload=payload,
+                       compression=compression)
+
+    return get_header(compression=compression,
+                      kind=kind,
+                      rows=rows,
+                      columns=columns,
+                      grid_size_x=grid_size_x,
+                      grid_size_y=grid_size_y,
+                      block_size=block_size,
+                      nr_blocks=nr_blocks,
+                      payload_size=len(payload)), payload
+
+
+def is_map_file(path: str) -> bool:
+    """
+        Checks if a file starts with the map file magic.
+
+        Args:
+            path (str): Path of the file.
+
+        Returns:
+            bool: True if the file uses the binary map format, else False.
+    """
+    with open(file=path,
+              mode="rb") as map_file:
+        return map_file.read(len(MAP_FILE_MAGIC)) == MAP_FILE_MAGIC
+
+
+def read_header(map_file: io.BufferedIOBase) -> tuple:
+    """
+        Reads and checks the header of an opened map file.
+
+        Args:
+            map_file (io.BufferedIOBase): Map file opened at its start.
+
+        Returns:
+            tuple: Unpacked header fields.
+    """
+    header = HEADER.unpack(map_file.read(MAP_FILE_HEADER_SIZE)[:HEADER.size])
+    version = header[1]
+    if version > MAP_FILE_VERSION:
+        raise ValueError(f"Map file version {version} is newer than supported version {MAP_FILE_VERSION}.")
+
+    return header
+
+
+def load_map(path: str) -> Tuple[int, int, int, int, Any]:
+    """
+        Reads a map file, legacy pickled maps are detected and converted.
+        Large uncompressed maps are opened with np.memmap (mode 'c'), only the parts that are
+            accessed are read and changes are kept in memory, the file only changes when the map is saved.
+        Other uncompressed payloads are read into a writable buffer and used without copying.
+
+        Args:
+            path (str): Path of the map file.
+
+        Returns:
+            Tuple[int, int, int, int, Any]: rows, columns, grid_size_x, grid_size_y and world_data.
+    """
+    if not is_map_file(path=path):
+        return load_legacy_map(path=path)
+
+    with open(file=path,
+              mode="rb") as map_file:
+        header = read_header(map_file=map_file)
+        (_, _, compression, kind, dtype,
+         rows, columns, grid_size_x, grid_size_y, _, _, _) = header
+        dtype = np.dtype(dtype.rstrip(b"\x00").decode())
+
+        if (compression == COMPRESSIONS["raw"] and kind == KIND_FIXED
+                and dtype == WORLD_DATA_DTYPE and WORLD_DATA_BACKEND == "dense"
+                and is_memmap_size(rows=rows, columns=columns)):
+            tiles = np.memmap(path,
+                              dtype=dtype,
+                              mode="c",
+                              offset=MAP_FILE_HEADER_SIZE,
+                              shape=(rows, columns))
+            return rows, columns, grid_size_x, grid_size_y, world_data_backend.DenseWorldData(data=tiles)
+
+        return read_map(map_file=map_file,
+                        header=header)
+
+
+def read_map(map_file: io.BufferedIOBase,
+             header: tuple) -> Tuple[int, int, int, int, Any]:
+    """
+        Reads the payload following a header and builds world_data.
+
+        Args:
+            map_file (io.BufferedIOBase): Map file opened right after its header.
+            header (tuple): Result of read_header.
+
+        Returns:
+            Tuple[int, int, int, int, Any]: rows, columns, grid_size_x, grid_size_y and world_data.
+    """
+    (_, _, compression, kind, dtype,
+     rows, columns, grid_size_x, grid_size_y,
+     block_size, nr_blocks, payload_size) = header
+    dtype = np.dtype(dtype.rstrip(b"\x00").decode())
+
+    payload = bytearray(payload_size)
+    if map_file.readinto(payload) != payload_size:
+        raise ValueError("Map file ends before its payload.")
+
+    payload = decompress(payload=payload,
+                         compression=compression)
+
+    if kind == KIND_FIXED:
+        tiles = np.frombuffer(payload, dtype=dtype).reshape(rows, columns)
+        if not tiles.flags.writeable:
+            tiles = tiles.copy()
+        world_data = world_data_backend.from_array(array=tiles)
+
+    else:
+        keys_size = nr_blocks * 2 * 4
+        keys = np.frombuffer(payload, dtype="<i4", count=nr_blocks * 2).reshape(nr_blocks, 2)
+        blocks = np.frombuffer(payload, dtype=dtype, offset=keys_size).reshape(nr_blocks, block_size, block_size)
+        world_data = world_data_backend.from_save_data(save_data={
+            "backend": "infinite",
+            "block_size": block_size,
+            "blocks": {(block_row, block_col): block.copy()
+                       for (block_row, block_col), block in zip(keys.tolist(), blocks)},
+        })
+
+    return rows, columns, grid_size_x, grid_size_y, world_data
+
+
+def load_legacy_map(path: str) -> Tuple[int, int, int, int, Any]:
+    """
+        Reads a map saved before the binary format as a pickled list.
+
+        Args:
+            path (str): Path of the map file.
+
+        Returns:
+            Tuple[int, int, int, int, Any]: rows, columns, grid_size_x, grid_size_y and world_data.
+    """
+    with open(file=path,
+              mode="rb") as map_file:
+        load_data = LegacyMapUnpickler(map_file).load()
+
+    rows, columns, grid_size_x, grid_size_y, save_data = load_data
+
+    return (int(rows), int(columns), int(grid_size_x), int(grid_size_y),
+            world_data_backend.from_save_data(save_data=save_data))
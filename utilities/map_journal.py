@@ -0,0 +1,495 @@
+"""
+Append-only edit journal of a saved map.
+
+Every change of world_data is appended to '<map file>.journal' so saving only has to
+    write the changes, and changes made after the last save survive a crash.
+Saving the map appends a commit record, the records after the last commit are unsaved edits.
+Closing the journal (quitting, loading or starting another map) truncates it to the last commit,
+    unsaved edits are only left in the journal when the Editor did not exit cleanly.
+The journal starts with a header of MAP_JOURNAL_HEADER_SIZE bytes, little-endian:
+    magic         8s   MAP_JOURNAL_MAGIC
+    version       H    MAP_JOURNAL_VERSION
+    padding            zeros up to MAP_JOURNAL_HEADER_SIZE
+
+Followed by records, each a tag (B) and the size of its body (Q):
+    cells      RECORD_CELLS, an array of CELL_DTYPE (row, column, new tile index).
+    snapshot   RECORD_SNAPSHOT, a complete map file (header and payload), written for
+               bulk changes (wipe, crop, resize, undo and redo of those).
+    commit     RECORD_COMMIT, empty, written when the map is saved.
+
+Records store new values only, replaying a journal twice gives the same map.
+A full save (compaction) renames the journal to '<map file>.journal.<n>' and starts a new one,
+    the renamed journals are removed once the map file is written.
+Loading a map replays the renamed journals in order, then the current journal, including the
+    unsaved edits left by a crash, which are recovered as unsaved edits.
+A record cut off by a crash ends the replay of its journal.
+
+None of the functions depend on pygame.
+"""
+
+import io
+import os
+import struct
+from typing import Any, Iterator, Tuple
+
+import numpy as np
+
+from settings.map_file import *
+
+from utilities import map_format
+
+
+JOURNAL_HEADER = struct.Struct("<8sH")
+MAP_JOURNAL_HEADER_SIZE = 16
+RECORD = struct.Struct("<BQ")
+
+RECORD_CELLS = 1
+RECORD_SNAPSHOT = 2
+RECORD_COMMIT = 3
+
+CELL_DTYPE = np.dtype([
+    ("row", "<i4"),
+    ("col", "<i4"),
+    ("value", np.dtype(WORLD_DATA_DTYPE).newbyteorder("<")),
+])
+
+
+def get_journal_path(map_path: str) -> str:
+    return f"{map_path}{MAP_JOURNAL_SUFFIX}"
+
+
+def is_journal_file(file_name: str) -> bool:
+    """
+        Checks if a file in MAPS_DIR is a journal instead of a map.
+
+        Args:
+            file_name (str): Name of the file.
+
+        Returns:
+            bool: True if the file is a current or renamed journal, else False.
+    """
+    name, extension = os.path.splitext(file_name)
+    if extension == MAP_JOURNAL_SUFFIX:
+        return True
+
+    return extension[1:].isdigit() and name.endswith(MAP_JOURNAL_SUFFIX)
+
+
+def get_journal_paths(map_path: str) -> list[str]:
+    """
+        Gets the existing journals of a map in replay order,
+            the renamed journals by number followed by the current journal.
+
+        Args:
+            map_path (str): Path of the map file.
+
+        Returns:
+            list[str]: Paths of the journals.
+    """
+    journal_path = get_journal_path(map_path=map_path)
+    directory, journal_name = os.path.split(journal_path)
+    if not os.path.isdir(directory):
+        return []
+
+    numbers = []
+    for file_name in os.listdir(directory):
+        name, extension = os.path.splitext(file_name)
+        if name == journal_name and extension[1:].isdigit():
+            numbers.append(int(extension[1:]))
+
+    paths = [f"{journal_path}.{number}" for number in sorted(numbers)]
+    if os.path.exists(journal_path):
+        paths.append(journal_path)
+
+    return paths
+
+
+def read_header(journal_file: Any) -> int | None:
+    """
+        Reads the header of a journal.
+
+        Args:
+            journal_file (Any): Journal opened for binary reading.
+
+        Returns:
+            int | None: Version of the journal or None if it is not a journal this version can read.
+    """
+    magic, version = JOURNAL_HEADER.unpack(
+        journal_file.read(MAP_JOURNAL_HEADER_SIZE)[:JOURNAL_HEADER.size].ljust(JOURNAL_HEADER.size, b"\x00"))
+    if magic != MAP_JOURNAL_MAGIC or version > MAP_JOURNAL_VERSION:
+        return None
+
+    return version
+
+
+def read_records(journal_file: Any) -> Iterator[Tuple[int, bytes, int]]:
+    """
+        Reads the records of a journal after its header,
+            a record cut off by a crash ends the journal.
+
+        Args:
+            journal_file (Any): Journal opened for binary reading, positioned after the header.
+
+        Returns:
+            Iterator[Tuple[int, bytes, int]]: Tag, body and end offset per record.
+    """
+    while True:
+        record = journal_file.read(RECORD.size)
+        if len(record) < RECORD.size:
+            return
+        tag, size = RECORD.unpack(record)
+        body = journal_file.read(size)
+        if len(body) < size:
+            return
+
+        yield tag, body, journal_file.tell()
+
+
+def get_committed_size(journal_path: str) -> Tuple[int, int]:
+    """
+        Gets the end of the last commit record and the end of the last complete record.
+
+        Args:
+            journal_path (str): Path of the journal.
+
+        Returns:
+            Tuple[int, int]: Offsets in bytes, both 0 if the journal does not exist.
+    """
+    try:
+        journal_file = open(file=journal_path,
+                            mode="rb")
+    except FileNotFoundError:
+        return 0, 0
+
+    with journal_file:
+        version = read_header(journal_file=journal_file)
+        if version is None:
+            return 0, 0
+
+        committed_size = end = MAP_JOURNAL_HEADER_SIZE
+        for tag, _, end in read_records(journal_file=journal_file):
+            if tag == RECORD_COMMIT:
+                committed_size = end
+
+    if version < 2:
+        # Journals without commit records only held saved edits
+        return end, end
+
+    return committed_size, end
+
+
+def has_unsaved_edits(map_path: str) -> bool:
+    """
+        Checks if the journal of a map holds edits after its last commit,
+            which are only left there when the Editor did not exit cleanly.
+
+        Args:
+            map_path (str): Path of the map file.
+
+        Returns:
+            bool: True if loading the map recovers unsaved edits, else False.
+    """
+    committed_size, size = get_committed_size(journal_path=get_journal_path(map_path=map_path))
+
+    return size > committed_size
+
+
+def replay(map_path: str,
+           rows: int,
+           columns: int,
+           grid_size_x: int,
+           grid_size_y: int,
+           world_data: Any) -> Tuple[int, int, int, int, Any]:
+    """
+        Applies the journals of a map to the map as loaded from its file.
+
+        Args:
+            map_path (str): Path of the map file.
+            rows (int): Number of rows in the map file.
+            columns (int): Number of columns in the map file.
+            grid_size_x (int): Width of a cell in the map file.
+            grid_size_y (int): Height of a cell in the map file.
+            world_data (Any): world_data of the map file.
+
+        Returns:
+            Tuple[int, int, int, int, Any]: rows, columns, grid_size_x, grid_size_y and world_data.
+    """
+    for journal_path in get_journal_paths(map_path=map_path):
+        with open(file=journal_path,
+                  mode="rb") as journal_file:
+            if read_header(journal_file=journal_file) is None:
+                continue
+
+            for tag, body, _ in read_records(journal_file=journal_file):
+                if tag == RECORD_CELLS:
+                    cells = np.frombuffer(body, dtype=CELL_DTYPE)
+                    if world_data.backend != "infinite":
+                        # Cells of a fixed size map are never negative, skip anything outside of it
+                        max_row, max_col = world_data.shape
+                        cells = cells[(cells["row"] >= 0) & (cells["row"] < max_row)
+                                      & (cells["col"] >= 0) & (cells["col"] < max_col)]
+                    for row, col, value in zip(cells["row"].tolist(), cells["col"].tolist(),
+                                               cells["value"].tolist()):
+                        world_data[row, col] = value
+
+                elif tag == RECORD_SNAPSHOT:
+                    snapshot = io.BytesIO(body)
+                    rows, columns, grid_size_x, grid_size_y, world_data = map_format.read_map(
+                        map_file=snapshot,
+                        header=map_format.read_header(map_file=snapshot)
+                    )
+
+    return rows, columns, grid_size_x, grid_size_y, world_data
+
+
+def remove_journals(paths: list[str]) -> None:
+    """
+        Removes journals that were folded into their map file.
+
+        Args:
+            paths (list[str]): Paths of the journals.
+    """
+    for path in paths:
+        try:
+            os.remove(path)
+        except FileNotFoundError:
+            pass
+
+
+class MapJournal:
+    """
+        Journal of the saved map that is being edited.
+        Tile changes are collected during a frame and written as a single cells record by flush().
+        The journal file is opened on the first change after the map is loaded.
+        The journal is closed while the map is not saved or was renamed, changes are then not journaled.
+
+        Returns:
+            Self.
+    """
+
+    def __init__(self):
+        self.map_name: str | None = None
+        self.map_path: str | None = None
+        self.file: io.BufferedWriter | None = None
+        self.size = 0
+        # End of the last commit record, the journal is truncated to it when closed
+        self.committed_size = 0
+
+        # Tile changes not yet written
+        self.rows: list[int] = []
+        self.cols: list[int] = []
+        self.values: list[int] = []
+
+    @property
+    def is_attached(self) -> bool:
+        return self.map_path is not None
+
+    def attach(self,
+               map_name: str,
+               map_path: str) -> None:
+        """
+            Continues the journal of a saved map.
+            The journal file is opened, or created, when the first change is written.
+
+            Args:
+                map_name (str): Name of the map.
+                map_path (str): Path of the map file.
+        """
+        self.close()
+
+        self.committed_size, self.size = get_committed_size(journal_path=get_journal_path(map_path=map_path))
+        self.map_name = map_name
+        self.map_path = map_path
+
+    def open_file(self) -> None:
+        """
+            Opens the journal file for appending, a new journal gets its header.
+            Anything after the last complete record (a record cut off by a crash) is dropped.
+        """
+        if self.file is not None:
+            return
+
+        self.file = open(file=get_journal_path(map_path=self.map_path),
+                         mode="ab")
+        if self.size == 0:
+            self.file.truncate(0)
+            self.file.write(JOURNAL_HEADER.pack(MAP_JOURNAL_MAGIC,
+                                                MAP_JOURNAL_VERSION).ljust(MAP_JOURNAL_HEADER_SIZE, b"\x00"))
+            self.size = self.committed_size = MAP_JOURNAL_HEADER_SIZE
+        else:
+            self.file.truncate(self.size)
+
+    def start(self,
+              map_name: str,
+              map_path: str) -> list[str]:
+        """
+            Starts a new journal for a full save of the map.
+            The current journal is renamed, it stays replayable until the map file is written.
+
+            Args:
+                map_name (str): Name of the map.
+                map_path (str): Path of the map file.
+
+            Returns:
+                list[str]: Renamed journals to remove once the map file is written.
+        """
+        if self.map_path == map_path:
+            # Everything up to the full save is saved
+            self.commit()
+        self.close()
+
+        journal_path = get_journal_path(map_path=map_path)
+        paths = get_journal_paths(map_path=map_path)
+        if paths and paths[-1] == journal_path:
+            number = 0
+            if len(paths) > 1:
+                number = int(os.path.splitext(paths[-2])[1][1:]) + 1
+            paths[-1] = f"{journal_path}.{number}"
+            os.replace(journal_path, paths[-1])
+
+        self.attach(map_name=map_name,
+                    map_path=map_path)
+
+        return paths
+
+    def close(self) -> None:
+        """
+            Closes the journal, the unsaved edits after the last commit are discarded.
+        """
+        if self.file is not None:
+            self.rows, self.cols, self.values = [], [], []
+            self.file.flush()
+            self.file.truncate(self.committed_size)
+            self.file.close()
+            self.file = None
+
+        self.map_name = None
+        self.map_path = None
+        self.size = 0
+        self.committed_size = 0
+
+    def write_record(self,
+                     tag: int,
+                     *parts: bytes) -> None:
+        self.open_file()
+        size = sum(len(part) for part in parts)
+        self.file.write(RECORD.pack(tag, size))
+        for part in parts:
+            self.file.write(part)
+        self.size += RECORD.size + size
+
+    def write_cells(self) -> None:
+        """
+            Writes the collected tile changes as a single cells record.
+        """
+        if not self.rows:
+            return
+
+        cells = np.empty(len(self.rows), dtype=CELL_DTYPE)
+        cells["row"] = self.rows
+        cells["col"] = self.cols
+        cells["value"] = self.values
+        self.rows, self.cols, self.values = [], [], []
+
+        self.write_record(RECORD_CELLS, cells.tobytes())
+
+    def record_tile(self,
+                    row: int,
+                    col: int,
+                    value: int) -> None:
+        """
+            Records the new tile index of a cell.
+
+            Args:
+                row (int): Row of the tile.
+                col (int): Column of the tile.
+                value (int): New tile index.
+        """
+        if not self.is_attached:
+            return
+
+        self.rows.append(int(row))
+        self.cols.append(int(col))
+        self.values.append(int(value))
+
+    def record_tiles(self,
+                     rows: np.ndarray,
+                     cols: np.ndarray,
+                     values: np.ndarray) -> None:
+        """
+            Records the new tile indexes of several cells.
+
+            Args:
+                rows (np.ndarray): Row per cell.
+                cols (np.ndarray): Column per cell.
+                values (np.ndarray): New tile index per cell.
+        """
+        if not self.is_attached:
+            return
+
+        self.rows.extend(rows.tolist())
+        self.cols.extend(cols.tolist())
+        self.values.extend(values.tolist())
+
+    def record_snapshot(self,
+                        document: Any) -> None:
+        """
+            Records the complete map after a bulk change.
+            The journal is closed if the change switched to another map (load, undo of a load).
+
+            Args:
+                document (Any): MapDocument of the map.
+        """
+        if not self.is_attached:
+            return
+
+        if document.map_name != self.map_name:
+            self.close()
+            return
+
+        self.write_cells()
+        self.write_record(RECORD_SNAPSHOT,
+                          *map_format.get_map_parts(world_data=document.world_data,
+                                                    rows=document.rows,
+                                                    columns=document.columns,
+                                                    grid_size_x=document.grid_size_x,
+                                                    grid_size_y=document.grid_size_y,
+                                                    compression="zlib"))
+
+    def flush(self) -> None:
+        """
+            Writes the collected tile changes to the journal file.
+            Is called every frame.
+        """
+        self.write_cells()
+        if self.file is not None:
+            self.file.flush()
+
+    def commit(self) -> None:
+        """
+            Marks all changes written so far as saved.
+            Does nothing if there were no changes since the last commit.
+        """
+        self.write_cells()
+        if self.size <= self.committed_size:
+            return
+
+        self.write_record(RECORD_COMMIT)
+        self.file.flush()
+        self.committed_size = self.size
+
+    def get_sync_fd(self) -> int | None:
+        """
+            Writes the collected tile changes and gets a file descriptor to wait on
+                until they are on disk.
+            The descriptor is a duplicate so the journal can be closed while another thread syncs it,
+                the caller closes it after os.fsync.
+
+            Returns:
+                int | None: Duplicated file descriptor of the journal or None if it is not open.
+        """
+        self.flush()
+        if self.file is None:
+            return None
+
+        return os.dup(self.file.fileno())
@@ -0,0 +1,238 @@
+"""
+Registry of the presets in PRESETS_DIR.
+
+PRESETS_DIR is scanned once, per preset the tile file names, indexes and names are kept in memory.
+Sprites and previews are loaded the first time they are needed, from the tile atlas of the preset.
+The modification times of PRESETS_DIR and the preset folders are checked at most once every
+    PRESET_REGISTRY_CHECK_INTERVAL_MS, only changed presets are scanned again.
+
+Tiles are identified by the index prefix of their file name.
+Files with the same index and different pixels are conflicts, the file found last is used for that index.
+Files in one preset with the same index and identical pixels are duplicates, copies of a tile in
+    other presets are expected and are not reported.
+Indexes whose images are identical share a canonical tile id, the lowest of those indexes,
+    placed tiles are stored in world_data by their canonical id.
+"""
+
+import os
+import time
+from typing import Tuple
+
+import pygame
+
+from settings.paths import PRESETS_DIR
+from settings.presets import PRESET_REGISTRY_CHECK_INTERVAL_MS
+
+from utilities import tile_atlas
+
+
+def get_tile_index(file_name: str) -> int:
+    return int(file_name.split("_")[0])
+
+
+class Preset:
+    """
+        Tile metadata of a single preset folder, sprites and previews are loaded lazily.
+
+        Args:
+            name (str): Name of the preset folder.
+            path (str): Path of the preset folder.
+            mtime_ns (int): Modification time of the folder when it was scanned.
+
+        Returns:
+            Self.
+    """
+
+    def __init__(self,
+                 name: str,
+                 path: str,
+                 mtime_ns: int):
+        self.name = name
+        self.path = path
+        self.mtime_ns = mtime_ns
+
+        # Sorting on the index keeps files with the same index in directory order
+        self.file_names: list[str] = sorted((file_name for file_name in os.listdir(path)
+                                             if file_name.endswith(".png")),
+                                            key=get_tile_index)
+        self.tile_indexes: list[int] = [get_tile_index(file_name) for file_name in self.file_names]
+        self.tile_names: list[str] = [file_name.split(".")[0].split("_")[-1] for file_name in self.file_names]
+
+        self.sprites: list[pygame.Surface] | None = None
+        self.previews: dict[Tuple[int, int], pygame.Surface] = {}
+
+    def get_sprites(self) -> list[pygame.Surface]:
+        if self.sprites is None:
+            self.sprites = tile_atlas.get_sprites(preset=self)
+
+        return self.sprites
+
+    def get_preview(self,
+                    size: Tuple[int, int] | None = None) -> pygame.Surface:
+        """
+            Gets the first sprite of the preset, optionally scaled.
+
+            Args:
+                size (Tuple[int, int] | None): Size of the preview or None for the original size.
+
+            Returns:
+                pygame.Surface: Preview image.
+        """
+        preview = self.previews.get(size)
+        if preview is not None:
+            return preview
+
+        preview = self.get_sprites()[0]
+        if size is not None:
+            preview = pygame.transform.scale(surface=preview,
+                                             size=size)
+        self.previews[size] = preview
+
+        return preview
+
+
+class PresetRegistry:
+    """
+        Keeps a Preset per folder in presets_dir.
+
+        Args:
+            presets_dir (str): Folder containing the preset folders.
+
+        Returns:
+            Self.
+    """
+
+    def __init__(self,
+                 presets_dir: str):
+        self.presets_dir = presets_dir
+        self.presets: dict[str, Preset] = {}
+        self.dir_mtime_ns: int | None = None
+        self.last_check = 0.0
+
+        # Set by get_level_objects()
+        self.canonical_ids: dict[int, int] = {}
+        # Tile index -> '<preset>/<file name>' of its duplicate files in one preset or its conflicting files
+        self.duplicates: dict[int, list[str]] = {}
+        self.conflicts: dict[int, list[str]] = {}
+
+    def scan(self) -> None:
+        """
+            Scans presets_dir, presets whose folder did not change are kept.
+        """
+        presets = {}
+        for entry in os.scandir(self.presets_dir):
+            if not entry.is_dir():
+                continue
+
+            mtime_ns = entry.stat().st_mtime_ns
+            preset = self.presets.get(entry.name)
+            if preset is None or preset.mtime_ns != mtime_ns:
+                preset = Preset(name=entry.name,
+                                path=entry.path,
+                                mtime_ns=mtime_ns)
+            presets[entry.name] = preset
+
+        self.presets = dict(sorted(presets.items()))
+        self.dir_mtime_ns = os.stat(self.presets_dir).st_mtime_ns
+        self.last_check = time.monotonic()
+
+    def is_changed(self) -> bool:
+        """
+            Checks the modification times of presets_dir and the preset folders.
+
+            Returns:
+                bool: True if a folder was added, removed or changed, else False.
+        """
+        if os.stat(self.presets_dir).st_mtime_ns != self.dir_mtime_ns:
+            return True
+
+        for preset in self.presets.values():
+            try:
+                if os.stat(preset.path).st_mtime_ns != preset.mtime_ns:
+                    return True
+            except FileNotFoundError:
+                return True
+
+        return False
+
+    def refresh(self) -> bool:
+        """
+            Scans presets_dir again if it changed,
+                the modification times are checked at most once every PRESET_REGISTRY_CHECK_INTERVAL_MS.
+
+            Returns:
+                bool: True if the presets were scanned again, else False.
+        """
+        if self.dir_mtime_ns is None:
+            self.scan()
+            return True
+
+        if (time.monotonic() - self.last_check) * 1000 < PRESET_REGISTRY_CHECK_INTERVAL_MS:
+            return False
+
+        self.last_check = time.monotonic()
+        if not self.is_changed():
+            return False
+
+        self.scan()
+        return True
+
+    def get_preset(self,
+                   preset_name: str) -> Preset:
+        if self.dir_mtime_ns is None:
+            self.scan()
+
+        return self.presets[preset_name]
+
+    def get_level_objects(self) -> dict[int, pygame.Surface]:
+        """
+            Gets the sprites of all presets by tile index.
+            Finds the duplicate and conflicting tile indexes and the canonical tile ids,
+                identical images are the same Surface (see AssetManager.dedupe).
+
+            Returns:
+                dict[int, pygame.Surface]: Sprite per tile index.
+        """
+        if self.dir_mtime_ns is None:
+            self.scan()
+
+        files: dict[int, list[tuple[str, str, pygame.Surface]]] = {}
+        for preset in self.presets.values():
+            for file_name, tile_index, sprite in zip(preset.file_names, preset.tile_indexes, preset.get_sprites()):
+                files.setdefault(tile_index, []).append((preset.name, file_name, sprite))
+
+        level_objects = {tile_index: tile_files[-1][2] for tile_index, tile_files in files.items()}
+
+        self.duplicates, self.conflicts = {}, {}
+        for tile_index, tile_files in files.items():
+            if len(tile_files) == 1:
+                continue
+            if len({id(sprite) for _, _, sprite in tile_files}) > 1:
+                self.conflicts[tile_index] = [f"{preset_name}/{file_name}" for preset_name, file_name, _ in tile_files]
+                continue
+
+            preset_names = [preset_name for preset_name, _, _ in tile_files]
+            names = [f"{preset_name}/{file_name}" for preset_name, file_name, _ in tile_files
+                     if preset_names.count(preset_name) > 1]
+            if names:
+                self.duplicates[tile_index] = names
+
+        first_ids: dict[int, int] = {}
+        for tile_index in sorted(level_objects):
+            first_ids.setdefault(id(level_objects[tile_index]), tile_index)
+        self.canonical_ids = {tile_index: first_ids[id(sprite)] for tile_index, sprite in level_objects.items()}
+
+        return level_objects
+
+    def get_canonical_id(self,
+                         tile_index: int) -> int:
+        return self.canonical_ids.get(tile_index, tile_index)
+
+    def get_preset_names(self) -> list[str]:
+        if self.dir_mtime_ns is None:
+            self.scan()
+
+        return list(self.presets)
+
+
+registry = PresetRegistry(presets_dir=PRESETS_DIR)
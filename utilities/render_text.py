@@ -1,8 +1,89 @@
-from typing import Tuple
+"""
+Draws text on the screen.
+Rendered text is kept in an LRU cache keyed by (font, text, color, antialias),
+    text that does not change between frames is rasterized once.
+"""
+
+from collections import OrderedDict
+from typing import Self, Tuple
 
 import pygame
 
 from settings.setup import *
+from settings.display import TEXT_CACHE_SIZE
+
+
+class TextCache:
+    """
+        Keeps the most recently used rendered texts.
+
+        Args:
+            max_size (int): Number of texts to keep, the least recently used text is dropped first.
+
+        Returns:
+            Self.
+    """
+
+    def __init__(self,
+                 max_size: int) -> Self:
+        self.max_size = max_size
+        # (font, text, color, antialias) -> Surface
+        self.surfaces: OrderedDict[tuple, pygame.Surface] = OrderedDict()
+
+        # Statistics
+        self.hits = 0
+        self.misses = 0
+
+    def render(self,
+               font: pygame.font.Font,
+               text: str,
+               color: Tuple[int, int, int],
+               antialias: bool = True) -> pygame.Surface:
+        """
+            Gets the text rendered with font, it is rendered the first time only.
+            The Surface is shared and must not be changed.
+
+            Args:
+                font (pygame.font.Font): pygame.font object.
+                text (str): Text to render.
+                color (tuple[int, int, int]): Text color in RGB format.
+                antialias (bool): Smooth edges.
+
+            Returns:
+                pygame.Surface: Rendered text.
+        """
+        # Colors can be tuples, lists, pygame.Color or mapped integers
+        key = (font, text, color if isinstance(color, (int, tuple)) else tuple(color), antialias)
+        surface = self.surfaces.get(key)
+        if surface is not None:
+            self.hits += 1
+            self.surfaces.move_to_end(key)
+            return surface
+
+        self.misses += 1
+        surface = font.render(text, antialias, color)
+        self.surfaces[key] = surface
+        if len(self.surfaces) > self.max_size:
+            self.surfaces.popitem(last=False)
+
+        return surface
+
+    def clear(self) -> None:
+        self.surfaces.clear()
+
+    def get_stats(self) -> dict[str, int]:
+        return {
+            "size": len(self.surfaces),
+            "hits": self.hits,
+            "misses": self.misses,
+        }
+
+    def __str__(self) -> str:
+        stats = self.get_stats()
+        return f"TextCache: {stats['size']} texts, {stats['hits']} hits, {stats['misses']} misses"
+
+
+text_cache = TextCache(max_size=TEXT_CACHE_SIZE)
 
 
 def position(screen: pygame.Surface,
@@ -30,7 +111,9 @@ def position(screen: pygame.Surface,
                (x-position, y-position, width, height) of the rendered text.
                Otherwise, returns None.
     """
-    image = font.render(text, True, color)
+    image = text_cache.render(font=font,
+                              text=text,
+                              color=color)
     screen.blit(image,
                 (x_pos, y_pos))
     if get_rect:
@@ -63,13 +146,14 @@ def centered_x(screen: pygame.Surface,
                (x-position, y-position, width, height) of the rendered text.
                Otherwise, returns None.
     """
+    image = text_cache.render(font=font,
+                              text=text,
+                              color=color)
     if full_width:
-        image = font.render(text, True, color)
         rect = image.get_rect()
         screen.blit(image, ((SCREEN_WIDTH + RIGHT_MARGIN) // 2 - rect.width // 2, y_pos))
 
     else:
-        image = font.render(text, True, color)
         rect = image.get_rect()
         screen.blit(image, (SCREEN_WIDTH // 2 - rect.width // 2, y_pos))
 
@@ -1,66 +1,28 @@
 import pygame
 
-import utilities.general as general
+from utilities.asset_manager import assets
+from utilities.preset_registry import registry
 
 from settings.setup import *
 from settings.paths import *
 
-# General
-sky_img = pygame.image.load(os.path.join(IMAGES_DIR,
-                                         "clouds.png")).convert()
-
-background_img = pygame.transform.scale(
-    pygame.image.load(os.path.join(IMAGES_DIR, "grass.png")).convert(),
-    (COLUMNS * GRID_SIZE_X, ROWS * GRID_SIZE_Y))
-
-# Presets Button
-sets_button_image = pygame.image.load(os.path.join(IMAGES_DIR,
-                                                   "sets_btn.png")).convert_alpha()
-
-# Menu Buttons
-file_button_image = pygame.image.load(os.path.join(IMAGES_DIR,
-                                                   "file_btn.png")).convert_alpha()
-edit_button_image = pygame.image.load(os.path.join(IMAGES_DIR,
-                                                   "edit_btn.png")).convert_alpha()
-
-# File Menu buttons
-save_button_image = pygame.image.load(os.path.join(IMAGES_DIR,
-                                                   "save_btn.png")).convert_alpha()
-
-load_button_image = pygame.image.load(os.path.join(IMAGES_DIR,
-                                                   "load_btn.png")).convert_alpha()
-new_button_image = pygame.image.load(os.path.join(IMAGES_DIR,
-                                                  "new_btn.png")).convert_alpha()
-name_button_image = pygame.image.load(os.path.join(IMAGES_DIR,
-                                                   "name_btn.png")).convert_alpha()
-
-# Edit Menu buttons
-pref_button_image = pygame.image.load(os.path.join(IMAGES_DIR,
-                                                   "pref_btn.png")).convert_alpha()
-crop_button_image = pygame.image.load(os.path.join(IMAGES_DIR,
-                                                   "crop_btn.png")).convert_alpha()
-wipe_button_image = pygame.image.load(os.path.join(IMAGES_DIR,
-                                                   "wipe_btn.png")).convert_alpha()
-
-# General Menu buttons
-back_button_image = pygame.image.load(os.path.join(IMAGES_DIR,
-                                                   "back_btn.png")).convert_alpha()
-ok_button_image = pygame.image.load(os.path.join(IMAGES_DIR,
-                                                 "ok_btn.png")).convert_alpha()
-
-# Quick Menu buttons
-undo_button_image = pygame.image.load(os.path.join(IMAGES_DIR,
-                                                   "undo_btn.png")).convert_alpha()
-redo_button_image = pygame.image.load(os.path.join(IMAGES_DIR,
-                                                   "redo_btn.png")).convert_alpha()
-grid_button_image = pygame.image.load(os.path.join(IMAGES_DIR,
-                                                   "grid_btn.png")).convert_alpha()
-map_button_image = pygame.image.load(os.path.join(IMAGES_DIR,
-                                                  "map_btn.png")).convert_alpha()
-zoom_in_button_image = pygame.image.load(os.path.join(IMAGES_DIR,
-                                                      "zoom_in_btn.png")).convert_alpha()
-zoom_out_button_image = pygame.image.load(os.path.join(IMAGES_DIR,
-                                                       "zoom_out_btn.png")).convert_alpha()
+# Name -> (file name in IMAGES_DIR, per pixel alpha), loaded on first use
+UI_IMAGES = {
+    "background_img": ("grass.png", False),
+}
+
+
+def __getattr__(name: str) -> pygame.Surface:
+    if name not in UI_IMAGES:
+        raise AttributeError(f"module '{__name__}' has no attribute '{name}'")
+
+    file_name, alpha = UI_IMAGES[name]
+    image = assets.load(os.path.join(IMAGES_DIR, file_name),
+                        alpha=alpha)
+    # Later lookups find the image without calling __getattr__
+    globals()[name] = image
+
+    return image
 
 
 def get_sprites(location: str,
@@ -81,7 +43,7 @@ def get_sprites(location: str,
         Returns:
             List[pygame.Surface]: List of sprite images.
     """
-    sprite_sheet = pygame.image.load(location).convert_alpha()
+    sprite_sheet = assets.load(location)
 
     sprites = []
     for i in range(0, number_sprites):
@@ -95,22 +57,26 @@ def get_sprites(location: str,
     return sprites
 
 
-def get_preview_image(preset_name: str) -> pygame.Surface:
+def get_preview_image(preset_name: str,
+                      size: tuple[int, int] | None = None) -> pygame.Surface:
     """
         Gets the first image in the given preset folders.
+        Previews are cached per size by the preset registry.
 
         Args:
             preset_name (str): Name of the given preset.
+            size (tuple[int, int] | None): Size of the preview or None for the original size.
 
         Returns:
              pygame.Surface: Preview image.
     """
-    return get_preset_sprites(preset_name=preset_name)[0]
+    return registry.get_preset(preset_name=preset_name).get_preview(size=size)
 
 
 def get_preset_sprites(preset_name: str) -> list[pygame.Surface]:
     """
         Get a list of sprites for the current preset.
+        Sprites are loaded once by the preset registry and shared afterwards.
 
         Args:
             preset_name (str): Name of the current preset.
@@ -118,38 +84,15 @@ def get_preset_sprites(preset_name: str) -> list[pygame.Surface]:
         Returns:
             List[pygame.Surface]: List of sprite images.
         """
-    path = os.path.join(PRESETS_DIR, preset_name)
-    sprite_names = general.get_sorted_tile_names(preset_name=preset_name)
-
-    sprite_list = []
-    for sprite in sprite_names:
-        sprite_list.append(
-            pygame.image.load(os.path.join(path, sprite)).convert_alpha()
-        )
-
-    return sprite_list
+    return list(registry.get_preset(preset_name=preset_name).get_sprites())
 
 
 def get_all_level_objects() -> dict[int, pygame.Surface]:
     """
         Get all level objects from a folder.
+        The images are the same Surfaces as the preset sprites and tile buttons.
 
         Returns:
             dict: A dictionary with level objects indexed by number.
         """
-    # Create a dictionary to store images by their index
-    all_level_objects = {}
-
-    for subdir, _, files in os.walk(PRESETS_DIR):
-        for file in files:
-            if file.endswith('.png'):
-                # Extract the number from the file name
-                number = int(file.split('_')[0])
-
-                # Load the image
-                image = pygame.image.load(os.path.join(subdir, file)).convert_alpha()
-
-                # Store the image by its index
-                all_level_objects[number] = image
-
-    return all_level_objects
+    return registry.get_level_objects()
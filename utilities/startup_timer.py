@@ -0,0 +1,88 @@
+"""
+Measures where the time until the first frame of the Editor goes.
+
+Phases are timed with:
+
+    with startup_timer.phase("fonts"):
+        ...
+
+A phase timed more than once adds up, phases timed inside another phase are not counted twice.
+Time outside of the phases is reported as 'other'.
+Does not depend on pygame, so it can be imported before pygame is initialized.
+"""
+
+import time
+from contextlib import contextmanager
+from typing import Iterator
+
+
+class StartupTimer:
+    """
+        Keeps the duration of each startup phase.
+
+        Returns:
+            Self.
+    """
+
+    def __init__(self):
+        self.start = time.perf_counter()
+        self.phases: dict[str, float] = {}
+        self.total_ms: float | None = None
+
+    def mark(self) -> tuple[float, float]:
+        """
+            Gets the start of a phase, for phases that are not a single block of code.
+
+            Returns:
+                tuple[float, float]: Current time and the time spent in phases so far.
+        """
+        return time.perf_counter(), sum(self.phases.values())
+
+    def record(self,
+               name: str,
+               start: tuple[float, float]) -> None:
+        """
+            Adds the time since start to a phase, minus the time of phases timed in between.
+
+            Args:
+                name (str): Name of the phase.
+                start (tuple[float, float]): Result of mark() at the start of the phase.
+        """
+        start_time, start_phases_ms = start
+        nested_ms = sum(self.phases.values()) - start_phases_ms
+        ms = (time.perf_counter() - start_time) * 1000 - nested_ms
+        self.phases[name] = self.phases.get(name, 0.0) + ms
+
+    @contextmanager
+    def phase(self,
+              name: str) -> Iterator[None]:
+        start = self.mark()
+        try:
+            yield
+        finally:
+            self.record(name=name,
+                        start=start)
+
+    def finish(self) -> None:
+        """
+            Marks the end of the startup, is called after the first frame.
+        """
+        if self.total_ms is None:
+            self.total_ms = (time.perf_counter() - self.start) * 1000
+
+    def get_report(self) -> str:
+        """
+            Gets the duration of the startup and of each phase.
+
+            Returns:
+                str: One line per phase, in the order the phases started.
+        """
+        total_ms = self.total_ms if self.total_ms is not None else (time.perf_counter() - self.start) * 1000
+        lines = [f"Startup: {total_ms:.0f} ms until the first frame"]
+        lines.extend(f"    {name:<16}{ms:>8.1f} ms" for name, ms in self.phases.items())
+        lines.append(f"    {'other':<16}{total_ms - sum(self.phases.values()):>8.1f} ms")
+
+        return "\n".join(lines)
+
+
+startup_timer = StartupTimer()
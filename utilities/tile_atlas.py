@@ -0,0 +1,196 @@
+"""
+On-disk atlas cache of the preset folders.
+
+All tiles of a preset are packed into a single '<preset>.png' in ATLAS_CACHE_DIR, with an index
+    '<preset>.json':
+    version   ATLAS_VERSION
+    key       sha1 of the file names, sizes and modification times of the preset tiles
+    rects     [file name, x, y, width, height] per tile, in the order of Preset.file_names
+
+Tiles with identical pixels are packed once and share their rect.
+A preset whose key matches its index loads its sprites from the atlas in a single read,
+    the sprites are subsurfaces of the atlas.
+Otherwise the tiles are loaded one by one and the atlas is rebuilt from them.
+"""
+
+import hashlib
+import json
+import os
+from typing import Any
+
+import pygame
+
+from settings.paths import ATLAS_CACHE_DIR
+from settings.presets import ATLAS_VERSION, TILE_ATLAS_MAX_WIDTH
+
+from utilities import map_format
+from utilities.asset_manager import assets
+
+
+def get_atlas_path(preset_name: str) -> str:
+    return os.path.join(ATLAS_CACHE_DIR, f"{preset_name}.png")
+
+
+def get_index_path(preset_name: str) -> str:
+    return os.path.join(ATLAS_CACHE_DIR, f"{preset_name}.json")
+
+
+def get_key(preset: Any) -> str:
+    """
+        Gets the hash of the tiles of a preset, any added, removed or changed tile changes it.
+
+        Args:
+            preset (Any): Preset from the PresetRegistry.
+
+        Returns:
+            str: sha1 as hexadecimal characters.
+    """
+    key = hashlib.sha1(str(ATLAS_VERSION).encode("utf-8"))
+    for file_name in preset.file_names:
+        stat = os.stat(os.path.join(preset.path, file_name))
+        key.update(f"{file_name}\0{stat.st_size}\0{stat.st_mtime_ns}\0".encode("utf-8"))
+
+    return key.hexdigest()
+
+
+def read_index(preset: Any) -> list[list] | None:
+    """
+        Reads the atlas index of a preset.
+
+        Args:
+            preset (Any): Preset from the PresetRegistry.
+
+        Returns:
+            list[list] | None: Rect per tile or None if there is no up to date atlas.
+    """
+    try:
+        with open(file=get_index_path(preset_name=preset.name),
+                  mode="r",
+                  encoding="utf-8") as index_file:
+            index = json.load(index_file)
+        key = get_key(preset=preset)
+    except (OSError, ValueError):
+        return None
+
+    if index.get("version") != ATLAS_VERSION or index.get("key") != key:
+        return None
+
+    rects = index.get("rects", [])
+    if [rect[0] for rect in rects] != preset.file_names or not os.path.exists(get_atlas_path(preset_name=preset.name)):
+        return None
+
+    return rects
+
+
+def get_image_paths(preset: Any) -> list[str]:
+    """
+        Gets the images needed for the sprites of a preset,
+            its atlas if it is up to date, else all of its tiles.
+
+        Args:
+            preset (Any): Preset from the PresetRegistry.
+
+        Returns:
+            list[str]: Paths of the images.
+    """
+    if read_index(preset=preset) is not None:
+        return [get_atlas_path(preset_name=preset.name)]
+
+    return [os.path.join(preset.path, file_name) for file_name in preset.file_names]
+
+
+def pack(sizes: list[tuple[int, int]]) -> tuple[list[tuple[int, int]], tuple[int, int]]:
+    """
+        Packs rectangles into shelves of at most TILE_ATLAS_MAX_WIDTH wide, tallest first.
+
+        Args:
+            sizes (list[tuple[int, int]]): Width and height per rectangle.
+
+        Returns:
+            tuple[list[tuple[int, int]], tuple[int, int]]: Position per rectangle and the atlas size.
+    """
+    positions: list[tuple[int, int]] = [(0, 0)] * len(sizes)
+    x, y, shelf_height, width = 0, 0, 0, 0
+    for i in sorted(range(len(sizes)), key=lambda i: -sizes[i][1]):
+        w, h = sizes[i]
+        if x > 0 and x + w > TILE_ATLAS_MAX_WIDTH:
+            x, y, shelf_height = 0, y + shelf_height, 0
+        positions[i] = (x, y)
+        x += w
+        width = max(width, x)
+        shelf_height = max(shelf_height, h)
+
+    return positions, (max(1, width), max(1, y + shelf_height))
+
+
+def build_atlas(preset: Any,
+                sprites: list[pygame.Surface]) -> None:
+    """
+        Packs the sprites of a preset into its atlas and writes the atlas and its index.
+        A failed write only means the tiles are loaded one by one again on the next launch.
+
+        Args:
+            preset (Any): Preset from the PresetRegistry.
+            sprites (list[pygame.Surface]): Sprite per file name of the preset,
+                the AssetManager gives identical images the same Surface.
+    """
+    unique_sprites = list({id(sprite): sprite for sprite in sprites}.values())
+    positions, size = pack(sizes=[sprite.get_size() for sprite in unique_sprites])
+    atlas = pygame.Surface(size, pygame.SRCALPHA)
+    atlas.fill((0, 0, 0, 0))
+    sprite_positions = {}
+    for sprite, position in zip(unique_sprites, positions):
+        # Copies the pixels including their alpha instead of blending them onto the empty atlas
+        atlas.blit(sprite, position, special_flags=pygame.BLEND_RGBA_MAX)
+        sprite_positions[id(sprite)] = position
+
+    rects = [[file_name, *sprite_positions[id(sprite)], *sprite.get_size()]
+             for file_name, sprite in zip(preset.file_names, sprites)]
+
+    index = {
+        "version": ATLAS_VERSION,
+        "key": get_key(preset=preset),
+        "rects": rects,
+    }
+    atlas_path = get_atlas_path(preset_name=preset.name)
+    temp_path = f"{atlas_path}.tmp.png"
+    try:
+        os.makedirs(ATLAS_CACHE_DIR, exist_ok=True)
+        pygame.image.save(atlas, temp_path)
+        os.replace(temp_path, atlas_path)
+        map_format.write_file(get_index_path(preset_name=preset.name),
+                              json.dumps(index).encode("utf-8"))
+    except (OSError, pygame.error):
+        pass
+
+
+def get_sprites(preset: Any) -> list[pygame.Surface]:
+    """
+        Gets the sprites of a preset from its atlas, the atlas is rebuilt if it is outdated.
+
+        Args:
+            preset (Any): Preset from the PresetRegistry.
+
+        Returns:
+            list[pygame.Surface]: Sprite per file name of the preset.
+    """
+    rects = read_index(preset=preset)
+    if rects is not None:
+        try:
+            atlas = assets.load(get_atlas_path(preset_name=preset.name))
+            # Identical tiles share a rect, and tiles identical to those of other presets a Surface
+            subsurfaces = {}
+            for rect in rects:
+                area = tuple(rect[1:])
+                if area not in subsurfaces:
+                    subsurfaces[area] = assets.dedupe(surface=atlas.subsurface(area))
+            return [subsurfaces[tuple(rect[1:])] for rect in rects]
+        except (OSError, ValueError, pygame.error):
+            pass
+
+    sprites = [assets.load(os.path.join(preset.path, file_name)) for file_name in preset.file_names]
+    if sprites:
+        build_atlas(preset=preset,
+                    sprites=sprites)
+
+    return sprites
@@ -0,0 +1,610 @@
+"""
+Storage backends for world_data, the tile indexes of the map.
+All backends are indexed with [row, column] and provide the same methods,
+    so the Editor, the menus and the save/load path do not depend on the storage.
+
+    DenseWorldData: a 2d Numpy array of WORLD_DATA_DTYPE.
+    SparseWorldData: a block map where blocks of WORLD_DATA_BLOCK_SIZE x WORLD_DATA_BLOCK_SIZE
+        cells are only allocated once a tile is placed in them.
+    InfiniteWorldData: a block map without a size, used by infinite canvas maps.
+
+None of the functions depend on pygame.
+"""
+
+from typing import Tuple
+
+import numpy as np
+
+from settings.setup import EMPTY_TILE, WORLD_DATA_DTYPE, WORLD_DATA_BACKEND, WORLD_DATA_BLOCK_SIZE
+
+
+class DenseWorldData:
+    """
+        Stores every cell of the map in a 2d Numpy array.
+        The array may be a copy-on-write np.memmap of a map file, changes are then kept in memory
+            and only reach the file when the map is saved.
+
+        Args:
+            data (np.ndarray): 2d array of tile indexes, -1 for empty cells.
+
+        Returns:
+            Self.
+    """
+    backend = "dense"
+
+    def __init__(self,
+                 data: np.ndarray):
+        self.data = data
+
+        # Increases on every change so observers can detect edits
+        self.revision = 0
+
+    def __repr__(self) -> str:
+        return f"DenseWorldData(shape={self.shape}, dtype={self.dtype})"
+
+    @property
+    def shape(self) -> Tuple[int, int]:
+        return self.data.shape
+
+    @property
+    def dtype(self) -> np.dtype:
+        return self.data.dtype
+
+    @property
+    def nbytes(self) -> int:
+        return self.data.nbytes
+
+    def __getitem__(self,
+                    key: Tuple[int, int]) -> int:
+        return self.data[key]
+
+    def __setitem__(self,
+                    key: Tuple[int, int],
+                    value: int) -> None:
+        self.data[key] = value
+        self.revision += 1
+
+    def region(self,
+               row_start: int,
+               row_stop: int,
+               col_start: int,
+               col_stop: int) -> np.ndarray:
+        """
+            Gets the tiles of a rectangular area, clipped to the map.
+
+            Args:
+                row_start (int): First row.
+                row_stop (int): Row after the last row.
+                col_start (int): First column.
+                col_stop (int): Column after the last column.
+
+            Returns:
+                np.ndarray: 2d array of tile indexes (a view, do not modify).
+        """
+        return self.data[max(row_start, 0):max(row_stop, 0), max(col_start, 0):max(col_stop, 0)]
+
+    def to_array(self) -> np.ndarray:
+        """
+            Gets all tiles as a 2d Numpy array.
+
+            Returns:
+                np.ndarray: 2d array of tile indexes.
+        """
+        return self.data
+
+    def resized(self,
+                rows: int,
+                columns: int) -> "DenseWorldData":
+        """
+            Gets a copy with the given number of rows and columns.
+            New cells are empty, cells outside the new size are dropped.
+
+            Args:
+                rows (int): Number of rows.
+                columns (int): Number of columns.
+
+            Returns:
+                DenseWorldData: Resized copy.
+        """
+        data = get_empty_array(rows=rows,
+                               columns=columns)
+        keep_rows = min(rows, self.shape[0])
+        keep_cols = min(columns, self.shape[1])
+        data[:keep_rows, :keep_cols] = self.data[:keep_rows, :keep_cols]
+
+        return DenseWorldData(data=data)
+
+    def copy(self) -> "DenseWorldData":
+        return DenseWorldData(data=np.array(self.data))
+
+    @property
+    def is_memmap(self) -> bool:
+        return isinstance(self.data, np.memmap)
+
+
+class InfiniteWorldData:
+    """
+        Stores the map as a block map without a size: a dict of small 2d Numpy arrays keyed by
+            (block_row, block_col), where block coordinates may be negative.
+        Blocks are allocated when a tile is placed and released when they become empty,
+            so scrolling in any direction only allocates blocks once tiles are placed there.
+
+        Returns:
+            Self.
+    """
+    backend = "infinite"
+
+    def __init__(self):
+        self.BLOCK_SIZE = WORLD_DATA_BLOCK_SIZE
+
+        self.blocks: dict[Tuple[int, int], np.ndarray] = {}
+
+        # Increases on every change so observers can detect edits
+        self.revision = 0
+
+        # (revision, bounds) of the last get_bounds call
+        self.bounds_cache: Tuple[int, Tuple[int, int, int, int] | None] = (-1, None)
+
+    def __repr__(self) -> str:
+        return f"InfiniteWorldData(bounds={self.get_bounds()}, blocks={len(self.blocks)})"
+
+    @property
+    def shape(self) -> Tuple[int, int]:
+        bounds = self.get_bounds()
+        if bounds is None:
+            return 0, 0
+
+        row_start, row_stop, col_start, col_stop = bounds
+        return row_stop - row_start, col_stop - col_start
+
+    @property
+    def dtype(self) -> np.dtype:
+        return np.dtype(WORLD_DATA_DTYPE)
+
+    @property
+    def nbytes(self) -> int:
+        return sum(block.nbytes for block in self.blocks.values())
+
+    def get_cell(self,
+                 key: Tuple[int, int]) -> Tuple[int, int]:
+        """
+            Gets the row and column of a [row, column] key.
+            Every cell exists, negative indexes are cells left of or above the origin.
+
+            Args:
+                key (Tuple[int, int]): Row and column.
+
+            Returns:
+                Tuple[int, int]: Row and column.
+        """
+        row, col = key
+        return int(row), int(col)
+
+    def __getitem__(self,
+                    key: Tuple[int, int]) -> int:
+        row, col = self.get_cell(key=key)
+        block = self.blocks.get((row // self.BLOCK_SIZE, col // self.BLOCK_SIZE))
+        if block is None:
+            return EMPTY_TILE
+
+        return block[row % self.BLOCK_SIZE, col % self.BLOCK_SIZE]
+
+    def __setitem__(self,
+                    key: Tuple[int, int],
+                    value: int) -> None:
+        row, col = self.get_cell(key=key)
+        block_key = (row // self.BLOCK_SIZE, col // self.BLOCK_SIZE)
+        block = self.blocks.get(block_key)
+
+        if block is None:
+            if value == EMPTY_TILE:
+                return
+            block = get_empty_array(rows=self.BLOCK_SIZE,
+                                    columns=self.BLOCK_SIZE)
+            self.blocks[block_key] = block
+
+        block[row % self.BLOCK_SIZE, col % self.BLOCK_SIZE] = value
+        if value == EMPTY_TILE and not np.any(block != EMPTY_TILE):
+            del self.blocks[block_key]
+
+        self.revision += 1
+
+    def get_bounds(self) -> Tuple[int, int, int, int] | None:
+        """
+            Gets the smallest area holding all placed tiles.
+            The result is cached until the next change.
+
+            Returns:
+                Tuple[int, int, int, int] | None: row_start, row_stop, col_start and col_stop,
+                    None if no tiles are placed.
+        """
+        revision, bounds = self.bounds_cache
+        if revision == self.revision:
+            return bounds
+
+        bounds = None
+        if self.blocks:
+            size = self.BLOCK_SIZE
+            first_row = min(block_row for block_row, _ in self.blocks)
+            last_row = max(block_row for block_row, _ in self.blocks)
+            first_col = min(block_col for _, block_col in self.blocks)
+            last_col = max(block_col for _, block_col in self.blocks)
+
+            # Only the outer blocks decide the exact bounds
+            row_start = row_stop = col_start = col_stop = None
+            for (block_row, block_col), block in self.blocks.items():
+                used_rows = np.any(block != EMPTY_TILE, axis=1)
+                used_cols = np.any(block != EMPTY_TILE, axis=0)
+                if block_row == first_row:
+                    start = block_row * size + int(np.argmax(used_rows))
+                    row_start = start if row_start is None else min(row_start, start)
+                if block_row == last_row:
+                    stop = (block_row + 1) * size - int(np.argmax(used_rows[::-1]))
+                    row_stop = stop if row_stop is None else max(row_stop, stop)
+                if block_col == first_col:
+                    start = block_col * size + int(np.argmax(used_cols))
+                    col_start = start if col_start is None else min(col_start, start)
+                if block_col == last_col:
+                    stop = (block_col + 1) * size - int(np.argmax(used_cols[::-1]))
+                    col_stop = stop if col_stop is None else max(col_stop, stop)
+
+            bounds = (row_start, row_stop, col_start, col_stop)
+
+        self.bounds_cache = (self.revision, bounds)
+
+        return bounds
+
+    def has_tiles(self,
+                  row_start: int,
+                  row_stop: int,
+                  col_start: int,
+                  col_stop: int) -> bool:
+        """
+            Checks if any block overlapping a rectangular area is allocated.
+
+            Args:
+                row_start (int): First row.
+                row_stop (int): Row after the last row.
+                col_start (int): First column.
+                col_stop (int): Column after the last column.
+
+            Returns:
+                bool: True if the area may hold tiles, False if it certainly does not.
+        """
+        size = self.BLOCK_SIZE
+        for block_row in range(row_start // size, (row_stop - 1) // size + 1):
+            for block_col in range(col_start // size, (col_stop - 1) // size + 1):
+                if (block_row, block_col) in self.blocks:
+                    return True
+
+        return False
+
+    def region(self,
+               row_start: int,
+               row_stop: int,
+               col_start: int,
+               col_stop: int) -> np.ndarray:
+        """
+            Gets the tiles of a rectangular area.
+
+            Args:
+                row_start (int): First row.
+                row_stop (int): Row after the last row.
+                col_start (int): First column.
+                col_stop (int): Column after the last column.
+
+            Returns:
+                np.ndarray: 2d array of tile indexes.
+        """
+        area = get_empty_array(rows=max(row_stop - row_start, 0),
+                               columns=max(col_stop - col_start, 0))
+        if area.size == 0:
+            return area
+
+        size = self.BLOCK_SIZE
+        for block_row in range(row_start // size, (row_stop - 1) // size + 1):
+            for block_col in range(col_start // size, (col_stop - 1) // size + 1):
+                block = self.blocks.get((block_row, block_col))
+                if block is None:
+                    continue
+
+                # Overlap of the block and the area in map coordinates
+                top = max(row_start, block_row * size)
+                bottom = min(row_stop, (block_row + 1) * size)
+                left = max(col_start, block_col * size)
+                right = min(col_stop, (block_col + 1) * size)
+
+                area[top - row_start:bottom - row_start, left - col_start:right - col_start] = \
+                    block[top - block_row * size:bottom - block_row * size,
+                          left - block_col * size:right - block_col * size]
+
+        return area
+
+    def to_array(self) -> np.ndarray:
+        """
+            Gets the smallest area holding all placed tiles as a 2d Numpy array.
+
+            Returns:
+                np.ndarray: 2d array of tile indexes.
+        """
+        bounds = self.get_bounds()
+        if bounds is None:
+            return get_empty_array(rows=0,
+                                   columns=0)
+
+        return self.region(*bounds)
+
+    def cropped(self) -> "InfiniteWorldData":
+        """
+            Gets a copy without blocks that hold no tiles.
+
+            Returns:
+                InfiniteWorldData: Cropped copy.
+        """
+        cropped = self.copy()
+        cropped.blocks = {key: block for key, block in cropped.blocks.items()
+                          if np.any(block != EMPTY_TILE)}
+
+        return cropped
+
+    def copy(self) -> "InfiniteWorldData":
+        copied = InfiniteWorldData()
+        copied.blocks = {key: block.copy() for key, block in self.blocks.items()}
+
+        return copied
+
+    def get_save_data(self) -> dict:
+        """
+            Gets the populated blocks.
+
+            Returns:
+                dict: Backend, block size and blocks.
+        """
+        return {
+            "backend": self.backend,
+            "block_size": self.BLOCK_SIZE,
+            "blocks": {key: block.copy() for key, block in self.blocks.items()
+                       if np.any(block != EMPTY_TILE)},
+        }
+
+
+class SparseWorldData(InfiniteWorldData):
+    """
+        Stores a map of a fixed size as a block map.
+        Blocks of WORLD_DATA_BLOCK_SIZE x WORLD_DATA_BLOCK_SIZE cells are allocated
+            when a tile is placed and released when they become empty,
+            so mostly empty maps only use memory for the areas that hold tiles.
+
+        Args:
+            rows (int): Number of rows.
+            columns (int): Number of columns.
+
+        Returns:
+            Self.
+    """
+    backend = "sparse"
+
+    def __init__(self,
+                 rows: int,
+                 columns: int):
+        super().__init__()
+        self.rows = rows
+        self.columns = columns
+
+    def __repr__(self) -> str:
+        return f"SparseWorldData(shape={self.shape}, blocks={len(self.blocks)})"
+
+    @property
+    def shape(self) -> Tuple[int, int]:
+        return self.rows, self.columns
+
+    def get_cell(self,
+                 key: Tuple[int, int]) -> Tuple[int, int]:
+        """
+            Checks a [row, column] key the same way Numpy does and
+                converts negative indexes.
+
+            Args:
+                key (Tuple[int, int]): Row and column.
+
+            Returns:
+                Tuple[int, int]: Row and column within the map.
+        """
+        row, col = key
+        if not -self.rows <= row < self.rows or not -self.columns <= col < self.columns:
+            raise IndexError(f"index ({row}, {col}) is out of bounds for shape {self.shape}")
+
+        return int(row) % self.rows, int(col) % self.columns
+
+    def region(self,
+               row_start: int,
+               row_stop: int,
+               col_start: int,
+               col_stop: int) -> np.ndarray:
+        """
+            Gets the tiles of a rectangular area, clipped to the map.
+
+            Args:
+                row_start (int): First row.
+                row_stop (int): Row after the last row.
+                col_start (int): First column.
+                col_stop (int): Column after the last column.
+
+            Returns:
+                np.ndarray: 2d array of tile indexes.
+        """
+        row_start, row_stop = max(row_start, 0), min(max(row_stop, 0), self.rows)
+        col_start, col_stop = max(col_start, 0), min(max(col_stop, 0), self.columns)
+
+        return super().region(row_start=row_start,
+                              row_stop=max(row_start, row_stop),
+                              col_start=col_start,
+                              col_stop=max(col_start, col_stop))
+
+    def to_array(self) -> np.ndarray:
+        """
+            Gets all tiles as a 2d Numpy array.
+
+            Returns:
+                np.ndarray: 2d array of tile indexes.
+        """
+        return self.region(row_start=0,
+                           row_stop=self.rows,
+                           col_start=0,
+                           col_stop=self.columns)
+
+    def resized(self,
+                rows: int,
+                columns: int) -> "SparseWorldData":
+        """
+            Gets a copy with the given number of rows and columns.
+            New cells are empty, cells outside the new size are dropped.
+
+            Args:
+                rows (int): Number of rows.
+                columns (int): Number of columns.
+
+            Returns:
+                SparseWorldData: Resized copy.
+        """
+        resized = SparseWorldData(rows=rows,
+                                  columns=columns)
+        size = self.BLOCK_SIZE
+        for (block_row, block_col), block in self.blocks.items():
+            block = block[:max(rows - block_row * size, 0), :max(columns - block_col * size, 0)]
+            if np.any(block != EMPTY_TILE):
+                new_block = get_empty_array(rows=size,
+                                            columns=size)
+                new_block[:block.shape[0], :block.shape[1]] = block
+                resized.blocks[(block_row, block_col)] = new_block
+
+        return resized
+
+    def copy(self) -> "SparseWorldData":
+        copied = SparseWorldData(rows=self.rows,
+                                 columns=self.columns)
+        copied.blocks = {key: block.copy() for key, block in self.blocks.items()}
+
+        return copied
+
+
+def get_empty_array(rows: int,
+                    columns: int) -> np.ndarray:
+    """
+        Gets a Numpy 2d array of size rows * columns where each item is -1.
+
+        Args:
+            rows (int): Number of rows.
+            columns (int): Number of columns.
+
+        Returns:
+            np.ndarray: 2d array of WORLD_DATA_DTYPE.
+    """
+    return np.full((rows, columns), EMPTY_TILE, dtype=WORLD_DATA_DTYPE)
+
+
+def get_world_data(rows: int,
+                   columns: int,
+                   backend: str = WORLD_DATA_BACKEND) -> DenseWorldData | SparseWorldData | InfiniteWorldData:
+    """
+        Gets an empty world_data of the given size and backend.
+
+        Args:
+            rows (int): Number of rows, ignored by the 'infinite' backend.
+            columns (int): Number of columns, ignored by the 'infinite' backend.
+            backend (str): 'dense', 'sparse' or 'infinite'.
+
+        Returns:
+            DenseWorldData | SparseWorldData | InfiniteWorldData: Empty world_data.
+    """
+    match backend:
+        case "dense":
+            return DenseWorldData(data=get_empty_array(rows=rows,
+                                                       columns=columns))
+        case "sparse":
+            return SparseWorldData(rows=rows,
+                                   columns=columns)
+        case "infinite":
+            return InfiniteWorldData()
+
+    raise ValueError(f"Unknown world_data backend '{backend}'.")
+
+
+def get_compact_array(array: np.ndarray) -> np.ndarray:
+    """
+        Converts a 2d array of tile indexes to WORLD_DATA_DTYPE.
+        Maps saved before world_data was compacted hold int32 or int64 arrays.
+
+        Args:
+            array (np.ndarray): 2d array of tile indexes.
+
+        Returns:
+            np.ndarray: 2d array of WORLD_DATA_DTYPE.
+    """
+    array = np.asarray(array)
+    if array.dtype == WORLD_DATA_DTYPE:
+        return array
+
+    limits = np.iinfo(WORLD_DATA_DTYPE)
+    if array.size and (array.min() < limits.min or array.max() > limits.max):
+        raise ValueError(f"Tile indexes do not fit in {WORLD_DATA_DTYPE}.")
+
+    return array.astype(WORLD_DATA_DTYPE)
+
+
+def from_array(array: np.ndarray,
+               backend: str = WORLD_DATA_BACKEND) -> DenseWorldData | SparseWorldData | InfiniteWorldData:
+    """
+        Gets a world_data of the given backend holding the tiles of a 2d array.
+        The 'infinite' backend places the first item of the array at the origin.
+
+        Args:
+            array (np.ndarray): 2d array of tile indexes.
+            backend (str): 'dense', 'sparse' or 'infinite'.
+
+        Returns:
+            DenseWorldData | SparseWorldData | InfiniteWorldData: world_data holding the tiles.
+    """
+    array = get_compact_array(array=array)
+    rows, columns = array.shape
+
+    if backend == "dense":
+        return DenseWorldData(data=array)
+
+    world_data = get_world_data(rows=rows,
+                                columns=columns,
+                                backend=backend)
+    size = world_data.BLOCK_SIZE
+    for block_row in range(0, rows, size):
+        for block_col in range(0, columns, size):
+            block = array[block_row:block_row + size, block_col:block_col + size]
+            if np.any(block != EMPTY_TILE):
+                new_block = get_empty_array(rows=size,
+                                            columns=size)
+                new_block[:block.shape[0], :block.shape[1]] = block
+                world_data.blocks[(block_row // size, block_col // size)] = new_block
+
+    return world_data
+
+
+def from_save_data(save_data: np.ndarray | dict) -> DenseWorldData | SparseWorldData | InfiniteWorldData:
+    """
+        Gets a world_data from saved tiles.
+        Maps of a fixed size are saved as a 2d array and use the WORLD_DATA_BACKEND storage,
+            infinite canvas maps are saved as a dict of blocks (see InfiniteWorldData.get_save_data).
+
+        Args:
+            save_data (np.ndarray | dict): Saved tiles.
+
+        Returns:
+            DenseWorldData | SparseWorldData | InfiniteWorldData: world_data holding the tiles.
+    """
+    if not isinstance(save_data, dict):
+        return from_array(array=save_data)
+
+    world_data = InfiniteWorldData()
+    world_data.BLOCK_SIZE = save_data["block_size"]
+    world_data.blocks = {(int(block_row), int(block_col)): get_compact_array(array=block)
+                         for (block_row, block_col), block in save_data["blocks"].items()}
+
+    return world_data